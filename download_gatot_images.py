@@ -1,21 +1,36 @@
 # download_gatot_images.py
 # 사용법:
-#   pip install requests beautifulsoup4
+#   pip install requests
 #   python download_gatot_images.py --url "https://www.whiteoutsurvival.wiki/heroes/gatot/" --out "./gatot_imgs"
 # 옵션:
 #   --filter "gatot"   : URL에 포함된 문자열로 필터(기본 gatot)
 #   --no-filter        : 필터 없이 페이지 내 모든 이미지 다운로드
 #   --include-icons    : 작은 아이콘/스프라이트까지 포함(기본은 너무 작은 건 제외)
 #   --min-width 80     : URL에 width/size가 없으면 최소폭 추정 필터(보수적으로 적용)
+#
+# 페이지는 통째로 받지 않고 64KB 씩 읽으면서 html.parser 토크나이저로 훑는다 (DOM 안 만듦).
+# 이미지 URL 이 나오는 즉시 다운로드를 시작하므로 큰 페이지도 첫 다운로드가 빠르고 메모리가 거의 안 든다.
+# 페이지 소켓은 별도 스레드가 끝까지 읽어서 큐에 쌓는다 (다운로드/--sleep 동안 소켓이 놀다가 끊기지 않게).
+# 페이지 스트림이 중간에 끊기면 거기까지 찾은 이미지만 받고 [PARTIAL] 로 알려준다.
 
 import argparse
+import codecs
 import os
 import re
+import sys
+import itertools
 import time
+import queue
+import threading
+from html.parser import HTMLParser
+from typing import Iterable, Iterator
 from urllib.parse import urljoin, urlparse, unquote
 
 import requests
-from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from http_client import make_session  # noqa: E402
+from run_metrics import METRICS, add_metrics_args, instrumented  # noqa: E402
 
 
 def sanitize_filename(name: str) -> str:
@@ -58,65 +73,167 @@ def pick_best_from_srcset(srcset: str) -> str | None:
     return candidates[0][1]
 
 
-def extract_image_urls(page_url: str, html: str, *, use_filter: bool, filter_text: str, include_icons: bool) -> list[str]:
-    soup = BeautifulSoup(html, "html.parser")
-    urls: set[str] = set()
+IMAGE_HREF_RE = re.compile(r"\.(png|jpe?g|webp|gif|svg)(\?.*)?$", re.IGNORECASE)
+BG_IMAGE_RE = re.compile(r"background-image\s*:\s*url\(([^)]+)\)", re.IGNORECASE)
 
-    def add(u: str | None):
-        if not u:
-            return
-        u = u.strip()
-        if not u:
-            return
-        abs_u = urljoin(page_url, u)
-        urls.add(abs_u)
-
-    # 1) <img src=...> / <img data-src=...> / <img srcset=...>
-    for img in soup.find_all("img"):
-        src = img.get("src") or img.get("data-src") or img.get("data-lazy-src")
-        srcset = img.get("srcset") or img.get("data-srcset")
-        best = pick_best_from_srcset(srcset) if srcset else None
-        add(best or src)
-
-    # 2) a href가 이미지로 끝나는 경우도 포함
-    for a in soup.find_all("a"):
-        href = a.get("href")
-        if href and re.search(r"\.(png|jpe?g|webp|gif|svg)(\?.*)?$", href, re.IGNORECASE):
-            add(href)
-
-    # 3) style background-image: url(...)
-    for tag in soup.find_all(style=True):
-        style = tag.get("style") or ""
-        for m in re.finditer(r"background-image\s*:\s*url\(([^)]+)\)", style, re.IGNORECASE):
-            raw = m.group(1).strip().strip("'\"")
-            add(raw)
 
+class ImageUrlScanner(HTMLParser):
+    """
+    시작 태그 이벤트만 보고 이미지 URL 후보를 모은다 (트리 없음, feed() 로 조각씩 넣어도 됨).
+    태그/속성 해석은 BeautifulSoup(html, "html.parser") 와 같은 토크나이저라 찾는 URL 도 같다.
+      1) <img src / data-src / data-lazy-src>, srcset / data-srcset 이 있으면 제일 큰 것
+      2) <a href> 가 이미지 확장자로 끝나는 경우
+      3) 아무 태그의 style="background-image: url(...)"
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.found: list[str] = []   # 아직 안 가져간 후보 (문서 순서)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        a = {k: (v or "") for k, v in attrs}   # 중복 속성은 bs4 처럼 뒤엣것
+        if tag == "img":
+            src = a.get("src") or a.get("data-src") or a.get("data-lazy-src")
+            srcset = a.get("srcset") or a.get("data-srcset")
+            best = pick_best_from_srcset(srcset) if srcset else None
+            if best or src:
+                self.found.append(best or src)
+        elif tag == "a":
+            href = a.get("href")
+            if href and IMAGE_HREF_RE.search(href):
+                self.found.append(href)
+
+        style = a.get("style")
+        if style:
+            for m in BG_IMAGE_RE.finditer(style):
+                self.found.append(m.group(1).strip().strip("'\""))
+
+    def take(self) -> list[str]:
+        out, self.found = self.found, []
+        return out
+
+
+def keep_image_url(u: str, *, use_filter: bool, filter_text: str, include_icons: bool) -> bool:
+    u_low = u.lower()
     # 필터 적용(기본: gatot 들어간 것만)
-    out = []
-    for u in urls:
-        u_low = u.lower()
-        if use_filter and filter_text:
-            if filter_text.lower() not in u_low:
+    if use_filter and filter_text:
+        if filter_text.lower() not in u_low:
+            return False
+
+    # 아이콘/스프라이트 대량 방지(원하면 include_icons로 해제)
+    if not include_icons:
+        # 흔한 아이콘 경로 키워드들
+        if any(k in u_low for k in ["sprite", "icon", "favicon", "logo", "emoji"]):
+            return False
+        # svg는 대부분 아이콘일 확률 높아서 제외
+        if u_low.endswith(".svg"):
+            return False
+
+    # 데이터 URI 제외
+    if u_low.startswith("data:"):
+        return False
+    return True
+
+
+def iter_image_urls(page_url: str, chunks: Iterable[str], *, use_filter: bool, filter_text: str,
+                    include_icons: bool) -> Iterator[str]:
+    """HTML 조각을 받는 대로 훑어서 필터를 통과한 절대 URL 을 처음 나온 순서대로 (중복 없이) 내보낸다"""
+    scanner = ImageUrlScanner()
+    seen: set[str] = set()
+
+    def drain() -> Iterator[str]:
+        for u in scanner.take():
+            u = u.strip()
+            if not u:
                 continue
-
-        # 아이콘/스프라이트 대량 방지(원하면 include_icons로 해제)
-        if not include_icons:
-            # 흔한 아이콘 경로 키워드들
-            if any(k in u_low for k in ["sprite", "icon", "favicon", "logo", "emoji"]):
+            abs_u = urljoin(page_url, u)
+            if abs_u in seen:
                 continue
-            # svg는 대부분 아이콘일 확률 높아서 제외
-            if u_low.endswith(".svg"):
+            seen.add(abs_u)
+            METRICS.count("urls_found")
+            if not keep_image_url(abs_u, use_filter=use_filter, filter_text=filter_text, include_icons=include_icons):
+                METRICS.count("urls_filtered")
                 continue
+            yield abs_u
 
-        # 데이터 URI 제외
-        if u_low.startswith("data:"):
-            continue
+    for chunk in chunks:
+        with METRICS.span("extract_urls"):
+            scanner.feed(chunk)
+        yield from drain()
+    scanner.close()
+    yield from drain()
+
+
+def extract_image_urls(page_url: str, html: str, *, use_filter: bool, filter_text: str, include_icons: bool) -> list[str]:
+    """HTML 문자열 전체에서 한 번에 (보기 좋게 정렬해서)"""
+    return sorted(iter_image_urls(page_url, [html], use_filter=use_filter, filter_text=filter_text,
+                                  include_icons=include_icons))
 
-        out.append(u)
 
-    # 보기 좋게 정렬
-    out.sort()
-    return out
+def iter_response_text(res: requests.Response, chunk_size: int = 1024 * 64) -> Iterator[str]:
+    """
+    응답 바디를 조각 단위로 디코딩 (res.text 와 같은 인코딩 규칙)
+    헤더에 charset 이 없으면 res.apparent_encoding 과 같은 감지기로 정함.
+    (apparent_encoding 은 바디 전체를 읽어버리므로 첫 조각으로 감지)
+    """
+    chunks = (raw for raw in res.iter_content(chunk_size=chunk_size) if raw)
+    head = b""
+    encoding = res.encoding
+    if encoding is None:
+        head = next(chunks, b"")
+        chardet = requests.compat.chardet
+        if head and chardet is not None:
+            encoding = chardet.detect(head)["encoding"]
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    for raw in itertools.chain((head,) if head else (), chunks):
+        METRICS.count("http_bytes", len(raw))
+        text = decoder.decode(raw)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+class PageReader:
+    """
+    페이지 바디를 백그라운드 스레드에서 끝까지 읽어 큐에 넣는다.
+    소비 쪽(이미지 다운로드 + sleep)이 느려도 페이지 소켓은 계속 비워지고,
+    읽다가 끊기면(requests.RequestException) error 에 남기고 거기까지만 내보낸다.
+    """
+
+    _END = object()
+
+    def __init__(self, chunks: Iterable[str]):
+        self.error: Exception | None = None
+        self.chars = 0
+        self._q: "queue.Queue[object]" = queue.Queue()
+        self._t = threading.Thread(target=self._pump, args=(chunks,), daemon=True)
+        self._t.start()
+
+    def _pump(self, chunks: Iterable[str]) -> None:
+        try:
+            for chunk in chunks:
+                self._q.put(chunk)
+        except requests.RequestException as e:
+            self.error = e
+        finally:
+            self._q.put(self._END)
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            item = self._q.get()
+            if item is self._END:
+                return
+            self.chars += len(item)  # type: ignore[arg-type]
+            yield item  # type: ignore[misc]
+
+    def join(self) -> None:
+        self._t.join()
 
 
 def guess_ext_from_url(u: str) -> str:
@@ -144,14 +261,18 @@ def download_file(session: requests.Session, url: str, out_dir: str, idx: int) -
             root, e = os.path.splitext(base)
             path = os.path.join(out_dir, f"{root}_{idx}{e}")
 
+        size = 0
         with open(path, "wb") as f:
             for chunk in r.iter_content(chunk_size=1024 * 64):
                 if chunk:
                     f.write(chunk)
+                    size += len(chunk)
+        METRICS.count("http_bytes", size)
 
         return path
     except Exception as e:
         print(f"[FAIL] {url} -> {e}")
+        METRICS.count("download_failures")
         return None
 
 
@@ -164,55 +285,73 @@ def main():
     ap.add_argument("--include-icons", action="store_true", help="아이콘/스프라이트도 포함")
     ap.add_argument("--min-width", type=int, default=0, help="(보수적) 너무 작은 이미지 제외용 힌트(기본 0=미사용)")
     ap.add_argument("--sleep", type=float, default=0.2, help="다운로드 사이 딜레이(초)")
+    add_metrics_args(ap)
     args = ap.parse_args()
 
-    os.makedirs(args.out, exist_ok=True)
+    with instrumented("download_images", args):
+        run(args)
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; ImageDownloader/1.0; +local-script)"
-    }
 
-    with requests.Session() as s:
-        s.headers.update(headers)
+def run(args) -> None:
+    os.makedirs(args.out, exist_ok=True)
+
+    with make_session() as s:
 
         print(f"[GET] {args.url}")
-        res = s.get(args.url, timeout=30)
-        res.raise_for_status()
+        t0 = time.perf_counter()
+        try:
+            with METRICS.span("fetch_page"):
+                res = s.get(args.url, timeout=30, stream=True)
+                res.raise_for_status()
+        except requests.RequestException as e:
+            print(f"❌ 페이지를 못 받음: {args.url} -> {e}")
+            sys.exit(1)
 
         use_filter = not args.no_filter
-        urls = extract_image_urls(
+        page = PageReader(iter_response_text(res))
+        urls = iter_image_urls(
             args.url,
-            res.text,
+            page,
             use_filter=use_filter,
             filter_text=args.filter,
             include_icons=args.include_icons,
         )
 
-        # min-width 힌트는 URL에 w=xxx, width=xxx 같은 파라미터 있을 때만 적용(없으면 패스)
-        if args.min_width and args.min_width > 0:
-            filtered = []
+        # 페이지를 다 받기 전에 찾은 순서대로 바로 다운로드
+        n = 0
+        ok = 0
+        with res:
             for u in urls:
-                q = urlparse(u).query.lower()
-                m = re.search(r"(?:w|width|size)=(\d+)", q)
-                if m:
-                    if int(m.group(1)) < args.min_width:
+                # min-width 힌트는 URL에 w=xxx, width=xxx 같은 파라미터 있을 때만 적용(없으면 패스)
+                if args.min_width and args.min_width > 0:
+                    q = urlparse(u).query.lower()
+                    m = re.search(r"(?:w|width|size)=(\d+)", q)
+                    if m and int(m.group(1)) < args.min_width:
                         continue
-                filtered.append(u)
-            urls = filtered
 
-        if not urls:
+                n += 1
+                if n == 1:
+                    METRICS.observe("first_download_start", time.perf_counter() - t0)
+                with METRICS.span("download", url=u):
+                    path = download_file(s, u, args.out, n)
+                if path:
+                    ok += 1
+                    print(f"[OK] ({ok}/{n}) {path}")
+                with METRICS.span("sleep"):
+                    time.sleep(max(0.0, args.sleep))
+            page.join()
+
+        if page.error is not None:
+            METRICS.count("page_stream_errors")
+            print(f"⚠ [PARTIAL] 페이지가 {page.chars:,}자 받은 뒤 끊김 -> {page.error}")
+            print(f"[PARTIAL] 끊기기 전까지 찾은 {n} images 중 {ok} 개 저장: {os.path.abspath(args.out)}")
+            sys.exit(2)
+
+        if not n:
             print("[INFO] 다운로드할 이미지가 없음. (필터 조건이 너무 강할 수 있음)")
             return
 
-        print(f"[FOUND] {len(urls)} images")
-        ok = 0
-        for i, u in enumerate(urls, 1):
-            path = download_file(s, u, args.out, i)
-            if path:
-                ok += 1
-                print(f"[OK] ({ok}/{len(urls)}) {path}")
-            time.sleep(max(0.0, args.sleep))
-
+        print(f"[FOUND] {n} images")
         print(f"[DONE] saved {ok} files to: {os.path.abspath(args.out)}")
 
 
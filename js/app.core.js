@@ -142,6 +142,10 @@
     if (window.__WOS_FETCH_PATCHED__) return;
     window.__WOS_FETCH_PATCHED__ = true;
 
+    // 루트 배포(WOS_BASE == "")면 withRes(path) === path → 훅은 URL 파싱 비용만 듦
+    // (data/**/*.json 의 경로는 빌드에서 "/assets/..." 로 정규화: scripts/canonicalize_asset_paths.py)
+    if (!WOS_BASE) return;
+
     const origFetch = window.fetch ? window.fetch.bind(window) : null;
     if (!origFetch) return;
 
@@ -431,9 +435,31 @@
   // =========================
   // 5) DOM resource rewrite
   // =========================
+  // 루트 배포에서 rewriteDomResources 가 볼 대상: src/href/poster 가 상대 리소스 경로인 노드만
+  const REL_RES_SELECTOR = ["src", "href", "poster"]
+    .flatMap((attr) =>
+      ["assets/", "data/", "i18n/", "./assets/", "./data/", "./i18n/"].map((p) => `[${attr}^="${p}"]`)
+    )
+    .join(",");
+
   function rewriteDomResources(root) {
     try {
       const el = root || document;
+
+      // 루트 배포: "/assets|/data|/i18n" 절대경로와 style url(...) 은 그대로 맞음
+      // → "assets/.." 같은 상대경로만 찾아서 보정
+      if (!WOS_BASE) {
+        el.querySelectorAll(REL_RES_SELECTOR).forEach((node) => {
+          ["src", "href", "poster"].forEach((attr) => {
+            const v = node.getAttribute(attr);
+            if (v && /^(\.\/)?(assets|data|i18n)\//.test(v)) {
+              node.setAttribute(attr, withRes("/" + v.replace(/^\.?\//, "")));
+            }
+          });
+        });
+        return;
+      }
+
       const selector = [
         "img[src]",
         "script[src]",
@@ -828,6 +854,9 @@
       supported: ["en", "ko", "ja"],
       basePath,
       files: ["common.json", "buildings.json", "heroes.json", "calc.json"],
+      // ✅ scripts/build_i18n_packs.py 결과가 있으면 라우트 팩 1개만 받음 (없으면 files 합치기)
+      packs: "packs/manifest.json",
+      route: getPath(),
     });
 
     // UI 바인딩
@@ -848,6 +877,16 @@
     return { ok: true, lang: finalLang };
   }
 
+  // 라우트 이동 시 그 라우트 i18n 팩 추가 로드 (팩 모드가 아니면 아무것도 안 함)
+  async function useI18nRoute(path) {
+    if (!window.WOS_I18N || typeof window.WOS_I18N.useRoute !== "function") return false;
+    try {
+      return await window.WOS_I18N.useRoute(path || getPath());
+    } catch (_) {
+      return false;
+    }
+  }
+
   // =========================
   // 9) Minimal Styles
   // =========================
@@ -1265,6 +1304,7 @@
     tEnum,
     applyI18n,
     initI18n,
+    useI18nRoute,
     bindLangUIOnce,
     getLangSafe,
     getLocalizedField,
@@ -1265,6 +1265,9 @@
     let path = CORE.getPath();
     if (path.length > 1 && path.endsWith("/")) path = path.slice(0, -1);
 
+    // ✅ 라우트 i18n 팩 (이미 받은 팩이면 바로 통과)
+    await CORE.useI18nRoute(path);
+
     // buildings
     if (path.startsWith("/buildings/") && path.split("/").length >= 3) {
       let slug = path.replace("/buildings/", "");
@@ -39,12 +39,12 @@
 
   // ✅ FIX: 절대경로(/assets/...)로 통일 (상대경로 assets/... 는 라우트에 따라 깨짐)
   const DEFAULT_RES_ICONS = {
-    fireCrystal: "/assets/buildings/furnace/firecrystal_img/item_icon_100081.png",
-    refined: "/assets/buildings/furnace/firecrystal_img/item_icon_100082.png",
-    food: "/assets/buildings/furnace/firecrystal_img/item_icon_100011.png",
-    wood: "/assets/buildings/furnace/firecrystal_img/item_icon_103.png",
-    coal: "/assets/buildings/furnace/firecrystal_img/item_icon_104.png",
-    iron: "/assets/buildings/furnace/firecrystal_img/item_icon_105.png",
+    fireCrystal: "/assets/resources/item_icon_100081.png",
+    refined: "/assets/resources/item_icon_100082.png",
+    food: "/assets/resources/item_icon_100011.png",
+    wood: "/assets/resources/item_icon_103.png",
+    coal: "/assets/resources/item_icon_104.png",
+    iron: "/assets/resources/item_icon_105.png",
     time: "/assets/resources/time.png",
     svs: "/assets/resources/svs.png",
   };
@@ -193,11 +193,85 @@
     throw lastErr || new Error("fetchJSONTry: all candidates failed");
   }
 
+  // =========================================================
+  // ✅ 공용 자원 레지스트리 + 스프라이트 (scripts/build_resource_atlas.py)
+  // - /data/resources.json : { atlas: { css, className }, resources: [{ id, key, name, icon, sprite }] }
+  // - 아틀라스 CSS 가 붙으면 아이콘은 <span> 배경 한 장(resources.png)으로 그림 → 이미지 요청 1번
+  // - 레지스트리/CSS 를 못 받으면 예전처럼 <img> 로 폴백
+  // =========================================================
+  const RES_REGISTRY_URL = "/data/resources.json";
+  const ICON_KEY_ALIAS = { refined: "refineStone" };
+
+  let resRegistry = null; // { className, byId: Map }
+  let resRegistryPromise = null;
+
+  function loadSpriteCss(href, timeoutMs = 3000) {
+    const LINK_ID = "wos-sprite-resources-css";
+    const prev = document.getElementById(LINK_ID);
+    if (prev) return Promise.resolve(prev.dataset.ok === "1");
+
+    return new Promise((resolve) => {
+      const link = document.createElement("link");
+      link.id = LINK_ID;
+      link.rel = "stylesheet";
+      link.href = withResSafe(href);
+      const done = (ok) => {
+        link.dataset.ok = ok ? "1" : "0";
+        resolve(ok);
+      };
+      const timer = setTimeout(() => done(false), timeoutMs);
+      link.onload = () => { clearTimeout(timer); done(true); };
+      link.onerror = () => { clearTimeout(timer); done(false); };
+      document.head.appendChild(link);
+    });
+  }
+
+  // 한 번만 요청 (셸은 기다리지 않고 먼저 그림 → 도착하면 fillPendingIcons)
+  function loadResourceRegistry() {
+    if (!resRegistryPromise) resRegistryPromise = fetchResourceRegistry();
+    return resRegistryPromise;
+  }
+
+  async function fetchResourceRegistry() {
+    try {
+      const reg = await fetchJSON(RES_REGISTRY_URL);
+      const byId = new Map();
+      for (const r of Array.isArray(reg?.resources) ? reg.resources : []) {
+        if (r && r.id) byId.set(String(r.id), r);
+      }
+      const atlas = reg?.atlas || {};
+      const cssOk = atlas.css && atlas.className ? await loadSpriteCss(atlas.css) : false;
+      resRegistry = { className: cssOk ? String(atlas.className) : "", byId };
+    } catch (_) {
+      resRegistry = { className: "", byId: new Map() };
+    }
+    return resRegistry;
+  }
+
+  function registryId(key) {
+    return RES_ID[key] || RES_ID[ICON_KEY_ALIAS[key]] || "";
+  }
+
+  function registryEntry(key) {
+    if (!resRegistry) return null;
+    const id = registryId(key);
+    return id ? resRegistry.byId.get(id) || null : null;
+  }
+
+  // 레지스트리 도착 전에 그려진 자리표시(같은 크기 빈 칸)를 스프라이트 / <img> 로 교체
+  function fillPendingIcons(root) {
+    if (!root || !resRegistry) return;
+    root.querySelectorAll("span[data-res-icon]").forEach((el) => {
+      el.outerHTML = iconHTML(el.dataset.resIcon, el.dataset.alt, Number(el.dataset.size) || 16);
+    });
+  }
+
   function getIconUrl(key) {
     const w = window.WOS_BUILDING_CALC_ASSETS;
     const map = w && w.resourceIcons && typeof w.resourceIcons === "object" ? w.resourceIcons : null;
+    const reg = registryEntry(key);
 
-    const raw = (map && map[key] ? String(map[key]) : (DEFAULT_RES_ICONS[key] || "")) || "";
+    const raw = (map && map[key] ? String(map[key]) : (reg?.icon || DEFAULT_RES_ICONS[key] || "")) || "";
     if (!raw) return "";
 
     // ✅ FIX: 어떤 형태로 들어와도 (assets/... / /assets/...) repo prefix + route safe 처리
@@ -205,8 +279,17 @@
   }
 
   function iconHTML(key, alt, size = 16) {
-    const src = getIconUrl(key);
     const safeAlt = esc(alt || key);
+    if (!resRegistry && registryId(key)) {
+      // 아직 레지스트리 로딩 중: 폴백 <img> 요청을 먼저 보내지 않도록 빈 칸만
+      return `<span data-res-icon="${attr(key)}" data-alt="${attr(alt || key)}" data-size="${size}" style="display:inline-block;width:${size}px;height:${size}px;vertical-align:-3px"></span>`;
+    }
+    const reg = registryEntry(key);
+    if (reg && reg.sprite && resRegistry.className) {
+      return `<span class="${attr(resRegistry.className)} ${attr(reg.sprite)}" role="img" aria-label="${safeAlt}" title="${safeAlt}" style="width:${size}px;height:${size}px;vertical-align:-3px"></span>`;
+    }
+
+    const src = getIconUrl(key);
     if (!src) return "";
     return `<img src="${attr(src)}" alt="${safeAlt}" style="width:${size}px;height:${size}px;vertical-align:-3px;object-fit:contain" onerror="this.style.display='none'">`;
   }
@@ -1017,8 +1100,12 @@
 
     const BIND_KEY = "__wos_bcalc_bound__";
 
+    // 레지스트리(JSON 1개 + 스프라이트 CSS)는 기다리지 않음: 셸을 먼저 그리고 도착하면 아이콘만 채움
+    const registryReady = loadResourceRegistry();
+
     renderShell(_app, _t);
     hideError();
+    registryReady.then(() => fillPendingIcons(_app));
 
     const hyena = document.getElementById("fc-hyena");
     const agenes = document.getElementById("fc-agenes");
@@ -1203,6 +1290,7 @@
     RES_ID,
     CSV_COLS,
     normalizeBuildingRows,
+    calcSegment,
     loadBuildingDataFromJSON,
     filterLevelsWithIndex,
     formatSVS,
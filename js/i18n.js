@@ -12,6 +12,10 @@
        2) Flat keys:   { "buildings.list.title":"..." }
    - Also supports wrapper:
        { "en": { ... } }  => unwraps automatically
+   - Route packs (scripts/build_i18n_packs.py):
+       /i18n/packs/manifest.json 가 있으면 라우트별 팩 1개만 받는다
+       (/i18n/packs/{lang}/{route}.{hash}.json, 내용 해시 파일명 => 캐시 OK)
+       manifest 가 없거나 실패하면 위 파일들을 그대로 합친다
    ========================================================= */
 
 (() => {
@@ -26,12 +30,18 @@
   let _dict = {};
   let _ready = false;
 
+  // ✅ 라우트 팩 (manifest 없으면 null => 기존 files 방식)
+  let _manifest = null;
+  let _route = "/";
+  let _loadedPacks = new Set(); // 현재 언어로 이미 merge 한 팩 경로
+
   let _cfg = {
     defaultLang: DEFAULT_LANG,
     supported: SUPPORTED.slice(),
     basePath: BASE_PATH,
     // ✅ 자동으로 합칠 파일들
     files: ["common.json", "buildings.json", "heroes.json", "calc.json", "tips.json"],
+    packs: "", // 예: "packs/manifest.json" (basePath 기준)
   };
 
   // ---------- utils ----------
@@ -65,8 +75,8 @@
     try { return new URL(url, location.href).toString(); } catch (_) { return url; }
   }
 
-  async function fetchJSON(url) {
-    const res = await fetch(url, { cache: "no-store" });
+  async function fetchJSON(url, cache) {
+    const res = await fetch(url, { cache: cache || "no-store" });
     if (!res.ok) throw new Error(`i18n fetch failed: ${url} (HTTP ${res.status})`);
     return await res.json();
   }
@@ -188,10 +198,89 @@
     });
   }
 
+  // ---------- route packs ----------
+  function normPath(path) {
+    return "/" + String(path || "/").split(/[?#]/)[0].split("/").filter(Boolean).join("/");
+  }
+
+  // "/heroes/:slug" 같은 패턴 매칭 => null | { slug }
+  function matchRoutePath(pattern, path) {
+    const a = normPath(pattern).split("/");
+    const b = normPath(path).split("/");
+    if (a.length !== b.length) return null;
+    let slug = "";
+    for (let i = 0; i < a.length; i++) {
+      if (a[i] === ":slug") {
+        if (!b[i]) return null;
+        slug = decodeURIComponent(b[i]);
+      } else if (a[i] !== b[i]) {
+        return null;
+      }
+    }
+    return { slug };
+  }
+
+  // 경로 -> manifest 팩 파일 (packs 기준 상대경로)
+  function packFor(lang, path) {
+    if (!_manifest) return null;
+    const packs = (_manifest.packs && _manifest.packs[lang]) || {};
+    const routes = Array.isArray(_manifest.routes) ? _manifest.routes : [];
+
+    for (const r of routes) {
+      for (const pattern of r.paths || []) {
+        const m = matchRoutePath(pattern, path);
+        if (!m) continue;
+        if (m.slug && packs[`${r.name}:${m.slug}`]) return packs[`${r.name}:${m.slug}`];
+        if (packs[r.name]) return packs[r.name];
+      }
+    }
+    return packs[_manifest.fallback] || null;
+  }
+
+  function packsBaseUrl() {
+    const base = String(_cfg.basePath || BASE_PATH).replace(/\/+$/, "");
+    const manifestPath = String(_cfg.packs || "");
+    const dir = manifestPath.includes("/") ? manifestPath.replace(/\/[^/]*$/, "") : "";
+    return dir ? `${base}/${dir}` : base;
+  }
+
+  async function loadManifest() {
+    _manifest = null;
+    if (!_cfg.packs) return null;
+    const base = String(_cfg.basePath || BASE_PATH).replace(/\/+$/, "");
+    try {
+      const json = await fetchJSON(toAbs(`${base}/${_cfg.packs}`));
+      if (json && json.packs && Array.isArray(json.routes)) _manifest = json;
+    } catch (_) {
+      // manifest 없으면 기존 방식 (빌드 안 한 로컬 개발 등)
+    }
+    return _manifest;
+  }
+
+  // 팩 1개 merge. 파일명에 해시가 있으니 브라우저 캐시 그대로 사용
+  async function mergePack(target, lang, rel) {
+    if (!rel || _loadedPacks.has(rel)) return false;
+    const json = await fetchJSON(toAbs(`${packsBaseUrl()}/${rel}`), "default");
+    deepMerge(target, unwrapLangObject(json, lang));
+    _loadedPacks.add(rel);
+    return true;
+  }
+
   async function loadLangFiles(lang) {
     const base = String(_cfg.basePath || BASE_PATH).replace(/\/+$/, "");
     const merged = {};
 
+    _loadedPacks = new Set();
+    if (_manifest) {
+      try {
+        await mergePack(merged, lang, packFor(lang, _route));
+        return merged;
+      } catch (_) {
+        // 팩이 깨졌으면 전체 파일로
+        _manifest = null;
+      }
+    }
+
     for (const f of _cfg.files) {
       const url = toAbs(`${base}/${lang}/${f}`);
       try {
@@ -231,6 +320,28 @@
     return _lang;
   }
 
+  // ✅ 라우트 이동 시 호출: 그 라우트 팩만 추가로 merge (이미 받은 팩은 건너뜀)
+  async function useRoute(path) {
+    _route = normPath(path);
+    if (!_manifest || !_ready) return false;
+
+    const lang = _lang;
+    const rel = packFor(lang, _route);
+    if (!rel || _loadedPacks.has(rel)) return false;
+
+    try {
+      const add = {};
+      await mergePack(add, lang, rel);
+      if (lang !== _lang) return false; // 받는 사이 언어가 바뀜
+      deepMerge(_dict, add);
+      apply(document);
+      return true;
+    } catch (err) {
+      console.warn("[i18n] route pack failed:", rel, err);
+      return false;
+    }
+  }
+
   async function init(opts = {}) {
     const inputSupported =
       Array.isArray(opts.supported) && opts.supported.length ? opts.supported : SUPPORTED;
@@ -252,9 +363,12 @@
       files: Array.isArray(opts.files) && opts.files.length
         ? opts.files.slice()
         : ["common.json", "buildings.json", "heroes.json", "calc.json", "tips.json"],
+      packs: String(opts.packs || "").replace(/^\/+/, ""),
     };
+    if (opts.route) _route = normPath(opts.route);
 
     bindLangControlsOnce();
+    await loadManifest();
 
     const stored = getStoredLang();
     const pathLang = detectFromPathname();
@@ -284,5 +398,5 @@
     return _lang;
   }
 
-  window.WOS_I18N = { init, setLang, getLang, t, apply };
+  window.WOS_I18N = { init, setLang, getLang, t, apply, useRoute };
 })();
@@ -0,0 +1,318 @@
+# bench_parsers.py
+# ------------------------------------------------------------
+# ✅ 파서 핫패스 벤치마크 (처리량 + 최대 메모리)
+#
+#   parse_buildings_html_to_json : smart_value / level_sort_key / parse_html_table /
+#                                  score_table_as_main / extract_sections / parse_one_html
+#   download_gatot_images        : pick_best_from_srcset / extract_image_urls
+#
+# 사용법:
+#   python scripts/bench/bench_parsers.py                          # 결과만 출력 (기본 크기, 몇 분)
+#   python scripts/bench/bench_parsers.py --scale quick            # 작은 크기로 빠르게
+#   python scripts/bench/bench_parsers.py --scale full             # 50k 행 테이블까지 (오래 걸림)
+#   python scripts/bench/bench_parsers.py --save scripts/bench/baseline.json      # 기준 갱신 (커밋)
+#   python scripts/bench/bench_parsers.py --compare scripts/bench/baseline.json   # 바꾼 뒤 -> 느려지면 exit 1
+#   python scripts/bench/bench_parsers.py --only parse_html_table
+#
+# - baseline.json 은 저장소에 커밋해 둔다 (calibration_seconds 포함). 다른 머신에서 --compare 해도
+#   보정 루프 비율로 나눠서 보니까 그대로 쓸 수 있음. 파서를 의도적으로 바꿨으면 --save 로 갱신해서 같이 커밋.
+# - 시간: repeat 번 돌려서 최솟값 (GC 끄고 측정, 한 번에 2초 넘는 케이스는 1번만)
+#   같은 프로세스에서 고정 작업량 보정 루프(calibration)도 재서, 비교는 "보정 루프 대비 비율" 로 한다
+#   -> 머신/부하가 달라서 전체가 느린 건 회귀로 안 잡힘
+# - 메모리: tracemalloc 으로 한 번 더 돌려서 peak (시간 측정과 분리, 임계값도 따로 --mem-threshold)
+# - 같은 이름(크기 포함)끼리만 비교한다. scale 이 달라도 같은 크기 케이스는 서로 비교됨.
+# - e2e_* 는 실제 위키처럼 <img ...> 를 닫지 않은 HTML 이라 bs4 soup 생성 비용까지 그대로 잰다.
+# ------------------------------------------------------------
+
+import os
+import gc
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))        # = scripts/bench
+SCRIPTS_DIR = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+for p in (BENCH_DIR, SCRIPTS_DIR, os.path.join(SCRIPTS_DIR, "buildings"), ROOT_DIR):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+import parse_buildings_html_to_json as pb  # noqa: E402
+import download_gatot_images as dgi  # noqa: E402
+from synthetic_pages import image_page, level_labels, level_page, section_tree_page  # noqa: E402
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+
+# =============================
+# 측정
+# =============================
+SLOW_CASE_SECONDS = 2.0
+
+CALIBRATION_N = 200_000
+
+def calibrate(repeat: int = 5) -> float:
+    """머신 속도 기준값: 파서 핫패스와 비슷한 문자열/딕셔너리 작업을 고정량 돌린 최소 시간"""
+    def work() -> int:
+        d: Dict[str, bool] = {}
+        for i in range(CALIBRATION_N):
+            s = f"{i:,}"
+            d[s] = s.replace(",", "").isdigit()
+        return len(d)
+
+    best = float("inf")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            work()
+            best = min(best, time.perf_counter() - t0)
+    finally:
+        gc.enable()
+    return best
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """(최소 시간 초, tracemalloc peak 바이트)"""
+    best = float("inf")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+            if best > SLOW_CASE_SECONDS:
+                break
+    finally:
+        gc.enable()
+
+    # peak 는 앞 케이스의 쓰레기 회수 타이밍에 따라 흔들려서 2번 재고 작은 쪽
+    peak = None
+    for _ in range(2):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            _cur, p = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak = p if peak is None else min(peak, p)
+    return best, peak
+
+
+# =============================
+# 케이스
+# =============================
+SCALES: Dict[str, Dict[str, Any]] = {
+    "quick": {"tables": [1000], "values": 20000, "images": 500, "depth": 3, "e2e_rows": [1000]},
+    "default": {"tables": [1000, 10000], "values": 200000, "images": 5000, "depth": 4, "e2e_rows": [1000, 5000]},
+    "full": {"tables": [1000, 10000, 50000], "values": 200000, "images": 20000, "depth": 5, "e2e_rows": [1000, 5000, 10000]},
+}
+
+def build_cases(scale: str) -> List[Tuple[str, str, int, Callable[[], Callable[[], Any]]]]:
+    """
+    (이름, 단위, 처리 개수, setup) - setup 은 측정 밖에서 한 번만 돌고 측정할 함수를 돌려준다
+    (함수에 .cleanup 이 붙어 있으면 측정 뒤에 호출 - 임시 폴더 정리용)
+    """
+    cfg = SCALES[scale]
+    table_sizes = cfg["tables"]
+    n_values = cfg["values"]
+    n_images = cfg["images"]
+    depth, breadth = cfg["depth"], 4
+
+    cases: List[Tuple[str, str, int, Callable[[], Callable[[], Any]]]] = []
+
+    # ---- smart_value ----
+    def setup_smart_value():
+        import random
+        rng = random.Random(7)
+        vals = []
+        for i in range(n_values):
+            r = rng.random()
+            if r < 0.3:
+                vals.append(f"{rng.randint(1000, 90_000_000):,}")
+            elif r < 0.5:
+                vals.append(str(rng.randint(0, 99999)))
+            elif r < 0.6:
+                vals.append(f"{rng.randint(0, 99)}.{rng.randint(0, 99)}")
+            elif r < 0.8:
+                vals.append(f"{rng.randint(0, 99):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}")
+            else:
+                vals.append(f"  Furnace Lv. {i % 30}  ")
+        return lambda: [pb.smart_value(v) for v in vals]
+    cases.append((f"smart_value[n={n_values}]", "values", n_values, setup_smart_value))
+
+    # ---- level_sort_key ----
+    def setup_level_sort_key():
+        import random
+        labels = level_labels(n_values)
+        random.Random(8).shuffle(labels)
+        return lambda: sorted(labels, key=pb.level_sort_key)
+    cases.append((f"level_sort_key[n={n_values}]", "labels", n_values, setup_level_sort_key))
+
+    # ---- parse_html_table / score_table_as_main ----
+    for rows in table_sizes:
+        def setup_table(rows=rows):
+            soup = BeautifulSoup(level_page(rows, img_end="/>"), "html.parser")
+            table = soup.find("table")
+            return lambda: pb.parse_html_table(table)
+        cases.append((f"parse_html_table[rows={rows}]", "rows", rows, setup_table))
+
+    big = table_sizes[-1]
+
+    def setup_score():
+        soup = BeautifulSoup(level_page(big, img_end="/>"), "html.parser")
+        info = pb.parse_html_table(soup.find("table"))
+        return lambda: pb.score_table_as_main(info)
+    cases.append((f"score_table_as_main[rows={big}]", "tables", 1, setup_score))
+
+    # ---- extract_sections ----
+    def setup_sections():
+        soup = BeautifulSoup(section_tree_page(depth, breadth, img_end="/>"), "html.parser")
+        return lambda: pb.extract_sections(soup)
+    n_sections = sum(breadth ** d for d in range(1, depth + 1))
+    cases.append((f"extract_sections[depth={depth},breadth={breadth}]", "sections", n_sections, setup_sections))
+
+    # ---- pick_best_from_srcset ----
+    def setup_srcset():
+        sets = [", ".join(f"https://cdn.example.com/a_{i}-{w}.webp {w}w" for w in (320, 640, 1024, 2048))
+                if i % 3 else f"https://cdn.example.com/b_{i}.png 1x, https://cdn.example.com/b_{i}@2x.png 2x"
+                for i in range(n_values)]
+        return lambda: [dgi.pick_best_from_srcset(s) for s in sets]
+    cases.append((f"pick_best_from_srcset[n={n_values}]", "srcsets", n_values, setup_srcset))
+
+    # ---- extract_image_urls (html.parser 스캐너, 함수 전체) ----
+    def setup_images():
+        html = image_page(n_images)
+        return lambda: dgi.extract_image_urls(
+            "https://www.whiteoutsurvival.wiki/heroes/gatot/", html,
+            use_filter=False, filter_text="", include_icons=False,
+        )
+    cases.append((f"extract_image_urls[imgs={n_images}]", "images", n_images, setup_images))
+
+    # ---- end to end: 파일 1개 -> JSON 1개 (읽기 + soup + 추출 + JSON 쓰기) ----
+    for e2e_rows in cfg["e2e_rows"]:
+        def setup_e2e(e2e_rows=e2e_rows):
+            tmp = tempfile.TemporaryDirectory(prefix="wos_bench_")
+            path = os.path.join(tmp.name, "building_synthetic.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(level_page(e2e_rows))
+            out_dir = os.path.join(tmp.name, "out")
+
+            def run():
+                return pb.build_one(path, out_dir)
+            run.cleanup = tmp.cleanup  # run_benchmarks 가 측정 끝나면 지움
+            return run
+        cases.append((f"e2e_build_one[rows={e2e_rows}]", "rows", e2e_rows, setup_e2e))
+
+    return cases
+
+
+def run_benchmarks(scale: str, repeat: int, only: Optional[str]) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name, unit, n, setup in build_cases(scale):
+        if only and only not in name:
+            continue
+        fn = setup()
+        try:
+            seconds, peak = measure(fn, repeat)
+        finally:
+            cleanup = getattr(fn, "cleanup", None)
+            if cleanup:
+                cleanup()
+        results[name] = {
+            "seconds": round(seconds, 6),
+            "throughput": round(n / seconds, 2) if seconds > 0 else None,
+            "unit": f"{unit}/s",
+            "peak_bytes": peak,
+        }
+        print(f"  {name:<45} {seconds * 1000:10.2f} ms  {n / seconds if seconds else 0:14,.0f} {unit}/s"
+              f"  peak {peak / 1024 / 1024:8.2f} MiB")
+    return results
+
+
+# =============================
+# 비교
+# =============================
+def compare(results: Dict[str, Any], calibration: float, baseline: Dict[str, Any],
+            threshold: float, mem_threshold: float) -> int:
+    base = baseline.get("results", {})
+    base_cal = baseline.get("calibration_seconds")
+    # 시간 비율을 머신 속도 차이만큼 나눠서 본다 (보정값 없는 예전 baseline 이면 그대로)
+    speed = calibration / base_cal if base_cal and calibration else 1.0
+    if not base_cal:
+        print("\n⚠ baseline 에 calibration_seconds 가 없음 -> 절대 시간으로 비교 (같은 머신 baseline 만 의미 있음)")
+    print(f"\n[COMPARE] time +{threshold * 100:.0f}% (machine x{speed:.2f} 보정)  peak mem +{mem_threshold * 100:.0f}%")
+    print(f"  {'case':<45} {'time':>10} {'peak mem':>10}")
+    regressions = 0
+    for name, cur in results.items():
+        b = base.get(name)
+        if not b:
+            print(f"  {name:<45} {'(new)':>10}")
+            continue
+        t_ratio = cur["seconds"] / (b["seconds"] * speed) if b["seconds"] else 1.0
+        m_ratio = cur["peak_bytes"] / b["peak_bytes"] if b["peak_bytes"] else 1.0
+        flag = ""
+        if t_ratio > 1 + threshold:
+            flag += "  ⚠ TIME"
+        if m_ratio > 1 + mem_threshold:
+            flag += "  ⚠ MEM"
+        if flag:
+            regressions += 1
+        print(f"  {name:<45} {t_ratio:9.2f}x {m_ratio:9.2f}x{flag}")
+    if regressions:
+        print(f"\n❌ {regressions}개 케이스가 기준보다 느리거나 메모리를 더 씀")
+        return 1
+    print("\n✅ 기준 대비 회귀 없음")
+    return 0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--scale", choices=sorted(SCALES), default="default", help="케이스 크기")
+    ap.add_argument("--repeat", type=int, default=3, help="케이스당 반복 횟수 (최솟값 사용)")
+    ap.add_argument("--only", default="", help="이름에 이 문자열이 들어간 케이스만")
+    ap.add_argument("--save", default="", help=f"결과 저장 경로 (예: {os.path.relpath(BASELINE_PATH, ROOT_DIR)})")
+    ap.add_argument("--compare", default="", help="비교할 baseline JSON")
+    ap.add_argument("--threshold", type=float, default=0.20, help="허용 시간 회귀 비율, 보정 후 (0.20 = 20%%)")
+    ap.add_argument("--mem-threshold", type=float, default=0.10, help="허용 peak 메모리 증가 비율 (0.10 = 10%%)")
+    args = ap.parse_args()
+
+    print(f"[BENCH] python {platform.python_version()} / {platform.machine()} / scale={args.scale}")
+    calibration = calibrate()
+    print(f"  {'calibration[n=' + str(CALIBRATION_N) + ']':<45} {calibration * 1000:10.2f} ms")
+    results = run_benchmarks(args.scale, max(1, args.repeat), args.only or None)
+    # 케이스 돌린 뒤 한 번 더 (그 사이 머신 부하가 바뀐 경우 덜 흔들리게 작은 쪽)
+    calibration = min(calibration, calibrate())
+
+    if args.save:
+        payload = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "calibration_seconds": round(calibration, 6),
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        print(f"\n[OK] {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        sys.exit(compare(results, calibration, baseline, args.threshold, args.mem_threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,598 @@
+# load_site.py
+# ------------------------------------------------------------
+# ✅ 사이트 로딩 부하 테스트 (asyncio, 라우트별 요청 순서 재생)
+#
+#   브라우저가 라우트 하나를 열 때 보내는 요청을 "단계" 로 재생한다.
+#   같은 단계 안의 요청은 동시에 (세션당 연결 --conns 개), 단계끼리는 순서대로.
+#
+#   home       : /  -> css/js  -> i18n  -> tips/latest/affiliate JSON (순서대로) -> 타일 이미지
+#   heroes     : /heroes (404.html) -> /?p=... -> css/js -> i18n -> r/sr/ssr index -> 영웅 이미지
+#   hero       : /heroes/{slug} ...  -> r/sr/ssr index -> {slug}.json -> 초상화 + 스킬 아이콘
+#   calculator : /tools/building-calculator ... -> resources.json -> 스프라이트 css
+#                -> buildings/index.json -> 건물 8개 (후보 경로 404 포함, 하나씩) -> 스프라이트 png
+#
+#   순서는 지금 트리에서 만든다 (index.html 스크립트, i18n/packs/manifest.json, data/**/index.json,
+#   js/building-calculator.js 의 ALLOWED_SLUGS). 데이터 파이프라인 결과물이 바뀌면 요청 수/바이트도 같이 바뀜.
+#
+# 사용법:
+#   python scripts/bench/load_site.py --serve                              # 로컬 서버 같이 띄워서 측정
+#   python scripts/bench/load_site.py --serve --latency-ms 80 --users 20 --sessions 5
+#   python scripts/bench/load_site.py --url http://127.0.0.1:8000 --routes hero,calculator
+#   python scripts/bench/load_site.py --serve --warm                       # 사용자별 HTTP 캐시 유지 (재방문)
+#   python scripts/bench/load_site.py --serve --save scripts/bench/load_baseline.json
+#   python scripts/bench/load_site.py --serve --compare scripts/bench/load_baseline.json   # 나빠지면 exit 1
+#
+# - 캐시 모델 (--warm): fetch 의 cache 모드를 코드와 맞춤
+#     no-store (CORE.fetchJSONTry, i18n manifest) : 항상 전체 요청
+#     no-cache (heroes.js)                        : If-None-Match 재검증 (304)
+#     default  (css/js/이미지/i18n 팩)             : max-age 안이면 요청 없음, 지나면 재검증
+# - 서비스 워커 캐시는 재현하지 않는다 (첫 방문 기준). sw.js 요청 자체는 마지막 단계에 포함.
+# - 시간: 세션 시작 ~ 마지막 바이트 (page), 요청별 ~ 마지막 바이트 (req)
+# ------------------------------------------------------------
+
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import asyncio
+import argparse
+import platform
+import threading
+from urllib.parse import quote, urlsplit
+from typing import Any, Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))        # = scripts/bench
+SCRIPTS_DIR = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+ROUTE_NAMES = ("home", "heroes", "hero", "calculator")
+IMAGE_EXT = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg", ".avif")
+LEGACY_I18N_FILES = ("common.json", "buildings.json", "heroes.json", "calc.json")
+
+
+# =============================
+# 요청 순서 (트리에서 만들기)
+# =============================
+class Req:
+    """요청 1개 = 후보 URL 들 (앞에서부터 성공할 때까지, fetchJSONTry 와 같음)"""
+
+    def __init__(self, candidates: List[str], mode: str = "default", expect_404: bool = False):
+        self.candidates = candidates
+        self.mode = mode
+        self.expect_404 = expect_404  # 404.html 로 떨어지는 SPA 딥링크
+
+
+def load_json(rel: str) -> Any:
+    with open(os.path.join(ROOT_DIR, rel), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_text(rel: str) -> str:
+    with open(os.path.join(ROOT_DIR, rel), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def local_ref(u: str) -> Optional[str]:
+    u = (u or "").strip()
+    if not u or re.match(r"^(?:[a-z][a-z0-9+.-]*:|//|#)", u, re.I):
+        return None
+    return u if u.startswith("/") else "/" + u.lstrip("./")
+
+
+def dedupe(items: List[str]) -> List[str]:
+    seen = set()
+    return [x for x in items if not (x in seen or seen.add(x))]
+
+
+def shell_static() -> List[str]:
+    html = read_text("index.html")
+    refs = [m.group(1) for m in re.finditer(r"<script\b[^>]*\bsrc=\"([^\"]+)\"", html, re.I)]
+    for m in re.finditer(r"<link\b[^>]*>", html, re.I):
+        tag = m.group(0)
+        rel = re.search(r"\brel=\"([^\"]+)\"", tag, re.I)
+        href = re.search(r"\bhref=\"([^\"]+)\"", tag, re.I)
+        if rel and href and re.search(r"stylesheet|icon", rel.group(1), re.I):
+            refs.append(href.group(1))
+    return dedupe([r for r in (local_ref(x) for x in refs) if r])
+
+
+def match_route(pattern: str, path: str) -> Optional[str]:
+    a = [p for p in pattern.split("/") if p]
+    b = [p for p in path.split("/") if p]
+    if len(a) != len(b):
+        return None
+    slug = ""
+    for x, y in zip(a, b):
+        if x == ":slug":
+            slug = y
+        elif x != y:
+            return None
+    return slug
+
+
+def i18n_steps(path: str, lang: str) -> List[List[Req]]:
+    """js/i18n.js 와 같은 순서: manifest -> 라우트 팩 1개 (없으면 예전 파일 4개를 하나씩)"""
+    manifest_rel = "i18n/packs/manifest.json"
+    if not os.path.isfile(os.path.join(ROOT_DIR, manifest_rel)):
+        return [[Req([f"/i18n/{lang}/{f}"], "no-store")] for f in LEGACY_I18N_FILES]
+
+    manifest = load_json(manifest_rel)
+    packs = (manifest.get("packs") or {}).get(lang) or {}
+    rel = None
+    for r in manifest.get("routes") or []:
+        for pattern in r.get("paths") or []:
+            slug = match_route(pattern, path)
+            if slug is None:
+                continue
+            rel = packs.get(f"{r['name']}:{slug}") if slug else None
+            rel = rel or packs.get(r["name"])
+            break
+        if rel:
+            break
+    rel = rel or packs.get(manifest.get("fallback") or "")
+
+    steps = [[Req(["/" + manifest_rel], "no-store")]]
+    if rel:
+        steps.append([Req([f"/i18n/packs/{rel}"], "default")])
+    return steps
+
+
+def shell_steps(path: str, lang: str) -> List[List[Req]]:
+    steps: List[List[Req]] = []
+    if path == "/":
+        steps.append([Req(["/"], "no-cache")])
+    else:
+        # Pages: 딥링크 -> 404 + 404.html -> location.replace("/?p=...")
+        steps.append([Req([path], "no-cache", expect_404=True)])
+        steps.append([Req(["/?p=" + quote(path, safe="") + "&q=&h="], "no-cache")])
+    steps.append([Req([u]) for u in shell_static()])
+    steps.extend(i18n_steps(path, lang))
+    return steps
+
+
+def image_refs(obj: Any) -> List[str]:
+    out: List[str] = []
+
+    def walk(o: Any) -> None:
+        if isinstance(o, dict):
+            for v in o.values():
+                walk(v)
+        elif isinstance(o, list):
+            for v in o:
+                walk(v)
+        elif isinstance(o, str) and o.lower().endswith(IMAGE_EXT):
+            r = local_ref(o)
+            if r:
+                out.append(r)
+
+    walk(obj)
+    return dedupe(out)
+
+
+def cap(items: List[str], n: int) -> List[str]:
+    return items[:n] if n > 0 else items
+
+
+def hero_index_step() -> List[Req]:
+    return [Req([f"/data/heroes/{tier}/index.json"], "no-cache") for tier in ("r", "sr", "ssr")]
+
+
+def build_plans(lang: str, hero_slug: str, max_images: int) -> Dict[str, Tuple[str, List[List[Req]]]]:
+    """라우트 이름 -> (경로, 단계 목록)"""
+    plans: Dict[str, Tuple[str, List[List[Req]]]] = {}
+
+    # ---- home ----
+    app_js = read_text("js/app.js")
+    tiles = dedupe(re.findall(r"withRes\(\"(/assets/[^\"]+\.(?:png|jpe?g|webp))\"\)", app_js))
+    steps = shell_steps("/", lang)
+    steps += [
+        [Req(["/data/tips/index.json"], "no-store")],
+        [Req(["/data/latest.json"], "no-store")],
+        [Req(["/data/affiliate-lootbar.json", "/data/afflilate-lootbar.json"], "no-store")],
+        [Req([u]) for u in cap(tiles, max_images)],
+    ]
+    plans["home"] = ("/", steps)
+
+    # ---- heroes / hero ----
+    index_items: List[Dict[str, Any]] = []
+    for tier in ("r", "sr", "ssr"):
+        payload = load_json(f"data/heroes/{tier}/index.json")
+        items = payload if isinstance(payload, list) else (payload.get("items") or payload.get("heroes") or [])
+        for it in items:
+            if isinstance(it, dict) and it.get("slug"):
+                index_items.append({**it, "_tier": tier})
+
+    steps = shell_steps("/heroes", lang)
+    steps.append(hero_index_step())
+    steps.append([Req([u]) for u in cap(image_refs([it.get("image") for it in index_items]), max_images)])
+    plans["heroes"] = ("/heroes", steps)
+
+    hit = next((it for it in index_items if it["slug"] == hero_slug), None) or (index_items[-1] if index_items else None)
+    if hit:
+        slug = hit["slug"]
+        rel = "data/heroes/" + str(hit.get("path") or f"{hit['_tier']}/{slug}.json").lstrip("/")
+        steps = shell_steps(f"/heroes/{slug}", lang)
+        steps.append(hero_index_step())
+        steps.append([Req(["/" + rel], "no-cache")])
+        imgs = image_refs(hit.get("image")) + image_refs(load_json(rel))
+        steps.append([Req([u]) for u in cap(dedupe(imgs), max_images)])
+        plans["hero"] = (f"/heroes/{slug}", steps)
+
+    # ---- calculator ----
+    calc_js = read_text("js/building-calculator.js")
+    m = re.search(r"ALLOWED_SLUGS\s*=\s*\[([^\]]*)\]", calc_js)
+    slugs = re.findall(r"\"([a-z0-9_-]+)\"", m.group(1)) if m else []
+    steps = shell_steps("/tools/building-calculator", lang)
+    registry = load_json("data/resources.json") if os.path.isfile(os.path.join(ROOT_DIR, "data/resources.json")) else {}
+    atlas = registry.get("atlas") or {}
+    steps.append([Req(["/data/resources.json"], "no-store")])
+    if atlas.get("css"):
+        steps.append([Req([local_ref(atlas["css"])])])
+    steps.append([Req(["/data/buildings/index.json"], "no-store")])
+    for s in slugs:
+        # buildDetailCandidates() 순서 그대로: base/ -> 루트 -> fc/ -> fcPlus/
+        steps.append([Req([f"/data/buildings/base/{s}.json", f"/data/buildings/{s}.json",
+                           f"/data/buildings/fc/{s}.json", f"/data/buildings/fcPlus/{s}.json"], "no-store")])
+    if atlas.get("image"):
+        steps.append([Req([local_ref(atlas["image"])])])
+    plans["calculator"] = ("/tools/building-calculator", steps)
+
+    # 로드 끝나고 서비스 워커 등록
+    for _name, (_path, st) in plans.items():
+        st.append([Req(["/sw.js"], "no-cache")])
+    return plans
+
+
+# =============================
+# HTTP/1.1 클라이언트 (keep-alive, 세션당 연결 N 개)
+# =============================
+class Conn:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class Pool:
+    def __init__(self, host: str, port: int, size: int):
+        self.host = host
+        self.port = port
+        self.sem = asyncio.Semaphore(size)
+        self.idle: List[Conn] = []
+
+    async def get(self) -> Conn:
+        if self.idle:
+            return self.idle.pop()
+        r, w = await asyncio.open_connection(self.host, self.port)
+        return Conn(r, w)
+
+    def put(self, c: Conn, reuse: bool) -> None:
+        if reuse:
+            self.idle.append(c)
+        else:
+            c.close()
+
+    def close(self) -> None:
+        while self.idle:
+            self.idle.pop().close()
+
+
+async def read_response(c: Conn, head_only: bool) -> Tuple[int, Dict[str, str], bytes, int]:
+    """(status, headers, body, 헤더 포함 수신 바이트)"""
+    raw_head = await c.reader.readuntil(b"\r\n\r\n")
+    lines = raw_head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers: Dict[str, str] = {}
+    for ln in lines[1:]:
+        if ":" in ln:
+            k, v = ln.split(":", 1)
+            headers[k.strip().lower()] = v.strip()
+
+    wire = len(raw_head)
+    if head_only or status in (204, 304) or 100 <= status < 200:
+        return status, headers, b"", wire
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size_line = await c.reader.readuntil(b"\r\n")
+            wire += len(size_line)
+            size = int(size_line.split(b";")[0].strip(), 16)
+            data = await c.reader.readexactly(size + 2)
+            wire += len(data)
+            if size == 0:
+                break
+            chunks.append(data[:-2])
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await c.reader.readexactly(int(headers["content-length"]))
+        wire += len(body)
+    else:
+        body = await c.reader.read()
+        wire += len(body)
+    return status, headers, body, wire
+
+
+class HttpCache:
+    """사용자 1명의 브라우저 HTTP 캐시 (ETag + max-age 만)"""
+
+    def __init__(self):
+        self.entries: Dict[str, Tuple[str, str, float, int]] = {}  # url -> (etag, last_mod, stored_at, max_age)
+
+    def lookup(self, url: str, mode: str) -> Tuple[str, Dict[str, str]]:
+        """('hit'|'revalidate'|'miss', 추가 헤더)"""
+        e = self.entries.get(url)
+        if mode == "no-store" or not e:
+            return "miss", {}
+        etag, last_mod, stored_at, max_age = e
+        if mode == "default" and time.monotonic() - stored_at < max_age:
+            return "hit", {}
+        h = {}
+        if etag:
+            h["If-None-Match"] = etag
+        elif last_mod:
+            h["If-Modified-Since"] = last_mod
+        return "revalidate", h
+
+    def store(self, url: str, headers: Dict[str, str], mode: str) -> None:
+        if mode == "no-store":
+            return
+        cc = headers.get("cache-control", "")
+        m = re.search(r"max-age=(\d+)", cc)
+        if "no-store" in cc:
+            return
+        self.entries[url] = (headers.get("etag", ""), headers.get("last-modified", ""),
+                             time.monotonic(), int(m.group(1)) if m else 0)
+
+
+class Stats:
+    def __init__(self):
+        self.requests = 0
+        self.not_modified = 0
+        self.cache_hits = 0
+        self.misses = 0        # 후보 경로 404 (다음 후보로 넘어감)
+        self.errors = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self.req_times: List[float] = []
+        self.page_times: List[float] = []
+
+
+class Session:
+    def __init__(self, host: str, port: int, host_header: str, base: str, conns: int,
+                 cache: HttpCache, stats: Stats):
+        self.pool = Pool(host, port, conns)
+        self.host_header = host_header
+        self.base = base
+        self.cache = cache
+        self.stats = stats
+
+    async def get(self, path: str, extra: Dict[str, str]) -> Tuple[int, Dict[str, str]]:
+        url = self.base + path
+        req = (f"GET {url} HTTP/1.1\r\nHost: {self.host_header}\r\n"
+               "Accept-Encoding: gzip\r\nUser-Agent: wos-load/1.0\r\n"
+               + "".join(f"{k}: {v}\r\n" for k, v in extra.items()) + "\r\n").encode("latin-1")
+
+        async with self.pool.sem:
+            t0 = time.perf_counter()
+            for attempt in (0, 1):
+                c = await self.pool.get()
+                try:
+                    c.writer.write(req)
+                    await c.writer.drain()
+                    status, headers, body, wire = await read_response(c, head_only=False)
+                    break
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    # 서버가 닫은 keep-alive 연결 -> 새 연결로 한 번만 다시
+                    c.close()
+                    if attempt:
+                        raise
+            self.stats.req_times.append(time.perf_counter() - t0)
+            self.pool.put(c, headers.get("connection", "").lower() != "close")
+
+        self.stats.requests += 1
+        self.stats.wire_bytes += wire
+        if headers.get("content-encoding") == "gzip" and body:
+            body = gzip.decompress(body)
+        self.stats.body_bytes += len(body)
+        return status, headers
+
+    async def fetch(self, r: Req) -> None:
+        for i, path in enumerate(r.candidates):
+            state, extra = self.cache.lookup(path, r.mode)
+            if state == "hit":
+                self.stats.cache_hits += 1
+                return
+            status, headers = await self.get(path, extra)
+            if status == 304:
+                self.stats.not_modified += 1
+                return
+            if 200 <= status < 300 or (r.expect_404 and status == 404):
+                self.cache.store(path, headers, r.mode)
+                return
+            if i < len(r.candidates) - 1:
+                self.stats.misses += 1
+        self.stats.errors += 1
+
+    async def run(self, steps: List[List[Req]]) -> None:
+        t0 = time.perf_counter()
+        try:
+            for step in steps:
+                await asyncio.gather(*(self.fetch(r) for r in step))
+        finally:
+            self.pool.close()
+        self.stats.page_times.append(time.perf_counter() - t0)
+
+
+async def run_route(url: str, steps: List[List[Req]], users: int, sessions: int, conns: int,
+                    warm: bool) -> Tuple[Stats, float]:
+    u = urlsplit(url)
+    host, port = u.hostname or "127.0.0.1", u.port or 80
+    base = (u.path or "").rstrip("/")
+    stats = Stats()
+
+    async def user() -> None:
+        cache = HttpCache()
+        for _ in range(sessions):
+            await Session(host, port, u.netloc, base, conns, cache if warm else HttpCache(), stats).run(steps)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(users)))
+    return stats, time.perf_counter() - t0
+
+
+# =============================
+# 리포트
+# =============================
+def pct(vals: List[float], p: float) -> float:
+    if not vals:
+        return 0.0
+    s = sorted(vals)
+    k = max(0, min(len(s) - 1, int(round(p / 100.0 * len(s) + 0.5)) - 1))
+    return s[k]
+
+
+def summarize(st: Stats, wall: float) -> Dict[str, Any]:
+    n = max(1, len(st.page_times))
+    return {
+        "sessions": len(st.page_times),
+        "requests_per_page": round(st.requests / n, 2),
+        "cache_hits_per_page": round(st.cache_hits / n, 2),
+        "not_modified_per_page": round(st.not_modified / n, 2),
+        "misses_per_page": round(st.misses / n, 2),
+        "errors": st.errors,
+        "wire_kib_per_page": round(st.wire_bytes / n / 1024, 2),
+        "body_kib_per_page": round(st.body_bytes / n / 1024, 2),
+        "page_ms": {f"p{p}": round(pct(st.page_times, p) * 1000, 2) for p in (50, 90, 99)},
+        "req_ms": {f"p{p}": round(pct(st.req_times, p) * 1000, 2) for p in (50, 90, 99)},
+        "req_per_s": round(st.requests / wall, 1) if wall else 0.0,
+        "mib_per_s": round(st.wire_bytes / wall / 1024 / 1024, 2) if wall else 0.0,
+    }
+
+
+def print_row(name: str, r: Dict[str, Any]) -> None:
+    print(f"  {name:<11} {r['requests_per_page']:6.1f} req  {r['misses_per_page']:4.1f} 404  "
+          f"{r['wire_kib_per_page']:9.1f} KiB ({r['body_kib_per_page']:9.1f} raw)  "
+          f"page p50 {r['page_ms']['p50']:8.1f} p90 {r['page_ms']['p90']:8.1f} p99 {r['page_ms']['p99']:8.1f} ms  "
+          f"req p50 {r['req_ms']['p50']:6.1f} p99 {r['req_ms']['p99']:6.1f} ms  "
+          f"{r['req_per_s']:8.1f} req/s {r['mib_per_s']:6.2f} MiB/s"
+          + (f"  ❌ errors {r['errors']}" if r["errors"] else ""))
+
+
+COMPARE_KEYS = (
+    ("requests", lambda r: r["requests_per_page"]),
+    ("KiB", lambda r: r["wire_kib_per_page"]),
+    ("page p50", lambda r: r["page_ms"]["p50"]),
+    ("page p90", lambda r: r["page_ms"]["p90"]),
+)
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    base = baseline.get("results", {})
+    print(f"\n[COMPARE] threshold +{threshold * 100:.0f}%")
+    print(f"  {'route':<11} " + " ".join(f"{k:>10}" for k, _ in COMPARE_KEYS))
+    regressions = 0
+    for name, cur in results.items():
+        b = base.get(name)
+        if not b:
+            print(f"  {name:<11} {'(new)':>10}")
+            continue
+        cells, flag = [], ""
+        for _k, get in COMPARE_KEYS:
+            ratio = get(cur) / get(b) if get(b) else 1.0
+            cells.append(f"{ratio:9.2f}x")
+            if ratio > 1 + threshold:
+                flag = "  ⚠ REGRESSION"
+        if flag:
+            regressions += 1
+        print(f"  {name:<11} " + " ".join(f"{c:>10}" for c in cells) + flag)
+    if regressions:
+        print(f"\n❌ {regressions}개 라우트가 기준보다 느리거나 더 많이 받음")
+        return 1
+    print("\n✅ 기준 대비 회귀 없음")
+    return 0
+
+
+def start_local_server(args: argparse.Namespace) -> str:
+    from serve_site import SiteConfig, make_server
+
+    cfg = SiteConfig(ROOT_DIR, base=args.base, gzip_on=not args.no_gzip, latency_ms=args.latency_ms,
+                     jitter_ms=args.jitter_ms, quiet=True)
+    httpd = make_server(cfg, "127.0.0.1", 0)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{httpd.server_address[1]}{cfg.base}"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--url", default="http://127.0.0.1:8000", help="사이트 주소 (repo prefix 포함)")
+    ap.add_argument("--serve", action="store_true", help="scripts/serve_site.py 를 같은 프로세스에서 띄워서 측정")
+    ap.add_argument("--base", default="", help="--serve 일 때 repo prefix (예: /wos-hub)")
+    ap.add_argument("--no-gzip", action="store_true", help="--serve 일 때 gzip 끄기")
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="--serve 일 때 응답 지연 (ms)")
+    ap.add_argument("--jitter-ms", type=float, default=0.0, help="--serve 일 때 지연 흔들림 ± (ms)")
+    ap.add_argument("--routes", default=",".join(ROUTE_NAMES), help="측정할 라우트 (쉼표)")
+    ap.add_argument("--users", type=int, default=10, help="동시 사용자 수")
+    ap.add_argument("--sessions", type=int, default=5, help="사용자당 페이지 로드 횟수")
+    ap.add_argument("--conns", type=int, default=6, help="세션당 동시 연결 수 (브라우저 기본 6)")
+    ap.add_argument("--warm", action="store_true", help="사용자별 HTTP 캐시 유지 (두 번째 로드부터 재방문)")
+    ap.add_argument("--lang", default="en", choices=("en", "ko", "ja"))
+    ap.add_argument("--hero", default="gatot", help="hero 라우트에 쓸 영웅 slug")
+    ap.add_argument("--max-images", type=int, default=0, help="단계당 이미지 최대 개수 (0 = 전부, lazy 무시)")
+    ap.add_argument("--save", default="", help="결과 저장 경로")
+    ap.add_argument("--compare", default="", help="비교할 baseline JSON")
+    ap.add_argument("--threshold", type=float, default=0.20, help="허용 회귀 비율 (0.20 = 20%%)")
+    args = ap.parse_args()
+
+    plans = build_plans(args.lang, args.hero, args.max_images)
+    wanted = [r.strip() for r in args.routes.split(",") if r.strip()]
+    unknown = [r for r in wanted if r not in plans]
+    if unknown:
+        print(f"❌ 모르는 라우트: {', '.join(unknown)} (가능: {', '.join(plans)})")
+        sys.exit(2)
+
+    url = start_local_server(args) if args.serve else args.url.rstrip("/")
+    print(f"[LOAD] {url}  users={args.users} sessions={args.sessions} conns={args.conns} "
+          f"{'warm' if args.warm else 'cold'}  lang={args.lang}")
+
+    results: Dict[str, Any] = {}
+    for name in wanted:
+        path, steps = plans[name]
+        stats, wall = asyncio.run(run_route(url, steps, args.users, args.sessions, args.conns, args.warm))
+        results[name] = {"path": path, "steps": len(steps), **summarize(stats, wall)}
+        print_row(name, results[name])
+
+    if args.save:
+        payload = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "params": {k: getattr(args, k) for k in ("users", "sessions", "conns", "warm", "lang", "hero",
+                                                     "max_images", "latency_ms", "jitter_ms", "no_gzip")},
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        print(f"\n[OK] {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        sys.exit(compare(results, baseline, args.threshold))
+
+    if any(r["errors"] for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
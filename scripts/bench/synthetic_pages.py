@@ -0,0 +1,163 @@
+# synthetic_pages.py
+# ------------------------------------------------------------
+# ✅ 벤치마크용 가짜 위키 페이지 생성기 (seed 고정 -> 항상 같은 HTML)
+#
+#   level_page(rows)             : 레벨 테이블 (1 / 30-1 / FC1 / FC5-1 ...) 이 rows 줄인 건물 페이지
+#   section_tree_page(depth, n)  : h2/h3/h4 + p/ul/table 이 깊게 중첩된 페이지
+#   image_page(n)                : <img src/data-src/srcset>, <a href=*.png>, background-image 가 n 개씩
+#
+# 단독 실행하면 파일로 떨궈준다 (브라우저/다른 도구로 확인용):
+#   python scripts/bench/synthetic_pages.py --out /tmp/synthetic --rows 50000 --images 5000
+# ------------------------------------------------------------
+
+import os
+import random
+import argparse
+from typing import List
+
+RESOURCES = ["Meat", "Wood", "Coal", "Iron", "Fire Crystal", "Refined Fire Crystal"]
+BUILDINGS = ["Furnace", "Embassy", "Research Center", "Infirmary", "Command Center", "Barricade"]
+
+
+def level_labels(n: int) -> List[str]:
+    """1..30, 30-1..30-4, FC1, FC1-1 .. 처럼 실제 위키 순서 그대로 n 개"""
+    out: List[str] = []
+    lv = 1
+    while len(out) < n and lv <= 30:
+        out.append(str(lv))
+        lv += 1
+    sub = 1
+    while len(out) < n and sub <= 4:
+        out.append(f"30-{sub}")
+        sub += 1
+    tier = 1
+    while len(out) < n:
+        out.append(f"FC{tier}")
+        for s in range(1, 5):
+            if len(out) >= n:
+                break
+            out.append(f"FC{tier}-{s}")
+        tier += 1
+    return out[:n]
+
+
+def _num(rng: random.Random) -> str:
+    v = rng.randint(1, 90_000_000)
+    return f"{v:,}" if rng.random() < 0.7 else str(v)
+
+
+def _time(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        return f"{rng.randint(0, 99):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+    return f"{rng.randint(1, 30)}d {rng.randint(0, 23)}h {rng.randint(0, 59)}m"
+
+
+def level_table_html(rows: int, rng: random.Random, shuffle: bool = True, img_end: str = ">") -> str:
+    """
+    img_end: 실제 위키는 <img ...> (닫지 않음). bs4 html.parser 는 닫히지 않은 빈 태그가 쌓일수록
+    종료 태그 처리가 느려지므로(행 수에 대해 제곱), soup 생성을 측정하지 않는 케이스는 "/>" 로 만든다.
+    """
+    labels = level_labels(rows)
+    if shuffle:
+        # 정렬(level_sort_key) 비용도 재도록 섞어 둔다
+        rng.shuffle(labels)
+    head = "".join(f"<th>{h}</th>" for h in ["Level", "Required Buildings", "Cost", "Build Time", "Power", "Bonus"])
+    body = []
+    for lb in labels:
+        req = f"{rng.choice(BUILDINGS)} Lv. {rng.randint(1, 30)}"
+        cost = " ".join(f"<span>{_num(rng)}</span> <img src=\"/assets/res/{r.lower().replace(' ', '_')}.png\" alt=\"{r}\"{img_end}"
+                        for r in rng.sample(RESOURCES, 2))
+        bonus = f"{rng.randint(1, 50)}.{rng.randint(0, 9)}%" if rng.random() < 0.5 else f"{rng.randint(1, 900)}.{rng.randint(0, 99)}"
+        body.append(
+            f"<tr><td>{lb}</td><td>{req}</td><td>{cost}</td><td>{_time(rng)}</td>"
+            f"<td>{_num(rng)}</td><td>{bonus}</td></tr>"
+        )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{''.join(body)}</tbody></table>"
+
+
+def _page(title: str, body: str) -> str:
+    return (
+        "<!DOCTYPE html><html><head>"
+        f"<title>{title} - Whiteout Survival Wiki</title>"
+        f"<meta name=\"description\" content=\"Synthetic {title} page for benchmarks.\">"
+        "</head><body>"
+        f"<h1>{title}</h1><p>Synthetic page generated for parser benchmarks.</p>"
+        f"{body}</body></html>"
+    )
+
+
+def level_page(rows: int, seed: int = 1, img_end: str = ">") -> str:
+    rng = random.Random(seed)
+    body = (
+        "<h2>Upgrade Costs</h2>"
+        f"{level_table_html(rows, rng, img_end=img_end)}"
+        "<h2>Build Time and Gems</h2><p>Speed up with gems.</p>"
+        f"{level_table_html(min(rows, 50), rng, shuffle=False, img_end=img_end)}"
+        "<h3>Notes</h3><ul><li>Fire Crystal levels unlock after 30.</li><li>Truegold later.</li></ul>"
+    )
+    return _page(f"Synthetic Building {rows}", body)
+
+
+def _section_tree(depth: int, breadth: int, rng: random.Random, level: int = 0, img_end: str = ">") -> str:
+    if depth <= 0:
+        return ""
+    tag = ["h2", "h3", "h4"][min(level, 2)]
+    parts = []
+    for i in range(breadth):
+        parts.append(
+            f"<{tag}>Section {level}-{i} {rng.choice(['Build Time', 'Stats', 'Gems', 'Overview'])}</{tag}>"
+            f"<div class=\"sec\"><p>{' '.join(rng.choice(RESOURCES) for _ in range(12))}</p>"
+            f"<ul>{''.join(f'<li>item {j} {_num(rng)}</li>' for j in range(4))}</ul>"
+            f"{level_table_html(5, rng, shuffle=False, img_end=img_end)}"
+            f"{_section_tree(depth - 1, breadth, rng, level + 1, img_end)}</div>"
+        )
+    return "".join(parts)
+
+
+def section_tree_page(depth: int = 5, breadth: int = 4, seed: int = 2, img_end: str = ">") -> str:
+    rng = random.Random(seed)
+    return _page(f"Synthetic Sections d{depth} b{breadth}", _section_tree(depth, breadth, rng, img_end=img_end))
+
+
+def image_page(n: int, seed: int = 3) -> str:
+    rng = random.Random(seed)
+    parts = []
+    for i in range(n):
+        name = rng.choice(["gatot", "molly", "item_icon", "logo", "sprite", "hero"])
+        ext = rng.choice(["png", "webp", "jpg", "svg"])
+        base = f"https://cdn.example.com/wp-content/uploads/2024/{i % 12 + 1:02d}/{name}_{i}"
+        r = rng.random()
+        if r < 0.4:
+            srcset = ", ".join(f"{base}-{w}.{ext} {w}w" for w in (320, 640, 1024))
+            parts.append(f"<img src=\"{base}.{ext}\" srcset=\"{srcset}\" alt=\"{name}\">")
+        elif r < 0.6:
+            parts.append(f"<img data-src=\"{base}.{ext}\" src=\"data:image/gif;base64,R0lGOD\" alt=\"lazy\">")
+        elif r < 0.75:
+            parts.append(f"<a href=\"{base}.{ext}?v={i}\">{name}</a>")
+        elif r < 0.9:
+            parts.append(f"<div style=\"background-image: url('{base}.{ext}')\">bg</div>")
+        else:
+            parts.append(f"<img src=\"/relative/{name}_{i}.{ext}\" data-srcset=\"{base}.{ext} 1x, {base}@2x.{ext} 2x\">")
+    return _page(f"Synthetic Images {n}", f"<div class=\"gallery\">{''.join(parts)}</div>")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", required=True, help="저장 폴더")
+    ap.add_argument("--rows", type=int, default=10000)
+    ap.add_argument("--images", type=int, default=2000)
+    ap.add_argument("--depth", type=int, default=5)
+    ap.add_argument("--breadth", type=int, default=4)
+    args = ap.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    pages = {
+        f"building_synthetic{args.rows}.html": level_page(args.rows),
+        f"building_sections_d{args.depth}.html": section_tree_page(args.depth, args.breadth),
+        f"images_{args.images}.html": image_page(args.images),
+    }
+    for fn, html in pages.items():
+        path = os.path.join(args.out, fn)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"[OK] {path} ({len(html)} bytes)")
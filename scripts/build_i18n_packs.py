@@ -0,0 +1,352 @@
+# build_i18n_packs.py
+# ------------------------------------------------------------
+# ✅ i18n 팩 컴파일러 (라우트별로 필요한 키만 + 언어별 1파일 + 내용 해시 파일명)
+#
+#   js/*.js, index.html 을 훑어서 라우트마다 쓰는 키를 모은 뒤
+#     i18n/{lang}/{common,buildings,calc,heroes}.json  ->  i18n/packs/{lang}/{route}.{hash}.json
+#   로 합쳐서(minify) 내보낸다. js/i18n.js 는 manifest 가 있으면 라우트 팩 1개만 받는다.
+#
+#   i18n/packs/manifest.json : { routes: [{ name, paths }], fallback, packs: { en: { home: "en/home.ab12cd34ef.json", ... } } }
+#
+# 사용법:
+#   python scripts/build_i18n_packs.py                         # 팩 생성 + 누락/미사용 키 요약
+#   python scripts/build_i18n_packs.py --report i18n_report.json
+#   python scripts/build_i18n_packs.py --check                 # 쓰지 않고 리포트만 (누락 있으면 exit 1)
+#
+# 키 찾는 규칙:
+#   - 따옴표 문자열 중 사전에 있는 키 그대로 ("buildings.res.food", data-i18n="..." 포함)
+#   - 동적 키: `hero.${slug}.name` / "hero." + slug + ".story" / tEnum("hero.rarity", v)
+#              ->  hero.*.name / hero.*.story / hero.rarity.*
+#     ${...} 자리는 점(.) 없는 한 구간. 변수 이름에 slug 가 들어가면 "엔티티 키" 로 본다.
+#   - /heroes/:slug 같은 상세 라우트는 엔티티 키를 slug 별 팩으로 나눈다 (hero.bradley 만).
+#     목록 라우트는 ROUTES 의 entity_keys 에 맞는 것만 (영웅 목록엔 이름만, 스토리 X).
+#   - 셸(app.core.js / app.js / i18n.js / index.html)의 키는 모든 팩에 들어간다.
+# ------------------------------------------------------------
+
+import os
+import re
+import sys
+import glob
+import json
+import hashlib
+import argparse
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))  # = scripts
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+LANGS = ("en", "ko", "ja")
+SOURCE_FILES = ("common.json", "buildings.json", "heroes.json", "calc.json", "tips.json")
+PACK_DIR = "i18n/packs"
+
+SHELL_SOURCES = ("js/app.core.js", "js/app.js", "js/i18n.js", "index.html")
+
+# app.js router() 와 같은 순서/경로. modules = 그 라우트를 그리는 js
+ROUTES: List[Dict[str, Any]] = [
+    {"name": "home", "paths": ["/"], "modules": []},
+    {"name": "buildings", "paths": ["/buildings"], "modules": ["js/buildings.js"], "entity_keys": r"\.meta\.title$"},
+    {"name": "building", "paths": ["/buildings/:slug"], "modules": ["js/buildings.js"]},
+    {"name": "heroes", "paths": ["/heroes"], "modules": ["js/heroes.js"], "entity_keys": r"\.name$"},
+    {"name": "hero", "paths": ["/heroes/:slug"], "modules": ["js/heroes.js"]},
+    {"name": "tools", "paths": ["/tools", "/tools/building-calculator"],
+     "modules": ["js/calculator.js", "js/building-calculator.js"]},
+    {"name": "tips", "paths": ["/tips", "/tips/:slug"], "modules": ["js/tips.js"]},
+    {"name": "coupons", "paths": ["/coupons", "/coupons/:slug"], "modules": ["js/coupons.js"]},
+    {"name": "lootbar", "paths": ["/lootbar"], "modules": []},
+]
+FALLBACK_ROUTE = "home"
+
+# --- 소스 스캔용 ---
+RE_QUOTED_KEY = re.compile(r"([\"'])([A-Za-z_][\w-]*(?:\.[\w-]+)+)\1")
+RE_EXPLICIT = re.compile(
+    r"(?:\b_?t\(|\btOpt\(|\btMaybe\(\s*_t\s*,|\bdata-i18n(?:-placeholder|-title|-aria-label)?=)\s*([\"'])([\w.-]*\w)\1(?!\s*\+)"
+)
+RE_TEMPLATE_KEY = re.compile(r"`([\w.-]*(?:\$\{[^{}`]+\}[\w.-]*)+)`")
+RE_CONCAT_KEY = re.compile(
+    r"([\"'])([A-Za-z_][\w-]*(?:\.[\w-]+)*\.)\1\s*\+\s*([\w$.]+(?:\[[^\]]*\])?)\s*(?:\+\s*([\"'])(\.[\w.-]*)\4)?"
+)
+RE_TEMPLATE_VAR = re.compile(r"\$\{([^{}`]+)\}")
+RE_ENUM_CALL = re.compile(r"\btEnum\(\s*([\"'])([A-Za-z_][\w.-]*)\1\s*,\s*([^,)]+)")   # CORE.tEnum("hero.rarity", v)
+
+
+def pjoin(*a: str) -> str:
+    return os.path.join(*a)
+
+
+# =============================
+# 사전 읽기
+# =============================
+def flatten(obj: Any, prefix: str = "", out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """중첩 키 {a:{b:"x"}} -> {"a.b": "x"} (평면 키는 그대로)"""
+    out = {} if out is None else out
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            flatten(v, f"{prefix}.{k}" if prefix else str(k), out)
+    else:
+        out[prefix] = obj
+    return out
+
+
+def load_lang(lang: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """(평면 사전, {키: 원본 파일명}) - i18n.js 와 같은 순서로 덮어씀"""
+    merged: Dict[str, Any] = {}
+    origin: Dict[str, str] = {}
+    for fn in SOURCE_FILES:
+        p = pjoin(ROOT_DIR, "i18n", lang, fn)
+        if not os.path.isfile(p):
+            continue
+        with open(p, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and isinstance(data.get(lang), dict):
+            data = data[lang]
+        for k, v in flatten(data).items():
+            merged[k] = v
+            origin[k] = fn
+    return merged, origin
+
+
+# =============================
+# 소스 스캔
+# =============================
+class KeyPattern:
+    """동적 키 하나: hero.${slug}.name -> ^hero\\.([^.]+)\\.name$"""
+
+    def __init__(self, parts: List[str], exprs: List[str], where: str):
+        self.parts = parts          # 고정 구간 (len = len(exprs) + 1)
+        self.exprs = exprs          # ${...} 안의 식
+        self.where = where
+        self.text = "*".join(parts)
+        self.regex = re.compile("^" + "([^.]+)".join(re.escape(p) for p in parts) + "$")
+        self.entity = bool(exprs) and "slug" in exprs[0].lower()
+
+    def usable(self) -> bool:
+        # 네임스페이스가 고정돼 있어야 함 (`${prefix}.${v}` 같은 건 못 푼다)
+        return bool(re.match(r"^[A-Za-z_][\w-]*\.", self.parts[0]))
+
+
+class SourceScan:
+    def __init__(self, rel: str):
+        self.rel = rel
+        self.literals: Set[str] = set()     # 따옴표 문자열 (키처럼 생긴 것 전부)
+        self.explicit: Set[str] = set()     # t("...") / data-i18n="..." 로 직접 부른 키
+        self.patterns: List[KeyPattern] = []
+        self.unresolved: List[str] = []
+
+        path = pjoin(ROOT_DIR, rel)
+        if not os.path.isfile(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            src = f.read()
+
+        self.literals = {m.group(2) for m in RE_QUOTED_KEY.finditer(src)}
+        self.explicit = {m.group(2) for m in RE_EXPLICIT.finditer(src)}
+
+        for m in RE_TEMPLATE_KEY.finditer(src):
+            body = m.group(1)
+            exprs = [e.strip() for e in RE_TEMPLATE_VAR.findall(body)]
+            parts = RE_TEMPLATE_VAR.split(body)[0::2]
+            self._add(KeyPattern(parts, exprs, f"{rel}:{src.count(chr(10), 0, m.start()) + 1}"))
+
+        for m in RE_CONCAT_KEY.finditer(src):
+            parts = [m.group(2), m.group(5) or ""]
+            self._add(KeyPattern(parts, [m.group(3)], f"{rel}:{src.count(chr(10), 0, m.start()) + 1}"))
+
+        for m in RE_ENUM_CALL.finditer(src):
+            self._add(KeyPattern([m.group(2) + ".", ""], [m.group(3).strip()], f"{rel}:{src.count(chr(10), 0, m.start()) + 1}"))
+
+    def _add(self, pat: KeyPattern) -> None:
+        if pat.usable():
+            self.patterns.append(pat)
+        elif "." in pat.text:
+            self.unresolved.append(f"{pat.where} `{pat.text}`")
+
+
+# =============================
+# 팩 만들기
+# =============================
+def route_keys(dictionary: Dict[str, Any], shell: List[SourceScan], modules: List[SourceScan],
+               route: Dict[str, Any]) -> Tuple[Set[str], Dict[str, Set[str]]]:
+    """(모든 slug 공통 키, {slug: 그 slug 전용 키}) - slug 분리/entity_keys 는 라우트 자기 모듈에만 적용"""
+    has_param = any(p.endswith("/:slug") for p in route["paths"])
+    entity_re = re.compile(route["entity_keys"]) if route.get("entity_keys") else None
+
+    base: Set[str] = set()
+    per_slug: Dict[str, Set[str]] = {}
+    for sc in shell + modules:
+        own = sc in modules
+        base |= {k for k in sc.literals if k in dictionary}
+        for pat in sc.patterns:
+            for k in dictionary:
+                m = pat.regex.match(k)
+                if not m:
+                    continue
+                if own and pat.entity and has_param:
+                    per_slug.setdefault(m.group(1), set()).add(k)
+                elif own and pat.entity and entity_re and not entity_re.search(k):
+                    continue
+                else:
+                    base.add(k)
+    return base, per_slug
+
+
+def minify(pack: Dict[str, Any]) -> bytes:
+    return json.dumps(pack, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def write_pack(lang: str, name: str, pack: Dict[str, Any], dry: bool) -> Tuple[str, int]:
+    raw = minify(pack)
+    digest = hashlib.sha1(raw).hexdigest()[:10]
+    rel = f"{lang}/{name}.{digest}.json"
+    if not dry:
+        path = pjoin(ROOT_DIR, PACK_DIR, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if not os.path.isfile(path):
+            with open(path, "wb") as f:
+                f.write(raw)
+    return rel, len(raw)
+
+
+def remove_stale(keep: Iterable[str]) -> int:
+    keep_abs = {os.path.abspath(pjoin(ROOT_DIR, PACK_DIR, r)) for r in keep}
+    n = 0
+    for p in glob.glob(pjoin(ROOT_DIR, PACK_DIR, "*", "*.json")):
+        if os.path.abspath(p) not in keep_abs:
+            os.remove(p)
+            n += 1
+    return n
+
+
+# =============================
+# 리포트
+# =============================
+def build_report(dicts: Dict[str, Dict[str, Any]], origins: Dict[str, Dict[str, str]],
+                 all_scans: List[SourceScan]) -> Dict[str, Any]:
+    all_keys: Set[str] = set().union(*(d.keys() for d in dicts.values()))
+
+    explicit: Set[str] = set().union(*(s.explicit for s in all_scans))
+    literals: Set[str] = set().union(*(s.literals for s in all_scans))
+    patterns = [p for s in all_scans for p in s.patterns]
+
+    used = {k for k in all_keys if k in literals or any(p.regex.match(k) for p in patterns)}
+
+    missing: Dict[str, List[str]] = {}
+    for lang, d in dicts.items():
+        # 코드에서 직접 부르는데 이 언어에 없음 / 다른 언어엔 있는데 이 언어엔 없음
+        miss = sorted((explicit - d.keys()) | ((all_keys - d.keys()) & used))
+        if miss:
+            missing[lang] = miss
+
+    unused = sorted(all_keys - used)
+    by_file: Dict[str, int] = {}
+    for k in unused:
+        for lang in LANGS:
+            fn = origins.get(lang, {}).get(k)
+            if fn:
+                by_file[fn] = by_file.get(fn, 0) + 1
+                break
+
+    return {
+        "keys": len(all_keys),
+        "used": len(used),
+        "missing": missing,
+        "unused": unused,
+        "unused_by_file": by_file,
+        "unresolved_dynamic": sorted({u for s in all_scans for u in s.unresolved}),
+    }
+
+
+def print_report(rep: Dict[str, Any], limit: int = 15) -> None:
+    print(f"\n[REPORT] keys {rep['keys']}  used {rep['used']}  unused {len(rep['unused'])}")
+    for lang in LANGS:
+        miss = rep["missing"].get(lang) or []
+        if not miss:
+            print(f"  ✅ {lang}: 누락 없음")
+            continue
+        more = f" … (+{len(miss) - limit})" if len(miss) > limit else ""
+        print(f"  ⚠ {lang}: 누락 {len(miss)}개 - {', '.join(miss[:limit])}{more}")
+    if rep["unused"]:
+        files = ", ".join(f"{fn} {n}" for fn, n in sorted(rep["unused_by_file"].items()))
+        print(f"  · 미사용 {len(rep['unused'])}개 ({files}) - 예: {', '.join(rep['unused'][:8])}")
+    for u in rep["unresolved_dynamic"]:
+        print(f"  · 못 푼 동적 키: {u}")
+
+
+# =============================
+# 실행
+# =============================
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--report", default="", help="누락/미사용 키 리포트 JSON 저장 경로")
+    ap.add_argument("--check", action="store_true", help="팩은 안 쓰고 리포트만 (누락 있으면 exit 1)")
+    ap.add_argument("--keep-stale", action="store_true", help="이전 해시 팩 파일을 지우지 않음")
+    args = ap.parse_args()
+
+    dicts: Dict[str, Dict[str, Any]] = {}
+    origins: Dict[str, Dict[str, str]] = {}
+    for lang in LANGS:
+        dicts[lang], origins[lang] = load_lang(lang)
+
+    cache: Dict[str, SourceScan] = {}
+
+    def scan(rel: str) -> SourceScan:
+        if rel not in cache:
+            cache[rel] = SourceScan(rel)
+        return cache[rel]
+
+    shell = [scan(r) for r in SHELL_SOURCES]
+
+    manifest: Dict[str, Any] = {
+        "routes": [{"name": r["name"], "paths": r["paths"]} for r in ROUTES],
+        "fallback": FALLBACK_ROUTE,
+        "packs": {lang: {} for lang in LANGS},
+    }
+    written: List[str] = []
+    total_full = {lang: len(minify(d)) for lang, d in dicts.items()}
+
+    print(f"[I18N] {', '.join(f'{l} {len(d)} keys' for l, d in dicts.items())}")
+    for route in ROUTES:
+        modules = [scan(m) for m in route["modules"] if m not in SHELL_SOURCES]
+        sizes: List[int] = []
+        n_entities = 0
+        for lang in LANGS:
+            d = dicts[lang]
+            base, per_slug = route_keys(d, shell, modules, route)
+            rel, size = write_pack(lang, route["name"], {k: d[k] for k in base}, args.check)
+            manifest["packs"][lang][route["name"]] = rel
+            written.append(rel)
+            sizes.append(size)
+            for slug, keys in sorted(per_slug.items()):
+                rel, _ = write_pack(lang, f"{route['name']}.{slug}", {k: d[k] for k in base | keys}, args.check)
+                manifest["packs"][lang][f"{route['name']}:{slug}"] = rel
+                written.append(rel)
+            n_entities = max(n_entities, len(per_slug))
+        ent = f"  (+{n_entities} slug 팩)" if n_entities else ""
+        print(f"  {route['name']:<10} " + "  ".join(
+            f"{lang} {s / 1024:6.1f} KiB ({s / max(1, total_full[lang]) * 100:4.1f}%)" for lang, s in zip(LANGS, sizes)) + ent)
+
+    all_js = sorted({os.path.relpath(p, ROOT_DIR).replace(os.sep, "/")
+                     for p in glob.glob(pjoin(ROOT_DIR, "js", "**", "*.js"), recursive=True)})
+    report = build_report(dicts, origins, [scan(r) for r in sorted(set(all_js) | set(SHELL_SOURCES))])
+    print_report(report)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"[OK] {args.report}")
+
+    if args.check:
+        sys.exit(1 if report["missing"] else 0)
+
+    path = pjoin(ROOT_DIR, PACK_DIR, "manifest.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    if not args.keep_stale:
+        n = remove_stale(written)
+        if n:
+            print(f"[CLEAN] 이전 팩 {n}개 삭제")
+    print(f"[OK] {os.path.relpath(path, ROOT_DIR)} ({len(written)} packs)")
+
+
+if __name__ == "__main__":
+    main()
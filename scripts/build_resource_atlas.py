@@ -0,0 +1,366 @@
+# build_resource_atlas.py
+# ------------------------------------------------------------
+# ✅ 공용 자원 레지스트리 + 아이콘 스프라이트 아틀라스 생성
+#
+#   data/resources.json              : 자원 id / 키 / 이름(ko,en,ja) / 아이콘 / 스프라이트 클래스
+#   assets/resources/item_icon_*.png : 건물 폴더마다 복사돼 있던 자원 아이콘의 공용 사본 (1벌)
+#   assets/sprites/resources.png     : 자원 아이콘 아틀라스  (+ .json 좌표 맵, .css)
+#
+#   pip install pillow
+#
+# 사용법:
+#   python scripts/build_resource_atlas.py
+#   python scripts/build_resource_atlas.py --strip-building-icons   # data/buildings/*.json 의 assets.resourceIcons 제거
+#   python scripts/build_resource_atlas.py --res-cell 64 --colors 0   # 팔레트 변환 없이
+#
+# - 건물 JSON 은 이미 costs / costColumns 를 자원 id(res_103 ...) 로 갖고 있으므로
+#   아이콘/이름은 data/resources.json 에서 id 로 찾는다 (건물마다 아이콘 맵을 둘 필요 없음).
+# - 아틀라스는 같은 크기 칸(cell) 격자. CSS 는 background-size/position 을 % 로 써서
+#   16px 이든 44px 이든 요소 크기에 맞춰 그대로 늘어난다.
+# - 내용이 같은 아이콘(해시 기준)은 한 칸만 쓴다.
+# ------------------------------------------------------------
+
+import os
+import re
+import sys
+import glob
+import json
+import math
+import hashlib
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))  # = scripts
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+LANGS = ("ko", "en", "ja")
+
+# 자원 id -> (calc 키, i18n 키, 아이콘 파일명)   id 는 건물 JSON costs 키와 같음
+RESOURCES: List[Tuple[str, str, str, str]] = [
+    ("res_100011", "food", "buildings.res.food", "item_icon_100011.png"),
+    ("res_103", "wood", "buildings.res.wood", "item_icon_103.png"),
+    ("res_104", "coal", "buildings.res.coal", "item_icon_104.png"),
+    ("res_105", "iron", "buildings.res.iron", "item_icon_105.png"),
+    ("res_100081", "fireCrystal", "buildings.res.fireCrystal", "item_icon_100081.png"),
+    ("res_100082", "refineStone", "buildings.res.refineStone", "item_icon_100082.png"),
+]
+
+REGISTRY_PATH = "data/resources.json"
+SHARED_ICON_DIR = "assets/resources"
+SPRITE_DIR = "assets/sprites"
+
+RE_JSON_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+RE_JSON_LITERAL = re.compile(r"[^\s,\]}]+")
+
+
+def pjoin(*a: str) -> str:
+    return os.path.join(*a)
+
+
+def site_path(rel: str) -> str:
+    return "/" + rel.replace(os.sep, "/").lstrip("/")
+
+
+def file_sha1(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def write_json(rel: str, obj: Any) -> None:
+    path = pjoin(ROOT_DIR, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def load_i18n(name: str) -> Dict[str, Dict[str, str]]:
+    out: Dict[str, Dict[str, str]] = {}
+    for lang in LANGS:
+        p = pjoin(ROOT_DIR, "i18n", lang, name)
+        try:
+            with open(p, "r", encoding="utf-8") as f:
+                table = json.load(f)
+        except (OSError, ValueError):
+            table = {}
+        # en 처럼 {"en": {...}} 로 한 번 감싼 파일도 있음
+        if isinstance(table.get(lang), dict) and len(table) == 1:
+            table = table[lang]
+        out[lang] = table
+    return out
+
+
+# =============================
+# 아이콘 모으기
+# =============================
+def find_resource_icon(filename: str) -> Optional[str]:
+    """assets/buildings/*/ 아래 같은 이름 사본 중 하나 (사본끼리 내용이 다르면 경고)"""
+    hits = sorted(glob.glob(pjoin(ROOT_DIR, "assets", "**", filename), recursive=True))
+    hits = [h for h in hits if os.path.relpath(h, ROOT_DIR).replace(os.sep, "/").split("/")[1] != "sprites"]
+    if not hits:
+        return None
+    digests = {file_sha1(h) for h in hits}
+    if len(digests) > 1:
+        print(f"⚠ {filename}: 사본 {len(hits)}개 중 내용이 다른 게 있음 ({len(digests)}종) -> 첫 번째 사용")
+    return hits[0]
+
+
+# =============================
+# 아틀라스
+# =============================
+def css_class(key: str) -> str:
+    return "i-" + re.sub(r"[^A-Za-z0-9_-]+", "-", key).strip("-")
+
+
+def pack_atlas(name: str, items: Dict[str, str], cell: int, colors: int = 0) -> Dict[str, Any]:
+    """
+    items: {키: 이미지 경로}. 같은 내용은 한 칸 공유.
+    colors > 0 이면 팔레트 PNG 로 줄인다 (아이콘은 256색이면 눈으로 차이 없음, 용량은 1/4 정도).
+    assets/sprites/{name}.png / .json / .css 를 쓰고 좌표 맵을 돌려준다.
+    """
+    from PIL import Image
+
+    slots: Dict[str, int] = {}      # 내용 해시 -> 칸 번호
+    key_slot: Dict[str, int] = {}
+    sources: List[str] = []
+    for key in sorted(items):
+        digest = file_sha1(items[key])
+        if digest not in slots:
+            slots[digest] = len(sources)
+            sources.append(items[key])
+        key_slot[key] = slots[digest]
+
+    n = max(1, len(sources))
+    cols = math.ceil(math.sqrt(n))
+    rows = math.ceil(n / cols)
+    sheet = Image.new("RGBA", (cols * cell, rows * cell), (0, 0, 0, 0))
+    for i, src in enumerate(sources):
+        with Image.open(src) as im:
+            im = im.convert("RGBA")
+            im.thumbnail((cell, cell), Image.LANCZOS)
+            x = (i % cols) * cell + (cell - im.width) // 2
+            y = (i // cols) * cell + (cell - im.height) // 2
+            sheet.paste(im, (x, y), im)
+
+    os.makedirs(pjoin(ROOT_DIR, SPRITE_DIR), exist_ok=True)
+    png_rel = f"{SPRITE_DIR}/{name}.png"
+    if colors > 0:
+        sheet = sheet.quantize(colors=min(colors, 256), method=Image.Quantize.FASTOCTREE)
+    sheet.save(pjoin(ROOT_DIR, png_rel), optimize=True)
+
+    def pct(i: int, count: int) -> str:
+        return "0%" if count <= 1 else f"{i / (count - 1) * 100:.4f}".rstrip("0").rstrip(".") + "%"
+
+    base_cls = f"wos-sprite-{name}"
+    sprites: Dict[str, Any] = {}
+    css = [
+        "/* generated by scripts/build_resource_atlas.py - 직접 고치지 말 것 */",
+        f".{base_cls}{{display:inline-block;background-image:url(\"{name}.png\");background-repeat:no-repeat;"
+        f"background-size:{cols * 100}% {rows * 100}%;}}",
+    ]
+    cls_slot: Dict[str, int] = {}
+    for key in sorted(key_slot):
+        i = key_slot[key]
+        c, r = i % cols, i // cols
+        cls = css_class(key)
+        if cls_slot.get(cls, i) != i:      # 파일명은 같은데 내용이 다른 아이콘
+            cls = f"{cls}-{i}"
+        sprites[key] = {"x": c * cell, "y": r * cell, "w": cell, "h": cell, "class": cls}
+        if cls not in cls_slot:
+            cls_slot[cls] = i
+            css.append(f".{base_cls}.{cls}{{background-position:{pct(c, cols)} {pct(r, rows)};}}")
+
+    with open(pjoin(ROOT_DIR, SPRITE_DIR, f"{name}.css"), "w", encoding="utf-8") as f:
+        f.write("\n".join(css) + "\n")
+
+    with open(pjoin(ROOT_DIR, png_rel), "rb") as f:
+        png_hash = hashlib.sha1(f.read()).hexdigest()[:10]
+    atlas = {
+        "image": site_path(png_rel),
+        "css": site_path(f"{SPRITE_DIR}/{name}.css"),
+        "className": base_cls,
+        "hash": png_hash,
+        "cell": cell,
+        "cols": cols,
+        "rows": rows,
+        "width": cols * cell,
+        "height": rows * cell,
+        "sprites": sprites,
+    }
+    write_json(f"{SPRITE_DIR}/{name}.json", atlas)
+    size = os.path.getsize(pjoin(ROOT_DIR, png_rel))
+    print(f"[OK] {png_rel}  {len(items)} icons -> {len(sources)} cells ({cols}x{rows} @ {cell}px, {size / 1024:,.1f} KiB)")
+    return atlas
+
+
+# =============================
+# 레지스트리 / 건물 JSON
+# =============================
+def build_registry(res_cell: int, colors: int) -> Dict[str, Any]:
+    names = load_i18n("buildings.json")
+    os.makedirs(pjoin(ROOT_DIR, SHARED_ICON_DIR), exist_ok=True)
+
+    items: Dict[str, str] = {}
+    resources: List[Dict[str, Any]] = []
+    for res_id, key, i18n_key, filename in RESOURCES:
+        src = find_resource_icon(filename)
+        icon = ""
+        if src:
+            shared = pjoin(ROOT_DIR, SHARED_ICON_DIR, filename)
+            if os.path.abspath(src) != os.path.abspath(shared):
+                with open(src, "rb") as fi, open(shared, "wb") as fo:
+                    fo.write(fi.read())
+            icon = site_path(f"{SHARED_ICON_DIR}/{filename}")
+            items[res_id] = shared
+        else:
+            print(f"⚠ 아이콘 없음: {res_id} ({filename})")
+        resources.append({
+            "id": res_id,
+            "key": key,
+            "name": {lang: names[lang].get(i18n_key) or key for lang in LANGS},
+            "icon": icon,
+        })
+
+    atlas = pack_atlas("resources", items, res_cell, colors)
+    for r in resources:
+        sp = atlas["sprites"].get(r["id"])
+        r["sprite"] = sp["class"] if sp else ""
+
+    return {
+        "atlas": {k: atlas[k] for k in ("image", "css", "className", "hash")},
+        "resources": resources,
+    }
+
+
+def _skip_ws(text: str, i: int) -> int:
+    while i < len(text) and text[i] in " \t\r\n":
+        i += 1
+    return i
+
+
+def _value_end(text: str, i: int) -> int:
+    """text[i] 에서 시작하는 JSON 값의 끝 위치 (문자열 안의 괄호는 무시)"""
+    if text[i] == '"':
+        return RE_JSON_STRING.match(text, i).end()
+    if text[i] not in "{[":
+        return RE_JSON_LITERAL.match(text, i).end()
+    depth = 0
+    while True:
+        ch = text[i]
+        if ch == '"':
+            i = RE_JSON_STRING.match(text, i).end()
+            continue
+        if ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+
+
+def _find_member(text: str, obj: int, key: str) -> Optional[Tuple[int, int, int]]:
+    """text[obj] == '{' 인 객체에서 key 멤버의 (키 시작, 값 시작, 값 끝)"""
+    i = _skip_ws(text, obj + 1)
+    while i < len(text) and text[i] != "}":
+        m = RE_JSON_STRING.match(text, i)
+        if not m:
+            return None
+        vs = _skip_ws(text, _skip_ws(text, m.end()) + 1)  # ':' 건너뜀
+        ve = _value_end(text, vs)
+        if json.loads(m.group(0)) == key:
+            return m.start(), vs, ve
+        i = _skip_ws(text, ve)
+        if text[i:i + 1] == ",":
+            i = _skip_ws(text, i + 1)
+    return None
+
+
+def remove_json_member(text: str, path: Tuple[str, ...]) -> Optional[str]:
+    """
+    path 의 멤버 하나만 잘라냄 (나머지 들여쓰기/키 순서/빈 줄은 원본 그대로)
+    없으면 None
+    """
+    pos = _skip_ws(text, 1 if text.startswith("\ufeff") else 0)
+    for key in path[:-1]:
+        hit = _find_member(text, pos, key)
+        if not hit or text[hit[1]] != "{":
+            return None
+        pos = hit[1]
+    hit = _find_member(text, pos, path[-1])
+    if not hit:
+        return None
+    ks, _vs, ve = hit
+
+    after = _skip_ws(text, ve)
+    if text[after:after + 1] == ",":
+        # 뒤에 멤버가 더 있음: 키 줄부터 쉼표까지 (줄 통째로 비면 그 줄도)
+        start, end = ks, after + 1
+        line = text.rfind("\n", 0, ks) + 1
+        if not text[line:ks].strip():
+            start = line
+            nl = text.find("\n", end)
+            if nl != -1 and not text[end:nl].strip():
+                end = nl + 1
+    else:
+        # 마지막 멤버: 앞 쉼표부터 값 끝까지
+        comma = text.rfind(",", pos, ks)
+        start, end = (comma if comma != -1 and not text[comma + 1:ks].strip() else ks), ve
+    return text[:start] + text[end:]
+
+
+def strip_building_icons() -> int:
+    """건물 JSON 의 assets.resourceIcons (건물별 아이콘 사본 경로) 제거 - 그 블록만 잘라내고 나머지 서식은 그대로"""
+    changed = 0
+    for p in sorted(glob.glob(pjoin(ROOT_DIR, "data", "buildings", "*.json"))):
+        if os.path.basename(p) == "index.json":
+            continue
+        with open(p, "r", encoding="utf-8") as f:
+            text = f.read()
+        data = json.loads(text)
+        assets = data.get("assets") if isinstance(data, dict) else None
+        if not isinstance(assets, dict) or "resourceIcons" not in assets:
+            continue
+
+        out = remove_json_member(text, ("assets", "resourceIcons"))
+        del assets["resourceIcons"]
+        if out is not None and not assets:
+            out = remove_json_member(out, ("assets",))
+            del data["assets"]
+        # 안전장치: 그 키만 빠지고 나머지 값은 같아야 함
+        if out is None or json.loads(out) != data:
+            print(f"⚠ {os.path.relpath(p, ROOT_DIR)}: assets.resourceIcons 를 잘라낼 수 없음 - 건너뜀")
+            continue
+
+        with open(p, "w", encoding="utf-8", newline="") as f:
+            f.write(out)
+        changed += 1
+        print(f"[OK] {os.path.relpath(p, ROOT_DIR)}: assets.resourceIcons 제거")
+    return changed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--res-cell", type=int, default=64, help="자원 아이콘 칸 크기(px) - 화면엔 16~18px")
+    ap.add_argument("--colors", type=int, default=256, help="아틀라스 팔레트 색 수 (0=원본 RGBA 그대로)")
+    ap.add_argument("--strip-building-icons", action="store_true", help="data/buildings/*.json 의 assets.resourceIcons 제거")
+    args = ap.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("❌ pillow 가 필요함: pip install pillow")
+        sys.exit(2)
+
+    registry = build_registry(args.res_cell, args.colors)
+    write_json(REGISTRY_PATH, registry)
+    print(f"[OK] {REGISTRY_PATH} ({len(registry['resources'])} resources)")
+
+    if args.strip_building_icons:
+        strip_building_icons()
+
+    print("✅ done")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,84 +1,145 @@
 import os
-import requests
+import sys
+import argparse
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
-# =========================
-# 설정
-# =========================
-BUILDING_NAME = "lancercamp"
-
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
 
-HTML_PATH = os.path.join(
-    BASE_DIR,
-    "..", "..", "isolate", "buildings",
-    f"building_{BUILDING_NAME}.html"
-)
+from http_client import make_session  # noqa: E402
+from run_metrics import METRICS, add_metrics_args, instrumented  # noqa: E402
+from buildings import parse_buildings_html_to_json as pb  # noqa: E402
+from canonicalize_asset_paths import reroot, site_path  # noqa: E402
 
-OUTPUT_HTML = os.path.join(
-    BASE_DIR,
-    "..", "..", "isolate", "buildings",
-    f"building_{BUILDING_NAME}_local.html"
-)
-
-OUTPUT_IMG_DIR = os.path.join(
-    BASE_DIR,
-    "..", "..", "assets", "buildings",
-    BUILDING_NAME, "img"
-)
-
-os.makedirs(OUTPUT_IMG_DIR, exist_ok=True)
+SESSION = make_session()
 
 # =========================
-# HTML 로드
+# 설정
 # =========================
-if not os.path.exists(HTML_PATH):
-    raise FileNotFoundError(f"❌ building HTML 파일을 찾을 수 없습니다:\n{HTML_PATH}")
-
-with open(HTML_PATH, "r", encoding="utf-8") as f:
-    soup = BeautifulSoup(f, "html.parser")
-
-downloaded = {}
-
-def download_image(url):
-    if not url or not url.startswith("http"):
-        return url
-
-    filename = os.path.basename(urlparse(url).path)
-    if not filename:
-        return url
-
-    save_path = os.path.join(OUTPUT_IMG_DIR, filename)
-
-    if filename not in downloaded:
-        print(f"📥 이미지 다운로드: {filename}")
-        r = requests.get(url, timeout=15)
-        r.raise_for_status()
-        with open(save_path, "wb") as f:
-            f.write(r.content)
-        downloaded[filename] = True
-
-    return os.path.relpath(
-        save_path,
-        os.path.dirname(OUTPUT_HTML)
-    ).replace("\\", "/")
+BUILDING_NAME = "lancercamp"
 
-# =========================
-# 이미지 로컬화
-# =========================
-for img in soup.find_all("img"):
-    src = img.get("src")
-    if src and src.startswith("http"):
-        img["src"] = download_image(src)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# =========================
-# 결과 저장
-# =========================
-with open(OUTPUT_HTML, "w", encoding="utf-8") as f:
-    f.write(str(soup))
 
-print("\n✅ 건물 처리 완료")
-print(f"- BUILDING: {BUILDING_NAME}")
-print(f"- HTML: {OUTPUT_HTML}")
-print(f"- IMG DIR: {OUTPUT_IMG_DIR}")
+def building_paths(building_name: str):
+    """building_{name}.html -> (입력 HTML, 로컬 HTML, 이미지 폴더)"""
+    html_path = os.path.join(
+        BASE_DIR,
+        "..", "..", "isolate", "buildings",
+        f"building_{building_name}.html"
+    )
+    output_html = os.path.join(
+        BASE_DIR,
+        "..", "..", "isolate", "buildings",
+        f"building_{building_name}_local.html"
+    )
+    output_img_dir = os.path.join(
+        BASE_DIR,
+        "..", "..", "assets", "buildings",
+        building_name, "img"
+    )
+    return html_path, output_html, output_img_dir
+
+
+def localize(building_name: str = BUILDING_NAME, json_out: str = pb.default_output_dir(),
+             out_root: str = "") -> dict:
+    """
+    이미지 로컬화 + 구조화 추출(레벨 테이블/섹션)을 같은 soup 한 번으로 처리.
+    _local.html 과 {json_out}/base/{name}.json 을 같이 만든다 (json_out="" 이면 JSON 생략).
+    """
+    HTML_PATH, OUTPUT_HTML, OUTPUT_IMG_DIR = building_paths(building_name)
+    # out_root: 결과물(_local.html / 이미지)을 저장소 대신 여기 아래 같은 구조로 (입력 HTML 은 그대로)
+    OUTPUT_HTML, OUTPUT_IMG_DIR = reroot(OUTPUT_HTML, out_root), reroot(OUTPUT_IMG_DIR, out_root)
+
+    os.makedirs(OUTPUT_IMG_DIR, exist_ok=True)
+    os.makedirs(os.path.dirname(OUTPUT_HTML), exist_ok=True)
+
+    # =========================
+    # HTML 로드
+    # =========================
+    if not os.path.exists(HTML_PATH):
+        raise FileNotFoundError(f"❌ building HTML 파일을 찾을 수 없습니다:\n{HTML_PATH}")
+
+    with METRICS.span("soup"):
+        with open(HTML_PATH, "r", encoding="utf-8") as f:
+            soup = BeautifulSoup(f, "html.parser")
+
+    downloaded = {}
+
+    def download_image(url):
+        if not url or not url.startswith("http"):
+            return url
+
+        filename = os.path.basename(urlparse(url).path)
+        if not filename:
+            return url
+
+        save_path = os.path.join(OUTPUT_IMG_DIR, filename)
+
+        if filename not in downloaded:
+            print(f"📥 이미지 다운로드: {filename}")
+            with METRICS.span("image_download"):
+                r = SESSION.get(url, timeout=15)
+                r.raise_for_status()
+            METRICS.count("http_bytes", len(r.content))
+            with METRICS.span("write_image"):
+                with open(save_path, "wb") as f:
+                    f.write(r.content)
+            downloaded[filename] = True
+        else:
+            METRICS.count("image_cache_hits")
+
+        # 사이트 루트 기준 "/assets/..." (JSON 과 _local.html 이 같은 표기, serve_site.py 로 미리보기)
+        return site_path(save_path, root=out_root)
+
+    # =========================
+    # 이미지 로컬화
+    # =========================
+    for img in soup.find_all("img"):
+        src = img.get("src")
+        if src and src.startswith("http"):
+            img["src"] = download_image(src)
+
+    # =========================
+    # 테이블/섹션 추출 (로컬화한 soup 그대로)
+    # =========================
+    with METRICS.span("extract"):
+        data = pb.parse_soup(soup)
+
+    # =========================
+    # 결과 저장
+    # =========================
+    with METRICS.span("write_html"):
+        with open(OUTPUT_HTML, "w", encoding="utf-8") as f:
+            f.write(str(soup))
+
+    entry = pb.save_page_json(OUTPUT_HTML, data, json_out) if json_out else None
+
+    print("\n✅ 건물 처리 완료")
+    print(f"- BUILDING: {building_name}")
+    print(f"- HTML: {OUTPUT_HTML}")
+    print(f"- IMG DIR: {OUTPUT_IMG_DIR}")
+    if entry:
+        print(f"- JSON: {pb.pjoin(json_out, entry['json'])}")
+
+    return {
+        "html": OUTPUT_HTML,
+        "img_dir": OUTPUT_IMG_DIR,
+        "images": sorted(downloaded),
+        "data": data,
+        "entry": entry,
+    }
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--name", default=BUILDING_NAME, help="건물 slug (building_{name}.html)")
+    ap.add_argument("--json-out", default=pb.default_output_dir(), help="JSON 출력 폴더 (parse_buildings_html_to_json 과 동일)")
+    ap.add_argument("--no-json", action="store_true", help="_local.html 만 만들고 JSON 은 생략")
+    add_metrics_args(ap)
+    args = ap.parse_args()
+
+    with instrumented("localize_building", args):
+        localize(args.name, "" if args.no_json else args.json_out)
@@ -18,12 +18,18 @@
 
 import os
 import re
+import sys
 import json
 import argparse
-from typing import Any, Dict, List, Optional, Tuple
+from array import array
+from json.encoder import encode_basestring
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from run_metrics import METRICS, add_metrics_args, instrumented  # noqa: E402
+
 
 # =============================
 # 경로 (핵심)
@@ -108,12 +114,101 @@ def level_sort_key(label: Any) -> Tuple[int, int, int, str]:
     return (2, 0, 0, s)
 
 
+# =============================
+# 테이블 모델 (열 단위 저장)
+# =============================
+class Table:
+    """
+    parse_html_table 결과.
+    예전엔 rows(행 리스트) + rows_as_objects(행마다 헤더 키를 반복한 dict) 를 둘 다 들고 있어서
+    5만 행짜리 테이블이면 메모리를 몇 배로 썼다. 지금은 열 리스트로만 저장하고
+    rows / rows_as_objects 는 JSON 쓸 때 한 행씩 만들어 흘려보낸다 (write_json).
+    JSON 모양은 예전 {"columns", "rows", "rows_as_objects"} 와 바이트 단위로 같다.
+    """
+    __slots__ = ("columns", "_cols", "_widths", "_row_order", "_obj_order")
+
+    def __init__(self, columns: List[str]):
+        self.columns: List[str] = [sys.intern(h) for h in columns]
+        self._cols: List[List[Any]] = []    # _cols[j][i] = i 번째 행의 j 번째 칸 (짧은 행은 "" 로 채움)
+        self._widths = array("I")           # 행별 원래 칸 수 (rows 로 내보낼 때 길이)
+        self._row_order: Optional[array] = None   # 정렬 결과 (None = 원래 순서)
+        self._obj_order: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self._widths)
+
+    def append(self, row: List[Any]) -> None:
+        n = len(self._widths)
+        cols = self._cols
+        while len(cols) < len(row):
+            cols.append([""] * n)
+        for j, v in enumerate(row):
+            cols[j].append(sys.intern(v) if type(v) is str else v)
+        for j in range(len(row), len(cols)):
+            cols[j].append("")
+        self._widths.append(len(row))
+
+    def row(self, i: int) -> List[Any]:
+        return [c[i] for c in self._cols[:self._widths[i]]]
+
+    def first_column(self, limit: int) -> List[Any]:
+        order = self._row_order if self._row_order is not None else range(len(self))
+        first = self._cols[0] if self._cols else []
+        return [first[i] for i in order[:limit] if self._widths[i]]
+
+    def object_keys(self) -> List[Tuple[str, int]]:
+        """rows_as_objects 의 (키, 열 번호). 빈 헤더는 col_{i}, 같은 헤더가 또 나오면 dict 처럼 뒤엣것이 이김"""
+        keys: Dict[str, int] = {}
+        for i, h in enumerate(self.columns):
+            keys[h if h else sys.intern(f"col_{i}")] = i
+        return list(keys.items())
+
+    def _cell(self, j: int, i: int) -> Any:
+        return self._cols[j][i] if j < len(self._cols) else ""
+
+    def iter_rows(self) -> Iterator[List[Any]]:
+        order = self._row_order if self._row_order is not None else range(len(self))
+        for i in order:
+            yield self.row(i)
+
+    def iter_objects(self) -> Iterator[Dict[str, Any]]:
+        if not (self.columns and len(self)):
+            return
+        keys = self.object_keys()
+        order = self._obj_order if self._obj_order is not None else range(len(self))
+        for i in order:
+            yield {k: self._cell(j, i) for k, j in keys}
+
+    def sort_by_level(self, level_col: Optional[str]) -> None:
+        """메인 테이블 정렬: rows 는 첫 칸, rows_as_objects 는 level_col 값 기준 (예전 동작 그대로)"""
+        n = len(self)
+        if not n:
+            return
+        if level_col and self.columns:
+            j = dict(self.object_keys()).get(level_col)
+            col = [self._cell(j, i) for i in range(n)] if j is not None else [""] * n
+            self._obj_order = array("I", sorted(range(n), key=lambda i: level_sort_key(col[i])))
+        first = self._cols[0]
+        self._row_order = array("I", sorted(range(n), key=lambda i: level_sort_key(first[i] if self._widths[i] else "")))
+
+    def view(self) -> "Table":
+        """같은 열 데이터를 공유하는 복사본 (정렬 순서만 따로 가짐)"""
+        t = Table.__new__(Table)
+        t.columns, t._cols, t._widths = self.columns, self._cols, self._widths
+        t._row_order, t._obj_order = self._row_order, self._obj_order
+        return t
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"columns": list(self.columns), "rows": list(self.iter_rows()),
+                "rows_as_objects": list(self.iter_objects())}
+
+
 # =============================
 # 테이블 파싱
 # =============================
 LEVEL_HINTS = {"lv", "level", "레벨", "단계", "tier"}
 
-def parse_html_table(table_tag) -> Dict[str, Any]:
+def parse_html_table(table_tag) -> Table:
     thead = table_tag.find("thead")
     headers: List[str] = []
 
@@ -131,7 +226,7 @@ def parse_html_table(table_tag) -> Dict[str, Any]:
     tbody = table_tag.find("tbody")
     trs = tbody.find_all("tr") if tbody else table_tag.find_all("tr")
 
-    rows: List[List[Any]] = []
+    table = Table(headers)
     for tr in trs:
         if tr.find_all("th") and not tr.find_all("td"):
             continue
@@ -141,32 +236,23 @@ def parse_html_table(table_tag) -> Dict[str, Any]:
         row = [smart_value(td.get_text(" ")) for td in tds]
         if all(str(x).strip() == "" for x in row):
             continue
-        rows.append(row)
+        table.append(row)
 
-    rows_as_objects: List[Dict[str, Any]] = []
-    if headers and rows:
-        for r in rows:
-            obj: Dict[str, Any] = {}
-            for i, h in enumerate(headers):
-                key = h if h else f"col_{i}"
-                obj[key] = r[i] if i < len(r) else ""
-            rows_as_objects.append(obj)
+    return table
 
-    return {"columns": headers, "rows": rows, "rows_as_objects": rows_as_objects}
-
-def score_table_as_main(table_info: Dict[str, Any]) -> int:
-    cols = [c.lower() for c in table_info.get("columns", []) if isinstance(c, str)]
-    rows = table_info.get("rows", []) or []
+def score_table_as_main(table: Table) -> int:
+    cols = [c.lower() for c in table.columns if isinstance(c, str)]
+    n_rows = len(table)
 
     score = 0
     if any(any(h in c for h in LEVEL_HINTS) for c in cols):
         score += 100
-    score += min(len(rows), 200)
+    score += min(n_rows, 200)
 
-    if rows:
-        first_col = [str(r[0]).strip().lower() for r in rows if r]
+    if n_rows:
+        first_col = [str(v).strip().lower() for v in table.first_column(20)]
         levelish = 0
-        for v in first_col[:20]:
+        for v in first_col:
             if re.fullmatch(r"\d+(-\d+)?", v) or re.fullmatch(r"fc\d+(-\d+)?", v):
                 levelish += 1
         score += levelish * 5
@@ -188,7 +274,9 @@ def is_time_related(title: str) -> bool:
     t = title.lower()
     return any(k in t for k in TIME_KEYWORDS)
 
-def extract_sections(soup: BeautifulSoup) -> List[Dict[str, Any]]:
+def extract_sections(soup: BeautifulSoup, parsed: Optional[Dict[int, Table]] = None) -> List[Dict[str, Any]]:
+    """parsed: {id(table 태그): Table} - parse_soup 이 이미 파싱한 테이블은 다시 파싱하지 않고 공유"""
+    parsed = parsed or {}
     sections: List[Dict[str, Any]] = []
     headings = soup.find_all(SECTION_TITLE_TAGS)
     if not headings:
@@ -208,13 +296,14 @@ def extract_sections(soup: BeautifulSoup) -> List[Dict[str, Any]]:
                 content_nodes.append(node)
             node = node.next_sibling
 
-        tables: List[Dict[str, Any]] = []
+        tables: List[Table] = []
         lists: List[List[str]] = []
         paragraphs: List[str] = []
 
         for n in content_nodes:
             for tbl in n.find_all("table"):
-                tables.append(parse_html_table(tbl))
+                t = parsed.get(id(tbl))
+                tables.append(t if t is not None else parse_html_table(tbl))
             for ul in n.find_all(["ul", "ol"]):
                 items = [clean_text(li.get_text(" ")) for li in ul.find_all("li")]
                 items = [it for it in items if it]
@@ -239,6 +328,110 @@ def extract_sections(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     return sections
 
 
+# =============================
+# JSON 스트리밍 저장
+# =============================
+def _float_json(v: float) -> str:
+    if v != v:
+        return "NaN"
+    if v == float("inf"):
+        return "Infinity"
+    if v == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(v)
+
+class _JsonStream:
+    """
+    json.dump(obj, f, ensure_ascii=False, indent=2) 와 같은 바이트를 쓰되
+    Table 은 행을 하나씩 만들어 바로 쓴다 (rows_as_objects 전체를 메모리에 만들지 않음).
+    """
+    FLUSH_AT = 1 << 16
+
+    def __init__(self, f):
+        self.f = f
+        self.buf: List[str] = []
+        self.size = 0
+
+    def put(self, s: str) -> None:
+        self.buf.append(s)
+        self.size += len(s)
+        if self.size >= self.FLUSH_AT:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buf:
+            self.f.write("".join(self.buf))
+            self.buf = []
+            self.size = 0
+
+    def value(self, v: Any, level: int) -> None:
+        if isinstance(v, str):
+            self.put(encode_basestring(v))
+        elif v is None:
+            self.put("null")
+        elif v is True:
+            self.put("true")
+        elif v is False:
+            self.put("false")
+        elif isinstance(v, int):
+            self.put(int.__repr__(v))
+        elif isinstance(v, float):
+            self.put(_float_json(v))
+        elif isinstance(v, dict):
+            self.items(iter(v.items()), level)
+        elif isinstance(v, (list, tuple)):
+            self.array(iter(v), level)
+        elif isinstance(v, Table):
+            self.items(iter((("columns", v.columns), ("rows", v.iter_rows()),
+                             ("rows_as_objects", v.iter_objects()))), level)
+        elif hasattr(v, "__next__"):
+            self.array(v, level)
+        else:
+            raise TypeError(f"Object of type {type(v).__name__} is not JSON serializable")
+
+    def array(self, it: Iterator[Any], level: int) -> None:
+        first = next(it, _END)
+        if first is _END:
+            self.put("[]")
+            return
+        pad = "\n" + "  " * (level + 1)
+        self.put("[" + pad)
+        self.value(first, level + 1)
+        for v in it:
+            self.put("," + pad)
+            self.value(v, level + 1)
+        self.put("\n" + "  " * level + "]")
+
+    def items(self, it: Iterator[Tuple[Any, Any]], level: int) -> None:
+        first = next(it, _END)
+        if first is _END:
+            self.put("{}")
+            return
+        pad = "\n" + "  " * (level + 1)
+        self.put("{")
+        sep = pad
+        for k, v in _chain_first(first, it):
+            if not isinstance(k, str):
+                k = json.dumps(k)
+                k = k[1:-1] if k.startswith('"') else k
+            self.put(sep + encode_basestring(k) + ": ")
+            self.value(v, level + 1)
+            sep = "," + pad
+        self.put("\n" + "  " * level + "}")
+
+_END = object()
+
+def _chain_first(first: Any, it: Iterator[Any]) -> Iterator[Any]:
+    yield first
+    yield from it
+
+def write_json(path: str, obj: Any) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        w = _JsonStream(f)
+        w.value(obj, 0)
+        w.flush()
+
+
 # =============================
 # 제목/설명
 # =============================
@@ -298,15 +491,28 @@ def filename_to_variant(filename: str) -> str:
 # HTML 1개 파싱
 # =============================
 def parse_one_html(html_path: str) -> Dict[str, Any]:
-    with open(html_path, "r", encoding="utf-8", errors="ignore") as f:
-        html = f.read()
+    with METRICS.span("read_html"):
+        with open(html_path, "r", encoding="utf-8", errors="ignore") as f:
+            html = f.read()
+    METRICS.count("html_bytes", len(html))
+
+    with METRICS.span("soup"):
+        soup = BeautifulSoup(html, "html.parser")
+    return parse_soup(soup)
 
-    soup = BeautifulSoup(html, "html.parser")
+def parse_soup(soup: BeautifulSoup) -> Dict[str, Any]:
+    """
+    이미 만들어진 soup 에서 바로 추출 (로컬라이저가 이미지 치환한 soup 을 그대로 넘겨서
+    _local.html 을 다시 읽고 파싱하지 않게 하려고 분리함)
+    """
     title = extract_title(soup)
     description = extract_description(soup)
 
-    table_tags = soup.find_all("table")
-    parsed_tables = [parse_html_table(t) for t in table_tags]
+    with METRICS.span("tables"):
+        table_tags = soup.find_all("table")
+        parsed_tables = [parse_html_table(t) for t in table_tags]
+    METRICS.count("tables", len(parsed_tables))
+    METRICS.count("table_rows", sum(len(t) for t in parsed_tables))
 
     main_table = None
     main_idx = None
@@ -318,35 +524,19 @@ def parse_one_html(html_path: str) -> Dict[str, Any]:
             main_table = tinfo
             main_idx = i
 
-    # 메인 테이블 정렬
-    def sort_main_table(mt: Dict[str, Any]) -> None:
-        cols = mt.get("columns", []) or []
-        rows_obj = mt.get("rows_as_objects", []) or []
-
+    # 메인 테이블 정렬 (섹션 쪽은 원래 순서 그대로라 view 로 나눠서 정렬)
+    if main_table is not None:
+        main_table = main_table.view()
         level_col = None
-        for c in cols:
+        for c in main_table.columns:
             cl = str(c).lower()
             if any(h in cl for h in LEVEL_HINTS):
                 level_col = c
                 break
+        main_table.sort_by_level(level_col)
 
-        if level_col and rows_obj:
-            try:
-                mt["rows_as_objects"] = sorted(rows_obj, key=lambda o: level_sort_key(o.get(level_col, "")))
-            except Exception:
-                pass
-
-        rows = mt.get("rows", []) or []
-        if rows:
-            try:
-                mt["rows"] = sorted(rows, key=lambda r: level_sort_key(r[0] if r else ""))
-            except Exception:
-                pass
-
-    if main_table:
-        sort_main_table(main_table)
-
-    sections = extract_sections(soup)
+    with METRICS.span("sections"):
+        sections = extract_sections(soup, {id(tag): t for tag, t in zip(table_tags, parsed_tables)})
 
     return {
         "title": title,
@@ -358,6 +548,68 @@ def parse_one_html(html_path: str) -> Dict[str, Any]:
     }
 
 
+# =============================
+# HTML 1개 -> JSON 1개 (+ index 항목)
+# =============================
+def build_one(html_path: str, output_dir: str, write: bool = True) -> Dict[str, Any]:
+    """
+    html 1개를 파싱해서 {variant}/{slug}.json 으로 저장하고 index.json 항목을 돌려준다.
+    write=False 면 파싱만 하고 저장은 안 함 (같은 slug 의 _local.html 이 이긴 경우).
+    """
+    with METRICS.span("parse_file", file=os.path.basename(html_path)):
+        data = parse_one_html(html_path)
+    return save_page_json(html_path, data, output_dir, write=write)
+
+def save_page_json(html_path: str, data: Dict[str, Any], output_dir: str, write: bool = True) -> Dict[str, Any]:
+    """parse_soup() 결과를 {variant}/{slug}.json 으로 저장하고 index.json 항목을 돌려준다."""
+    slug = filename_to_slug(html_path)
+    variant = filename_to_variant(html_path)
+
+    out = {
+        "slug": slug,
+        "variant": variant,
+        "source_html": os.path.basename(html_path),
+        **data,
+    }
+
+    out_path = pjoin(output_dir, variant, f"{slug}.json")
+    if write:
+        os.makedirs(pjoin(output_dir, variant), exist_ok=True)
+        with METRICS.span("write_json"):
+            write_json(out_path, out)
+        METRICS.count("files_written")
+
+    return {
+        "slug": slug,
+        "variant": variant,
+        "json": f"{variant}/{slug}.json",
+        "source_html": os.path.basename(html_path),
+        "title": out.get("title", ""),
+    }
+
+def write_index(output_dir: str, results_index: List[Dict[str, Any]]) -> str:
+    index_path = pjoin(output_dir, "index.json")
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump({"items": results_index}, f, ensure_ascii=False, indent=2)
+    return index_path
+
+def list_html_files(input_dir: str, include_local: bool = True) -> List[str]:
+    files = []
+    for fn in os.listdir(input_dir):
+        if not fn.lower().endswith(".html"):
+            continue
+        if (not include_local) and fn.lower().endswith("_local.html"):
+            METRICS.count("files_skipped")
+            continue
+        files.append(pjoin(input_dir, fn))
+    files.sort()
+    return files
+
+
+def default_output_dir() -> str:
+    return resolve_from_script_dir(pjoin("page", "data", "buildings"))
+
+
 # =============================
 # 폴더 전체 파싱
 # =============================
@@ -372,47 +624,19 @@ def run(input_dir: str, output_dir: str, include_local: bool = True) -> None:
     for variant in ["base", "firecrystal", "other"]:
         os.makedirs(pjoin(output_dir, variant), exist_ok=True)
 
-    files = []
-    for fn in os.listdir(input_dir):
-        if not fn.lower().endswith(".html"):
-            continue
-        if (not include_local) and fn.lower().endswith("_local.html"):
-            continue
-        files.append(pjoin(input_dir, fn))
-    files.sort()
+    files = list_html_files(input_dir, include_local)
 
     results_index: List[Dict[str, Any]] = []
 
     for html_path in files:
-        slug = filename_to_slug(html_path)
-        variant = filename_to_variant(html_path)
+        entry = build_one(html_path, output_dir)
+        results_index.append(entry)
 
-        data = parse_one_html(html_path)
-
-        out = {
-            "slug": slug,
-            "variant": variant,
-            "source_html": os.path.basename(html_path),
-            **data,
-        }
-
-        out_path = pjoin(output_dir, variant, f"{slug}.json")
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(out, f, ensure_ascii=False, indent=2)
-
-        results_index.append({
-            "slug": slug,
-            "variant": variant,
-            "json": f"{variant}/{slug}.json",
-            "source_html": os.path.basename(html_path),
-            "title": out.get("title", ""),
-        })
-
-        print(f"[OK] {os.path.basename(html_path)} -> {out_path}")
+        print(f"[OK] {os.path.basename(html_path)} -> {pjoin(output_dir, entry['json'])}")
 
-    index_path = pjoin(output_dir, "index.json")
-    with open(index_path, "w", encoding="utf-8") as f:
-        json.dump({"items": results_index}, f, ensure_ascii=False, indent=2)
+    with METRICS.span("write_index"):
+        index_path = write_index(output_dir, results_index)
+    METRICS.count("files_parsed", len(results_index))
 
     print(f"\n[OK] index.json 생성: {index_path}")
     print(f"총 {len(results_index)}개 처리 완료")
@@ -434,10 +658,12 @@ if __name__ == "__main__":
         help="(scripts/buildings 기준) JSON 출력 폴더: page/data/buildings",
     )
     parser.add_argument("--no-local", action="store_true", help="*_local.html 제외")
+    add_metrics_args(parser)
     args = parser.parse_args()
 
-    run(
-        input_dir=args.input,
-        output_dir=args.output,
-        include_local=not args.no_local
-    )
+    with instrumented("parse_buildings", args):
+        run(
+            input_dir=args.input,
+            output_dir=args.output,
+            include_local=not args.no_local
+        )
@@ -0,0 +1,285 @@
+# canonicalize_asset_paths.py
+# ------------------------------------------------------------
+# ✅ 빌드 단계: data/**/*.json + HTML 의 에셋 경로를 한 가지 형태로 통일 + 실제 파일 존재 확인
+#
+#   "../assets/heroes/ssr/s8/gatot/img/gatot.png"   ->  "/assets/heroes/ssr/s8/gatot/img/gatot.png"
+#   "./js/app.js", "css/app.css"                    ->  "/js/app.js", "/css/app.css"
+#   --base /wos-hub 이면                             ->  "/wos-hub/assets/..." (이미 붙어 있으면 그대로)
+#
+#   대상: data/**/*.json, index.html, 404.html, about.html, coupons/index.html,
+#         i18n/{lang}/index.html, data/tips/items/*.html
+#
+# 사용법:
+#   python scripts/canonicalize_asset_paths.py                  # 고치고 저장 (깨진 경로 있으면 아무것도 안 쓰고 exit 1)
+#   python scripts/canonicalize_asset_paths.py --check          # 쓰지 않고 검사만 (바꿀 게 있거나 깨진 경로면 exit 1)
+#   python scripts/canonicalize_asset_paths.py --base /wos-hub  # 프로젝트 페이지(repo prefix) 배포용
+#
+# 규칙:
+#   - 정적 파일 확장자(png/json/css/js ...)로 끝나는 로컬 참조만 본다. 페이지 링크(/heroes/x, /about.html)는 건드리지 않음
+#   - ./ ../ / 로 시작하거나 첫 구간이 assets|data|css|js|i18n 이면 "사이트 루트 기준" 으로 본다
+#     (런타임 heroes.js normalizeAssetPath 와 같은 해석: ../assets/x == /assets/x)
+#   - ssr/ahmose.json 같은 index 내부 상대 경로(첫 구간이 루트 폴더 아님)는 건드리지 않음
+#   - 외부 URL(http, //, data:) / #hash 는 무시
+#   - JSON 은 문자열 토큰만 바꿔 끼워서 원래 들여쓰기/키 순서가 그대로 남는다
+#   - 기본 --base 는 "" (CNAME = 커스텀 도메인 루트 배포)
+#   - 로컬화 스크립트(heroes/download_images, buildings/download_building*)는 site_path() 로
+#     처음부터 "/assets/..." 를 쓰고, watch_isolate / crawl_wiki 는 방금 쓴 JSON 에 fix_json_files() 를 돌린다
+# ------------------------------------------------------------
+
+import os
+import re
+import sys
+import glob
+import json
+import argparse
+from urllib.parse import unquote
+from typing import Dict, List, Optional, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))  # = scripts
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+ASSET_ROOTS = ("assets", "data", "css", "js", "i18n")
+STATIC_EXT = {
+    ".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg", ".avif", ".ico",
+    ".css", ".js", ".mjs", ".json", ".woff", ".woff2", ".ttf", ".mp4", ".webm",
+}
+
+JSON_GLOBS = ("data/**/*.json",)
+HTML_GLOBS = (
+    "index.html",
+    "404.html",
+    "about.html",
+    "coupons/index.html",
+    "i18n/*/index.html",
+    "data/tips/items/*.html",
+)
+
+RE_EXTERNAL = re.compile(r"^(?:[a-z][a-z0-9+.-]*:|//|#)", re.I)
+RE_JSON_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+RE_HTML_ATTR = re.compile(r"""(\b(?:src|href|poster|data-src|content)\s*=\s*)(["'])(.*?)\2""", re.I | re.S)
+RE_HTML_SRCSET = re.compile(r"""(\b(?:srcset|data-srcset)\s*=\s*)(["'])(.*?)\2""", re.I | re.S)
+RE_CSS_URL = re.compile(r"""(url\(\s*)(["']?)([^"')]+)\2(\s*\))""", re.I)
+
+
+# =============================
+# 경로 규칙
+# =============================
+def normalize_base(base: str) -> str:
+    b = (base or "").strip().strip("/")
+    return "/" + b if b else ""
+
+
+def canonical(ref: str, base: str) -> Optional[Tuple[str, str]]:
+    """에셋 참조면 (정규화된 참조, 루트 기준 파일 경로), 아니면 None"""
+    s = (ref or "").strip()
+    if not s or RE_EXTERNAL.match(s):
+        return None
+
+    cut = len(s)
+    for ch in ("?", "#"):
+        i = s.find(ch)
+        if i != -1:
+            cut = min(cut, i)
+    path, suffix = s[:cut], s[cut:]
+
+    rooted = path.startswith(("/", "./", "../"))
+    if base and (path == base or path.startswith(base + "/")):
+        path = path[len(base):]
+
+    rel = path
+    while True:
+        if rel.startswith("./"):
+            rel = rel[2:]
+        elif rel.startswith("../"):
+            rel = rel[3:]
+        elif rel.startswith("/"):
+            rel = rel[1:]
+        else:
+            break
+
+    if not rel or (not rooted and rel.split("/", 1)[0] not in ASSET_ROOTS):
+        return None
+    if os.path.splitext(rel)[1].lower() not in STATIC_EXT:
+        return None
+
+    return f"{base}/{rel}{suffix}", unquote(rel)
+
+
+def site_path(abs_path: str, base: str = "", root: str = "") -> str:
+    """저장한 에셋 파일 -> 정규 참조 ("/assets/...")  emitter 들이 처음부터 이 형태로 쓴다 (root: 사이트 루트, 기본 저장소)"""
+    rel = os.path.relpath(os.path.abspath(abs_path), root or ROOT_DIR).replace(os.sep, "/")
+    return f"{normalize_base(base)}/{rel}"
+
+
+def reroot(path: str, out_root: str) -> str:
+    """저장소 안 출력 경로를 out_root 아래 같은 상대 위치로 (벤치처럼 작업 트리를 건드리면 안 될 때)"""
+    if not out_root:
+        return path
+    return os.path.join(out_root, os.path.relpath(os.path.abspath(path), ROOT_DIR))
+
+
+class Scan:
+    """파일 1개 결과: 바뀐 참조 수 + 깨진 참조 목록"""
+
+    def __init__(self, rel: str, root: str = ""):
+        self.rel = rel
+        self.root = root or ROOT_DIR  # 참조 대상 파일을 찾을 사이트 루트
+        self.refs = 0
+        self.changed = 0
+        self.dangling: List[str] = []
+        self.text_out = ""
+
+    def visit(self, ref: str, base: str) -> str:
+        hit = canonical(ref, base)
+        if not hit:
+            return ref
+        out, target = hit
+        self.refs += 1
+        if not os.path.isfile(os.path.join(self.root, target)):
+            self.dangling.append(ref)
+            return ref
+        if out != ref:
+            self.changed += 1
+        return out
+
+
+# =============================
+# JSON / HTML
+# =============================
+def scan_json(rel: str, text: str, base: str, root: str = "") -> Scan:
+    sc = Scan(rel, root)
+
+    def repl(m: "re.Match[str]") -> str:
+        tok = m.group(0)
+        try:
+            val = json.loads(tok)
+        except ValueError:
+            return tok
+        out = sc.visit(val, base)
+        return tok if out == val else json.dumps(out, ensure_ascii=False)
+
+    sc.text_out = RE_JSON_STRING.sub(repl, text)
+    # 안전장치: 값 말고 구조가 바뀌면 안 됨
+    if sc.changed:
+        json.loads(sc.text_out)
+    return sc
+
+
+def scan_html(rel: str, text: str, base: str) -> Scan:
+    sc = Scan(rel)
+
+    def attr(m: "re.Match[str]") -> str:
+        return m.group(1) + m.group(2) + sc.visit(m.group(3), base) + m.group(2)
+
+    def srcset(m: "re.Match[str]") -> str:
+        parts = []
+        for item in m.group(3).split(","):
+            bits = item.strip().split(None, 1)
+            if not bits:
+                continue
+            bits[0] = sc.visit(bits[0], base)
+            parts.append(" ".join(bits))
+        return m.group(1) + m.group(2) + ", ".join(parts) + m.group(2)
+
+    def css_url(m: "re.Match[str]") -> str:
+        return m.group(1) + m.group(2) + sc.visit(m.group(3), base) + m.group(2) + m.group(4)
+
+    out = RE_HTML_SRCSET.sub(srcset, text)
+    out = RE_HTML_ATTR.sub(attr, out)
+    sc.text_out = RE_CSS_URL.sub(css_url, out)
+    return sc
+
+
+def fix_json_files(paths: List[str], base: str = "", root: str = "") -> List[Scan]:
+    """
+    파이프라인(watch_isolate / crawl_wiki)이 방금 쓴 JSON 만 정규화해서 다시 저장.
+    깨진 경로는 그대로 두고 Scan.dangling 으로 돌려준다 (로그는 호출한 쪽에서)
+    root: 에셋이 저장된 사이트 루트 (기본 저장소, 벤치는 임시 폴더)
+    """
+    base = normalize_base(base)
+    root = root or ROOT_DIR
+    scans: List[Scan] = []
+    for p in paths:
+        if not p or not os.path.isfile(p):
+            continue
+        with open(p, "r", encoding="utf-8") as f:
+            text = f.read()
+        sc = scan_json(os.path.relpath(p, root).replace(os.sep, "/"), text, base, root)
+        if sc.text_out != text:
+            with open(p, "w", encoding="utf-8", newline="") as f:
+                f.write(sc.text_out)
+        scans.append(sc)
+    return scans
+
+
+def report(scans: List[Scan]) -> None:
+    """fix_json_files 결과 한 줄 요약 (고친 게 없고 깨진 것도 없으면 조용히)"""
+    fixed = sum(sc.changed for sc in scans)
+    if fixed:
+        print(f"[ASSETS] 경로 {fixed}개 정규화 ({sum(1 for sc in scans if sc.changed)} files)")
+    for sc in scans:
+        for ref in sc.dangling:
+            print(f"  ❌ {sc.rel}: {ref} (없는 파일)")
+
+
+def collect_files() -> List[Tuple[str, str]]:
+    files: List[Tuple[str, str]] = []
+    seen = set()
+    for kind, patterns in (("json", JSON_GLOBS), ("html", HTML_GLOBS)):
+        for pat in patterns:
+            for p in sorted(glob.glob(os.path.join(ROOT_DIR, pat), recursive=True)):
+                rel = os.path.relpath(p, ROOT_DIR).replace(os.sep, "/")
+                if rel not in seen:
+                    seen.add(rel)
+                    files.append((kind, rel))
+    return files
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--base", default="", help='repo prefix (예: "/wos-hub"). 커스텀 도메인이면 비워둠')
+    ap.add_argument("--check", action="store_true", help="쓰지 않고 검사만 (바꿀 게 있으면 exit 1)")
+    args = ap.parse_args()
+
+    base = normalize_base(args.base)
+    scans: List[Scan] = []
+    originals: Dict[str, str] = {}
+
+    for kind, rel in collect_files():
+        with open(os.path.join(ROOT_DIR, rel), "r", encoding="utf-8") as f:
+            text = f.read()
+        originals[rel] = text
+        scans.append(scan_json(rel, text, base) if kind == "json" else scan_html(rel, text, base))
+
+    total_refs = sum(sc.refs for sc in scans)
+    dangling = [(sc.rel, ref) for sc in scans for ref in sc.dangling]
+    dirty = [sc for sc in scans if sc.text_out != originals[sc.rel]]
+
+    print(f"[ASSETS] files {len(scans)}  refs {total_refs}  to rewrite {sum(sc.changed for sc in scans)} "
+          f"in {len(dirty)} files  base={base or '/'}")
+
+    # 깨진 경로가 하나라도 있으면 아무것도 쓰지 않는다
+    if dangling:
+        for rel, ref in dangling:
+            print(f"  ❌ {rel}: {ref}")
+        print(f"\n❌ 없는 파일을 가리키는 경로 {len(dangling)}개 - 저장 안 함")
+        sys.exit(1)
+
+    for sc in dirty:
+        print(f"  {'(check) ' if args.check else ''}{sc.rel}: {sc.changed}")
+
+    if args.check:
+        if dirty:
+            print("\n⚠ 정규화 안 된 경로가 있음 (python scripts/canonicalize_asset_paths.py 로 고치기)")
+            sys.exit(1)
+        print("\n✅ 모든 에셋 경로가 정규 형태이고 파일이 존재함")
+        return
+
+    for sc in dirty:
+        with open(os.path.join(ROOT_DIR, sc.rel), "w", encoding="utf-8", newline="") as f:
+            f.write(sc.text_out)
+    print(f"\n[OK] {len(dirty)} files")
+
+
+if __name__ == "__main__":
+    main()
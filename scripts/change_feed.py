@@ -0,0 +1,450 @@
+# change_feed.py
+# ------------------------------------------------------------
+# ✅ 다시 빌드한 data/ 를 이전 빌드와 "구조적으로" 비교해서
+#    1) data/latest.json 에 새 소식 항목을 자동으로 추가하고
+#    2) 실제로 바뀐 파일 목록(배포용) + data/changes.json(sw.js 캐시 무효화용) 을 만든다.
+#
+#   건물 data/buildings/{slug}.json      : 레벨 추가/삭제, 비용(자원/시간) 변경, 신규 건물
+#   영웅 data/heroes/{rarity}/{slug}.json : 신규 영웅, 스킬 추가/변경, 스탯 변경
+#   나머지 data/, assets/ 파일           : 내용이 바뀐 것만 변경 목록에 (소식 항목은 X)
+#
+# 사용법:
+#   python scripts/change_feed.py                        # 작업 트리 vs git HEAD
+#   python scripts/change_feed.py --prev origin/main     # 배포된 브랜치와 비교
+#   python scripts/change_feed.py --prev /tmp/site_prev  # 이전 빌드 폴더(사이트 루트)와 비교
+#   python scripts/change_feed.py --dry-run              # 아무것도 안 쓰고 결과만 출력
+#   python scripts/change_feed.py --list-out changed.txt # 배포할 파일 목록 ("A\tpath" / "M\tpath" / "D\tpath")
+#
+# - 바이트는 달라도 JSON 내용이 같으면(재빌드로 포맷만 바뀐 경우) 변경으로 치지 않는다.
+# - 같은 변경으로 다시 돌려도 latest.json / changes.json 에 중복으로 쌓이지 않는다.
+# - sw.js 는 data/changes.json 의 build 가 바뀌면 history 에 적힌 경로만 캐시에서 지운다.
+# ------------------------------------------------------------
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+import datetime
+import subprocess
+from typing import Any, Dict, List, Optional, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))  # = scripts
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+WATCH_DIRS = ("data", "assets")
+LATEST_PATH = "data/latest.json"
+CHANGES_PATH = "data/changes.json"
+SELF_OUTPUTS = {LATEST_PATH, CHANGES_PATH}   # 이 스크립트가 쓰는 파일은 비교 대상에서 제외
+
+BUILDING_PHASES = ("base", "firecrystal", "firecrystalPlus", "firecrystalUnknown")
+HISTORY_KEEP = 20
+
+LANGS = ("ko", "en", "ja")
+CATEGORY = {
+    "buildings": {"ko": "건물", "en": "Buildings", "ja": "建物"},
+    "heroes": {"ko": "영웅", "en": "Heroes", "ja": "英雄"},
+}
+# 변경 종류 -> 괄호 안 문구
+REASONS = {
+    "levels_added": {"ko": "레벨 추가", "en": "Levels Added", "ja": "レベル追加"},
+    "levels_removed": {"ko": "레벨 삭제", "en": "Levels Removed", "ja": "レベル削除"},
+    "costs_changed": {"ko": "비용 변경", "en": "Costs Changed", "ja": "コスト変更"},
+    "skills_added": {"ko": "스킬 추가", "en": "New Skills", "ja": "スキル追加"},
+    "skills_changed": {"ko": "스킬 변경", "en": "Skills Changed", "ja": "スキル変更"},
+    "stats_changed": {"ko": "스탯 변경", "en": "Stats Changed", "ja": "ステータス変更"},
+}
+TITLE_UPDATED = {"ko": "{name} 업데이트 ({reasons})", "en": "{name} Updated ({reasons})", "ja": "{name}アップデート（{reasons}）"}
+TITLE_NEW = {
+    "buildings": {"ko": "신규 건물 추가: {name}", "en": "New Building Added: {name}", "ja": "新建物追加：{name}"},
+    "heroes": {"ko": "신규 영웅 추가: {name}", "en": "New Hero Added: {name}", "ja": "新英雄追加：{name}"},
+}
+REASON_SEP = {"ko": ", ", "en": ", ", "ja": "・"}
+
+
+def resolve_from_root(p: str) -> str:
+    return p if os.path.isabs(p) else os.path.abspath(os.path.join(ROOT_DIR, p))
+
+
+def load_json_bytes(raw: Optional[bytes]) -> Any:
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw.decode("utf-8-sig"))
+    except Exception:
+        return None
+
+
+# =============================
+# 이전 빌드 (git ref 또는 폴더)
+# =============================
+def _git(*args: str, check: bool = True) -> bytes:
+    return subprocess.run(["git", *args], cwd=ROOT_DIR, capture_output=True, check=check).stdout
+
+
+class PrevBuild:
+    """이전 빌드에서 파일 읽기 + 현재 작업 트리와 달라진 경로 찾기"""
+
+    def __init__(self, spec: str):
+        self.dir = resolve_from_root(spec) if os.path.isdir(resolve_from_root(spec)) else None
+        self.ref = None if self.dir else spec
+        if self.ref:
+            _git("rev-parse", "--verify", "--quiet", f"{self.ref}^{{commit}}")
+
+    def label(self) -> str:
+        return self.dir or f"git:{self.ref}"
+
+    def read(self, rel: str) -> Optional[bytes]:
+        if self.dir:
+            p = os.path.join(self.dir, rel)
+            if not os.path.isfile(p):
+                return None
+            with open(p, "rb") as f:
+                return f.read()
+        r = subprocess.run(["git", "show", f"{self.ref}:{rel}"], cwd=ROOT_DIR, capture_output=True)
+        return r.stdout if r.returncode == 0 else None
+
+    def changed(self) -> Dict[str, str]:
+        """{상대경로: "A"|"M"|"D"} (바이트 기준)"""
+        if self.dir:
+            return self._changed_dir()
+        out: Dict[str, str] = {}
+        # 추적 중인 파일: ref 와 작업 트리 비교
+        raw = _git("diff", "--name-status", "--no-renames", "-z", self.ref, "--", *WATCH_DIRS)
+        parts = raw.decode("utf-8").split("\0")
+        for st, rel in zip(parts[0::2], parts[1::2]):
+            if rel:
+                out[rel] = st[:1] if st[:1] in ("A", "D") else "M"
+        # 아직 add 안 한 새 파일
+        raw = _git("ls-files", "--others", "--exclude-standard", "-z", "--", *WATCH_DIRS)
+        for rel in raw.decode("utf-8").split("\0"):
+            if rel:
+                out[rel] = "A"
+        return out
+
+    def _changed_dir(self) -> Dict[str, str]:
+        def walk(base: str) -> Dict[str, int]:
+            files: Dict[str, int] = {}
+            for d in WATCH_DIRS:
+                for dp, _dns, fns in os.walk(os.path.join(base, d)):
+                    for fn in fns:
+                        p = os.path.join(dp, fn)
+                        files[os.path.relpath(p, base).replace(os.sep, "/")] = os.path.getsize(p)
+            return files
+
+        old, new = walk(self.dir), walk(ROOT_DIR)
+        out: Dict[str, str] = {}
+        for rel, size in new.items():
+            if rel not in old:
+                out[rel] = "A"
+            elif size != old[rel] or file_sha1(os.path.join(ROOT_DIR, rel)) != file_sha1(os.path.join(self.dir, rel)):
+                out[rel] = "M"
+        for rel in old.keys() - new.keys():
+            out[rel] = "D"
+        return out
+
+
+def file_sha1(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# =============================
+# 구조 비교
+# =============================
+def row_key(row: Dict[str, Any]) -> str:
+    info = row.get("levelInfo") or {}
+    return str(info.get("key") or row.get("level") or "").strip()
+
+
+def building_rows(data: Any) -> Dict[str, Dict[str, Any]]:
+    rows: Dict[str, Dict[str, Any]] = {}
+    if not isinstance(data, dict):
+        return rows
+    for phase in BUILDING_PHASES:
+        block = data.get(phase)
+        if not isinstance(block, dict):
+            continue
+        for r in block.get("rows") or []:
+            if isinstance(r, dict) and row_key(r):
+                rows[f"{phase}:{row_key(r)}"] = r
+    return rows
+
+
+def _row_cost(r: Dict[str, Any]) -> Tuple[Any, Any]:
+    return r.get("costs") or {}, (r.get("time") or {}).get("seconds")
+
+
+def diff_building(old: Any, new: Any) -> Dict[str, Any]:
+    a, b = building_rows(old), building_rows(new)
+    added = [k.split(":", 1)[1] for k in b if k not in a]
+    removed = [k.split(":", 1)[1] for k in a if k not in b]
+    costs = [k.split(":", 1)[1] for k in b if k in a and _row_cost(a[k]) != _row_cost(b[k])]
+    reasons = []
+    if added:
+        reasons.append("levels_added")
+    if removed:
+        reasons.append("levels_removed")
+    if costs:
+        reasons.append("costs_changed")
+    return {"reasons": reasons, "levels_added": added, "levels_removed": removed, "costs_changed": costs}
+
+
+SKILL_FIELDS = ("id", "name", "description", "mode")   # 비교할 스킬 내용 (icon 은 제외)
+RE_ASSET_PREFIX = re.compile(r"^(?:\.{1,2}/|/)+(?=(?:assets|data)/)")
+
+
+def _skill_key(s: Dict[str, Any]) -> str:
+    return str(s.get("id") or s.get("name") or "")
+
+
+def _skill_content(s: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(s.get(k) for k in SKILL_FIELDS)
+
+
+def normalize_assets(v: Any) -> Any:
+    """비교용: "../assets/x", "./assets/x", "/assets/x" 를 같은 값으로 (경로 표기만 바뀐 건 변경 아님)"""
+    if isinstance(v, dict):
+        return {k: normalize_assets(x) for k, x in v.items()}
+    if isinstance(v, list):
+        return [normalize_assets(x) for x in v]
+    if isinstance(v, str):
+        return RE_ASSET_PREFIX.sub("", v)
+    return v
+
+
+def diff_hero(old: Any, new: Any) -> Dict[str, Any]:
+    old = old if isinstance(old, dict) else {}
+    new = new if isinstance(new, dict) else {}
+    a = {_skill_key(s): s for s in old.get("skills") or [] if isinstance(s, dict)}
+    b = {_skill_key(s): s for s in new.get("skills") or [] if isinstance(s, dict)}
+    added = [k for k in b if k not in a]
+    changed = [k for k in b if k in a and _skill_content(a[k]) != _skill_content(b[k])]
+    stats = (normalize_assets(old.get("stats")) != normalize_assets(new.get("stats"))
+             or normalize_assets(old.get("special")) != normalize_assets(new.get("special")))
+    reasons = []
+    if added:
+        reasons.append("skills_added")
+    if changed:
+        reasons.append("skills_changed")
+    if stats:
+        reasons.append("stats_changed")
+    return {"reasons": reasons, "skills_added": added, "skills_changed": changed}
+
+
+def entity_of(rel: str) -> Optional[Tuple[str, str]]:
+    """data/buildings/furnace.json -> ("buildings", "furnace"), data/heroes/ssr/eugene.json -> ("heroes", "eugene")"""
+    parts = rel.split("/")
+    if not rel.endswith(".json") or parts[-1] == "index.json":
+        return None
+    if len(parts) == 3 and parts[:2] == ["data", "buildings"]:
+        return "buildings", parts[2][:-5]
+    if len(parts) == 4 and parts[:2] == ["data", "heroes"]:
+        return "heroes", parts[3][:-5]
+    return None
+
+
+# =============================
+# 이름 (i18n)
+# =============================
+class Names:
+    def __init__(self):
+        self.tables: Dict[str, Dict[str, str]] = {}
+        for lang in LANGS:
+            merged: Dict[str, str] = {}
+            for fn in ("calc.json", "heroes.json"):
+                p = os.path.join(ROOT_DIR, "i18n", lang, fn)
+                if os.path.isfile(p):
+                    with open(p, "r", encoding="utf-8") as f:
+                        merged.update(json.load(f))
+            self.tables[lang] = merged
+
+    def get(self, kind: str, slug: str, data: Any) -> Dict[str, str]:
+        fallback = slug
+        if isinstance(data, dict):
+            if kind == "heroes" and data.get("name"):
+                fallback = str(data["name"])
+            elif kind == "buildings":
+                title = str((data.get("meta") or {}).get("title") or "")
+                fallback = title.split(" - ")[0].strip() or slug
+        key = f"building.{slug}" if kind == "buildings" else f"hero.{slug}.name"
+        return {lang: self.tables[lang].get(key) or fallback for lang in LANGS}
+
+
+# =============================
+# 피드 / 매니페스트
+# =============================
+def feed_entry(kind: str, slug: str, name: Dict[str, str], reasons: List[str], date: str) -> Dict[str, Any]:
+    if reasons == ["new"]:
+        title = {lang: TITLE_NEW[kind][lang].format(name=name[lang]) for lang in LANGS}
+    else:
+        title = {
+            lang: TITLE_UPDATED[lang].format(
+                name=name[lang], reasons=REASON_SEP[lang].join(REASONS[r][lang] for r in reasons))
+            for lang in LANGS
+        }
+    return {"category": dict(CATEGORY[kind]), "title": title, "href": f"/{kind}/{slug}", "date": date}
+
+
+def merge_latest(latest: Any, entries: List[Dict[str, Any]], keep: int) -> Dict[str, Any]:
+    """새 항목을 맨 앞에. 같은 날 같은 href 는 새 것으로 교체 (다시 돌려도 안 쌓임)"""
+    items = list((latest or {}).get("items") or []) if isinstance(latest, dict) else []
+    fresh = {(e["href"], e["date"]) for e in entries}
+    items = [it for it in items if (it.get("href"), it.get("date")) not in fresh]
+    out = dict(latest) if isinstance(latest, dict) else {}
+    out["items"] = (entries + items)[:keep] if keep > 0 else entries + items
+    return out
+
+
+def build_id(changes: Dict[str, str]) -> str:
+    h = hashlib.sha1()
+    for rel in sorted(changes):
+        st = changes[rel]
+        digest = file_sha1(os.path.join(ROOT_DIR, rel)) if st != "D" else ""
+        h.update(f"{st}\t{rel}\t{digest}\n".encode("utf-8"))
+    return h.hexdigest()[:12]
+
+
+def merge_manifest(manifest: Any, build: str, date: str, paths: List[str]) -> Dict[str, Any]:
+    history = list((manifest or {}).get("history") or []) if isinstance(manifest, dict) else []
+    history = [h for h in history if h.get("build") != build]
+    history.insert(0, {"build": build, "date": date, "paths": paths})
+    return {"build": build, "history": history[:HISTORY_KEEP]}
+
+
+def write_json(rel: str, obj: Any) -> None:
+    path = os.path.join(ROOT_DIR, rel)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def read_current(rel: str) -> Optional[bytes]:
+    p = os.path.join(ROOT_DIR, rel)
+    if not os.path.isfile(p):
+        return None
+    with open(p, "rb") as f:
+        return f.read()
+
+
+# =============================
+# 실행
+# =============================
+def collect(prev: PrevBuild, names: Names,
+            date: str) -> Tuple[Dict[str, str], List[str], List[Dict[str, Any]], List[str]]:
+    """(배포할 변경 {경로: 상태}, SW 캐시에서 지울 경로들, 피드 항목들, 로그 줄들)"""
+    raw = {rel: st for rel, st in prev.changed().items() if rel not in SELF_OUTPUTS}
+    changes: Dict[str, str] = {}
+    invalidate: List[str] = []
+    entries: List[Dict[str, Any]] = []
+    log: List[str] = []
+    same = 0
+    paths_only = 0
+
+    for rel in sorted(raw):
+        st = raw[rel]
+        new_obj = old_obj = None
+        if rel.endswith(".json"):
+            new_obj = load_json_bytes(read_current(rel)) if st != "D" else None
+            old_obj = load_json_bytes(prev.read(rel)) if st != "A" else None
+            if st == "M" and new_obj is not None and new_obj == old_obj:
+                same += 1          # 포맷만 바뀜
+                continue
+        changes[rel] = st
+        # 에셋 경로 표기만 바뀐 JSON 은 배포는 하되, 캐시된 옛 버전도 같은 파일을 가리키니 무효화/피드 X
+        if st == "M" and new_obj is not None and normalize_assets(new_obj) == normalize_assets(old_obj):
+            paths_only += 1
+            continue
+        invalidate.append("/" + rel)
+
+        ent = entity_of(rel)
+        if not ent or st == "D":
+            continue
+        kind, slug = ent
+        if st == "A":
+            reasons, detail = ["new"], ""
+        elif kind == "buildings":
+            d = diff_building(old_obj, new_obj)
+            reasons = d["reasons"]
+            detail = " ".join(f"{k}={','.join(d[k][:6])}{'…' if len(d[k]) > 6 else ''}" for k in reasons)
+        else:
+            d = diff_hero(old_obj, new_obj)
+            reasons = d["reasons"]
+            detail = " ".join(f"{k}={','.join(d.get(k) or [])}" for k in reasons if d.get(k))
+        if not reasons:
+            continue
+        entries.append(feed_entry(kind, slug, names.get(kind, slug, new_obj), reasons, date))
+        log.append(f"  [{kind}] {slug}: {', '.join(reasons)} {detail}".rstrip())
+
+    if same:
+        log.append(f"  (내용 같은 JSON {same}개는 제외 - 포맷만 바뀜)")
+    if paths_only:
+        log.append(f"  (에셋 경로 표기만 바뀐 JSON {paths_only}개는 배포만 - 피드/캐시 무효화 X)")
+    return changes, invalidate, entries, log
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--prev", default="HEAD", help="이전 빌드: git ref 또는 사이트 루트 폴더 (기본 HEAD)")
+    ap.add_argument("--date", default="", help="피드 날짜 (기본 오늘, YYYY-MM-DD)")
+    ap.add_argument("--keep", type=int, default=50, help="latest.json 에 남길 최대 항목 수 (0=제한 없음)")
+    ap.add_argument("--list-out", default="", help="배포할 파일 목록 저장 경로")
+    ap.add_argument("--no-feed", action="store_true", help="latest.json 은 건드리지 않음")
+    ap.add_argument("--dry-run", action="store_true", help="파일을 쓰지 않고 결과만 출력")
+    args = ap.parse_args()
+
+    date = args.date or datetime.date.today().isoformat()
+    try:
+        prev = PrevBuild(args.prev)
+    except subprocess.CalledProcessError:
+        print(f"❌ 이전 빌드를 찾을 수 없음: {args.prev} (git ref 또는 폴더)")
+        sys.exit(2)
+
+    print(f"[DIFF] {prev.label()} -> 작업 트리")
+    changes, invalidate, entries, log = collect(prev, Names(), date)
+    for line in log:
+        print(line)
+
+    if not changes:
+        print("✅ 바뀐 데이터 없음 (latest.json / changes.json 그대로)")
+        if args.list_out and not args.dry_run:
+            open(resolve_from_root(args.list_out), "w", encoding="utf-8").close()
+        return
+
+    bid = build_id(changes)
+    paths = sorted(invalidate)
+    outputs: List[str] = []
+    if not args.dry_run:
+        if entries and not args.no_feed:
+            write_json(LATEST_PATH, merge_latest(load_json_bytes(read_current(LATEST_PATH)), entries, args.keep))
+            outputs.append(LATEST_PATH)
+        write_json(CHANGES_PATH, merge_manifest(load_json_bytes(read_current(CHANGES_PATH)), bid, date, paths))
+        outputs.append(CHANGES_PATH)
+
+    deploy = dict(changes)
+    for rel in outputs:
+        deploy[rel] = "M" if prev.read(rel) is not None else "A"
+    n_bytes = sum(os.path.getsize(os.path.join(ROOT_DIR, rel)) for rel, st in deploy.items() if st != "D")
+
+    if args.list_out and not args.dry_run:
+        with open(resolve_from_root(args.list_out), "w", encoding="utf-8") as f:
+            for rel in sorted(deploy):
+                f.write(f"{deploy[rel]}\t{rel}\n")
+        print(f"[OK] {args.list_out}")
+
+    n_del = sum(1 for st in deploy.values() if st == "D")
+    print(f"[BUILD] {bid}  feed +{len(entries)}  files {len(deploy) - n_del} (+{n_del} 삭제)  {n_bytes / 1024:,.1f} KiB")
+    if args.dry_run:
+        for e in entries:
+            print(f"  + {e['date']} {e['href']}  {e['title']['en']}")
+        print("(dry-run: 파일 안 씀)")
+    else:
+        print(f"[OK] {', '.join(outputs)}")
+
+
+if __name__ == "__main__":
+    main()
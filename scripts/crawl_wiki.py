@@ -0,0 +1,418 @@
+# crawl_wiki.py
+# ------------------------------------------------------------
+# ✅ 위키 영웅/건물 페이지를 isolate/ 로 직접 받아오는 크롤러
+#
+#   https://.../buildings/{slug}/               -> isolate/buildings/building_{slug}.html
+#   https://.../buildings/fire-crystal-{slug}/  -> isolate/buildings/firecrystal_{slug}.html
+#   https://.../heroes/{slug}/                  -> isolate/heroes/hero_isolate_{grade}_{season}_{slug}.html
+#                                                  (grade/season 은 data/heroes/*/{slug}.json 에서 찾음)
+#
+# 사용법:
+#   python scripts/crawl_wiki.py --seeds seeds.txt
+#   python scripts/crawl_wiki.py --sitemap https://www.whiteoutsurvival.wiki/sitemap_index.xml
+#   python scripts/crawl_wiki.py --resume                # 지난번 frontier 이어서
+#   python scripts/crawl_wiki.py --seeds seeds.txt --no-localize
+#
+# - 페이지 받기(producer) 와 이미지 로컬화(consumer) 가 크기 제한 있는 큐로 이어져서
+#   앞 페이지를 파싱/로컬화하는 동안에도 다음 페이지를 계속 받는다.
+# - frontier 는 isolate/.crawl_frontier.json 에 저장 -> 중간에 끊겨도 --resume 으로 이어감
+# - 호스트별 최소 간격(--delay), 동시 요청 수(--concurrency), robots.txt 를 지킴
+# - URL 호스트는 안 따짐: 로컬 미러(http://127.0.0.1:8000/buildings/furnace/)에도 그대로 동작
+# ------------------------------------------------------------
+
+import os
+import re
+import sys
+import json
+import glob
+import queue
+import argparse
+import threading
+import traceback
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))  # = scripts
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+from http_client import HostLimiter, make_session, retry_after_seconds  # noqa: E402
+from run_metrics import METRICS, add_metrics_args, instrumented  # noqa: E402
+
+ISOLATE_DIR = os.path.join(ROOT_DIR, "isolate")
+HEROES_DATA_DIR = os.path.join(ROOT_DIR, "data", "heroes")
+
+RE_FIRECRYSTAL = re.compile(r"^/buildings/fire-crystal-([a-z0-9-]+)/?$", re.I)
+RE_BUILDING = re.compile(r"^/buildings/([a-z0-9-]+)/?$", re.I)
+RE_HERO = re.compile(r"^/heroes/([a-z0-9-]+)/?$", re.I)
+
+MAX_ATTEMPTS = 3
+
+
+# =============================
+# URL -> isolate 파일명
+# =============================
+RE_ASSET_SEASON = re.compile(r"/heroes/ssr/s(\d+)/", re.I)
+RE_ISOLATE_SEASON = re.compile(r"^(?:hero_isolate_)?ssr_s(\d+)_([a-z0-9]+)(?:_local)?\.html$", re.I)
+
+
+def season_from_assets(hero: Dict[str, Any]) -> str:
+    """JSON 의 season 이 null 이면 이미지 경로(/assets/heroes/ssr/s14/...)에서 찾는다"""
+    for key in ("image", "portrait", "icon"):
+        m = RE_ASSET_SEASON.search(str(hero.get(key) or ""))
+        if m:
+            return m.group(1)
+    m = RE_ASSET_SEASON.search(json.dumps(hero, ensure_ascii=False))
+    return m.group(1) if m else ""
+
+def isolate_seasons(isolate_dir: str) -> Dict[str, str]:
+    """이미 있는 isolate/heroes/ssr_s14_cara_local.html 같은 파일명에서 slug -> season"""
+    out: Dict[str, str] = {}
+    for path in glob.glob(os.path.join(isolate_dir, "heroes", "*.html")):
+        m = RE_ISOLATE_SEASON.match(os.path.basename(path))
+        if m:
+            out.setdefault(m.group(2).lower(), m.group(1))
+    return out
+
+def load_hero_meta(data_dir: str = HEROES_DATA_DIR, isolate_dir: str = ISOLATE_DIR) -> Dict[str, Tuple[str, str]]:
+    """slug -> (grade, season)  예: gatot -> ("ssr", "s8"), gina -> ("sr", "")"""
+    meta: Dict[str, Tuple[str, str]] = {}
+    known = isolate_seasons(isolate_dir)
+    for path in glob.glob(os.path.join(data_dir, "*", "*.json")):
+        if os.path.basename(path) == "index.json":
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                hero = json.load(f)
+        except Exception:
+            continue
+        slug = hero.get("slug") or os.path.splitext(os.path.basename(path))[0]
+        grade = str(hero.get("rarity") or os.path.basename(os.path.dirname(path))).lower()
+        season = hero.get("season")
+        if grade == "ssr" and not season:
+            season = season_from_assets(hero) or known.get(slug.lower(), "")
+            if not season:
+                print(f"⚠ SSR 인데 season 을 모름 (JSON/이미지 경로/isolate 파일 모두 없음): {slug}")
+        season_s = f"s{season}" if grade == "ssr" and season else ""
+        meta[slug.lower()] = (grade, season_s)
+    return meta
+
+def url_to_target(url: str, hero_meta: Dict[str, Tuple[str, str]]) -> Optional[str]:
+    """isolate/ 기준 상대경로. 영웅/건물 페이지가 아니면 None"""
+    path = urlparse(url).path
+
+    m = RE_FIRECRYSTAL.match(path)
+    if m:
+        return f"buildings/firecrystal_{m.group(1).replace('-', '').lower()}.html"
+
+    m = RE_BUILDING.match(path)
+    if m:
+        return f"buildings/building_{m.group(1).replace('-', '').lower()}.html"
+
+    m = RE_HERO.match(path)
+    if m:
+        slug = m.group(1).replace("-", "").lower()
+        if slug not in hero_meta:
+            print(f"⚠ data/heroes 에 없는 영웅 (grade/season 모름): {url}")
+            return None
+        grade, season = hero_meta[slug]
+        key = "_".join(p for p in (grade, season, slug) if p)
+        return f"heroes/hero_isolate_{key}.html"
+
+    return None
+
+
+# =============================
+# 시드 / 사이트맵
+# =============================
+def read_seeds(path: str) -> List[str]:
+    urls = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                urls.append(line.split()[0])
+    return urls
+
+def read_sitemap(session, limiter: HostLimiter, src: str, depth: int = 0) -> List[str]:
+    """sitemap.xml / sitemap index 둘 다 처리 (URL 또는 로컬 파일)"""
+    if re.match(r"^https?://", src, re.I):
+        limiter.wait(src)
+        res = session.get(src, timeout=30)
+        res.raise_for_status()
+        body = res.content
+    else:
+        with open(src, "rb") as f:
+            body = f.read()
+
+    root = ET.fromstring(body)
+    locs = [el.text.strip() for el in root.iter() if el.tag.endswith("loc") and el.text]
+
+    if root.tag.endswith("sitemapindex"):
+        if depth >= 2:
+            return []
+        urls: List[str] = []
+        for child in locs:
+            try:
+                urls.extend(read_sitemap(session, limiter, urljoin(src, child), depth + 1))
+            except Exception as e:
+                print(f"⚠ sitemap 실패: {child} -> {e}")
+        return urls
+    return locs
+
+
+# =============================
+# frontier (디스크에 저장되는 진행상황)
+# =============================
+class Frontier:
+    """
+    url -> {"target", "status": pending|fetched|done|failed, "attempts", "error"}
+    fetched = HTML 은 받았고 로컬화가 아직
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.items = json.load(f).get("items", {})
+
+    def add(self, url: str, target: str) -> None:
+        with self._lock:
+            if url not in self.items:
+                self.items[url] = {"target": target, "status": "pending", "attempts": 0, "error": ""}
+
+    def update(self, url: str, **kw: Any) -> None:
+        with self._lock:
+            self.items[url].update(kw)
+            self._save()
+
+    def with_status(self, *statuses: str) -> List[str]:
+        with self._lock:
+            return [u for u, it in self.items.items() if it["status"] in statuses]
+
+    def save(self) -> None:
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"items": self.items}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+
+
+# =============================
+# 크롤러 (producer: fetch / consumer: localize)
+# =============================
+_STOP = object()
+
+class Crawler:
+    def __init__(self, frontier: Frontier, isolate_dir: str, *, delay: float, concurrency: int,
+                 localize: bool, queue_size: int, respect_robots: bool):
+        self.frontier = frontier
+        self.isolate_dir = isolate_dir
+        self.concurrency = max(1, concurrency)
+        self.localize = localize
+        self.respect_robots = respect_robots
+
+        self.session = make_session(pool_size=self.concurrency)
+        self.limiter = HostLimiter(delay)
+        self.fetch_q: "queue.Queue[Any]" = queue.Queue()
+        self.parse_q: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+        self._robots: Dict[str, Optional[RobotFileParser]] = {}
+        self._robots_lock = threading.Lock()
+
+    def allowed(self, url: str) -> bool:
+        if not self.respect_robots:
+            return True
+        p = urlparse(url)
+        base = f"{p.scheme}://{p.netloc}"
+        with self._robots_lock:
+            if base not in self._robots:
+                rp: Optional[RobotFileParser] = RobotFileParser()
+                try:
+                    self.limiter.wait(base)
+                    res = self.session.get(base + "/robots.txt", timeout=15)
+                    rp.parse(res.text.splitlines() if res.status_code == 200 else [])
+                except Exception:
+                    rp = None
+                self._robots[base] = rp
+            rp = self._robots[base]
+        return rp is None or rp.can_fetch(self.session.headers["User-Agent"], url)
+
+    # ---------- producer ----------
+    def fetch_worker(self) -> None:
+        while True:
+            url = self.fetch_q.get()
+            if url is _STOP:
+                return
+            it = self.frontier.items[url]
+            try:
+                if not self.allowed(url):
+                    self.frontier.update(url, status="failed", error="robots.txt disallow")
+                    print(f"[SKIP] robots.txt: {url}")
+                    continue
+
+                with METRICS.span("politeness_wait"):
+                    self.limiter.wait(url)
+                with METRICS.span("fetch_page", url=url):
+                    res = self.session.get(url, timeout=30)
+                if res.status_code in (429, 503):
+                    self.limiter.penalize(url, retry_after_seconds(res))
+                res.raise_for_status()
+
+                out_path = os.path.join(self.isolate_dir, it["target"])
+                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                tmp = out_path + ".part"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(res.text)
+                os.replace(tmp, out_path)
+
+                self.frontier.update(url, status="fetched", attempts=it["attempts"] + 1, error="")
+                METRICS.count("http_bytes", len(res.content))
+                METRICS.count("pages_fetched")
+                print(f"[GET] {url} -> {it['target']} ({len(res.content)} bytes)")
+                self.parse_q.put(url)  # 큐가 차면 여기서 대기 (backpressure)
+            except Exception as e:
+                attempts = it["attempts"] + 1
+                status = "failed" if attempts >= MAX_ATTEMPTS else "pending"
+                self.frontier.update(url, status=status, attempts=attempts, error=str(e))
+                print(f"[FAIL] {url} -> {e}")
+                if status == "pending":
+                    self.fetch_q.put(url)
+            finally:
+                self.fetch_q.task_done()
+
+    # ---------- consumer ----------
+    def localize_worker(self) -> None:
+        from watch_isolate import job_localize, localize_target, report_assets
+
+        while True:
+            url = self.parse_q.get()
+            if url is _STOP:
+                return
+            try:
+                it = self.frontier.items[url]
+                tgt = localize_target(os.path.join(self.isolate_dir, it["target"])) if self.localize else None
+                if tgt:
+                    kind, args, out_html = tgt
+                    with METRICS.span("localize_page", page=it["target"]):
+                        res = job_localize(kind, args)
+                    print(f"[LOCAL] {it['target']} -> {os.path.basename(out_html)}")
+                    report_assets(res.get("assets") or [])
+                self.frontier.update(url, status="done")
+            except Exception as e:
+                self.frontier.update(url, error=f"localize: {e}")
+                print(f"⚠ 로컬화 실패: {url}")
+                traceback.print_exc()
+            finally:
+                self.parse_q.task_done()
+
+    def run(self) -> None:
+        # 이미 받아둔(fetched) 페이지는 바로 로컬화 쪽으로
+        fetched = self.frontier.with_status("fetched")
+        pending = self.frontier.with_status("pending")
+        print(f"[FRONTIER] pending {len(pending)} / fetched {len(fetched)} / total {len(self.frontier.items)}")
+
+        if self.localize and os.path.normcase(self.isolate_dir) != os.path.normcase(ISOLATE_DIR):
+            print("⚠ --isolate-dir 가 기본 위치가 아니라서 로컬화는 건너뜀")
+            self.localize = False
+
+        consumers = [threading.Thread(target=self.localize_worker, daemon=True) for _ in range(2)]
+        producers = [threading.Thread(target=self.fetch_worker, daemon=True) for _ in range(self.concurrency)]
+        for t in consumers + producers:
+            t.start()
+
+        for url in pending:
+            self.fetch_q.put(url)
+        for url in fetched:
+            self.parse_q.put(url)
+
+        self.fetch_q.join()
+        for _ in producers:
+            self.fetch_q.put(_STOP)
+        for t in producers:
+            t.join()
+
+        self.parse_q.join()
+        for _ in consumers:
+            self.parse_q.put(_STOP)
+        for t in consumers:
+            t.join()
+
+        done = len(self.frontier.with_status("done"))
+        failed = len(self.frontier.with_status("failed"))
+        print(f"\n[DONE] done {done} / failed {failed} / total {len(self.frontier.items)}")
+
+
+# =============================
+# 실행
+# =============================
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seeds", help="URL 목록 파일 (한 줄에 하나, # 주석)")
+    ap.add_argument("--sitemap", action="append", default=[], help="sitemap.xml URL 또는 파일 (여러 번 가능)")
+    ap.add_argument("--resume", action="store_true", help="frontier 파일에 남은 작업만 이어서")
+    ap.add_argument("--refetch", action="store_true", help="done 인 URL 도 다시 받기")
+    ap.add_argument("--isolate-dir", default=ISOLATE_DIR, help="저장 위치 (기본: 프로젝트 isolate/)")
+    ap.add_argument("--frontier", default=None, help="frontier 파일 (기본: {isolate-dir}/.crawl_frontier.json)")
+    ap.add_argument("--delay", type=float, default=1.0, help="같은 호스트 요청 사이 최소 간격(초)")
+    ap.add_argument("--concurrency", type=int, default=2, help="동시에 받는 페이지 수")
+    ap.add_argument("--queue-size", type=int, default=4, help="받은 페이지 -> 로컬화 대기열 크기")
+    ap.add_argument("--no-localize", action="store_true", help="HTML 만 받고 이미지 로컬화는 안 함")
+    ap.add_argument("--ignore-robots", action="store_true", help="robots.txt 무시 (로컬 미러용)")
+    add_metrics_args(ap)
+    args = ap.parse_args()
+
+    with instrumented("crawl_wiki", args):
+        run(ap, args)
+
+
+def run(ap, args) -> None:
+    isolate_dir = os.path.abspath(args.isolate_dir)
+    frontier = Frontier(args.frontier or os.path.join(isolate_dir, ".crawl_frontier.json"))
+
+    crawler = Crawler(
+        frontier,
+        isolate_dir,
+        delay=args.delay,
+        concurrency=args.concurrency,
+        localize=not args.no_localize,
+        queue_size=args.queue_size,
+        respect_robots=not args.ignore_robots,
+    )
+
+    if not args.resume:
+        urls: List[str] = []
+        if args.seeds:
+            urls.extend(read_seeds(args.seeds))
+        for sm in args.sitemap:
+            urls.extend(read_sitemap(crawler.session, crawler.limiter, sm))
+        if not urls and not frontier.items:
+            ap.error("--seeds 또는 --sitemap 이 필요함 (또는 --resume)")
+
+        hero_meta = load_hero_meta()
+        added = 0
+        for u in urls:
+            target = url_to_target(u, hero_meta)
+            if not target:
+                continue
+            frontier.add(u, target)
+            added += 1
+            if args.refetch:
+                frontier.items[u].update(status="pending", attempts=0, error="")
+        frontier.save()
+        print(f"[SEED] {len(urls)}개 URL 중 영웅/건물 페이지 {added}개")
+
+    crawler.run()
+
+
+if __name__ == "__main__":
+    main()
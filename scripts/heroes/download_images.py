@@ -1,107 +1,172 @@
 import os
-import requests
+import sys
+import argparse
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
-# ==================================================
-# 기본 설정
-# ==================================================
-GRADE = "ssr"
-SEASON = "s15"          # s2, s3 ... 변경 가능
-HERO_NAME = "viveca"    # 영웅명
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
 
-HTML_PATH = f"../isolate/hero_isolate_{GRADE}_{SEASON}_{HERO_NAME}.html"
-OUTPUT_HTML = f"../isolate/{GRADE}_{SEASON}_{HERO_NAME}_local.html"
-OUTPUT_IMG_DIR = f"../assets/heroes/{GRADE}/{SEASON}/{HERO_NAME}/img"
+from http_client import make_session  # noqa: E402
+from run_metrics import METRICS, add_metrics_args, instrumented  # noqa: E402
+from canonicalize_asset_paths import reroot, site_path  # noqa: E402
 
-os.makedirs(OUTPUT_IMG_DIR, exist_ok=True)
+SESSION = make_session()
 
 # ==================================================
-# HTML 로드
+# 기본 설정
 # ==================================================
-with open(HTML_PATH, "r", encoding="utf-8") as f:
-    soup = BeautifulSoup(f, "html.parser")
-
-downloaded = {}
-
-def download_image(url):
-    """이미지 다운로드 + 로컬 경로 치환"""
-    if not url or not url.startswith("http"):
-        return url
-
-    parsed = urlparse(url)
-    filename = os.path.basename(parsed.path)
-    if not filename:
-        return url
-
-    save_path = os.path.join(OUTPUT_IMG_DIR, filename)
-
-    if filename not in downloaded:
-        print(f"📥 {filename}")
-        r = requests.get(url, timeout=15)
-        r.raise_for_status()
-        with open(save_path, "wb") as f:
-            f.write(r.content)
-        downloaded[filename] = True
+GRADE = "ssr"
+SEASON = "s15"          # s2, s3 ... 변경 가능 (r / sr 은 "")
+HERO_NAME = "viveca"    # 영웅명
 
-    return os.path.relpath(save_path, os.path.dirname(OUTPUT_HTML)).replace("\\", "/")
+# 프로젝트 루트 (scripts/heroes/../..)
+BASE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+
+
+def hero_key(grade: str, season: str, hero_name: str) -> str:
+    """ssr_s8_gatot / sr_gina 형태 (isolate/heroes 파일명 규칙)"""
+    return "_".join(p for p in (grade, season, hero_name) if p)
+
+
+def hero_paths(grade: str, season: str, hero_name: str):
+    """-> (입력 HTML, 로컬 HTML, 이미지 폴더)"""
+    key = hero_key(grade, season, hero_name)
+    html_path = os.path.join(BASE_DIR, "isolate", "heroes", f"hero_isolate_{key}.html")
+    output_html = os.path.join(BASE_DIR, "isolate", "heroes", f"{key}_local.html")
+    img_parts = [p for p in (grade, season, hero_name) if p]
+    output_img_dir = os.path.join(BASE_DIR, "assets", "heroes", *img_parts, "img")
+    return html_path, output_html, output_img_dir
+
+
+def localize(grade: str = GRADE, season: str = SEASON, hero_name: str = HERO_NAME,
+             out_root: str = "") -> dict:
+    """
+    이미지 로컬화 -> _local.html
+    (영웅 JSON 은 data/heroes/{grade}/{slug}.json 을 사람이 관리 -> 여기서는 만들지 않음)
+    """
+    HTML_PATH, OUTPUT_HTML, OUTPUT_IMG_DIR = hero_paths(grade, season, hero_name)
+    # out_root: 결과물(_local.html / 이미지)을 저장소 대신 여기 아래 같은 구조로 (입력 HTML 은 그대로)
+    OUTPUT_HTML, OUTPUT_IMG_DIR = reroot(OUTPUT_HTML, out_root), reroot(OUTPUT_IMG_DIR, out_root)
+
+    os.makedirs(OUTPUT_IMG_DIR, exist_ok=True)
+    os.makedirs(os.path.dirname(OUTPUT_HTML), exist_ok=True)
+
+    # ==================================================
+    # HTML 로드
+    # ==================================================
+    with METRICS.span("soup"):
+        with open(HTML_PATH, "r", encoding="utf-8") as f:
+            soup = BeautifulSoup(f, "html.parser")
+
+    downloaded = {}
+
+    def download_image(url):
+        """이미지 다운로드 + 로컬 경로 치환"""
+        if not url or not url.startswith("http"):
+            return url
+
+        parsed = urlparse(url)
+        filename = os.path.basename(parsed.path)
+        if not filename:
+            return url
+
+        save_path = os.path.join(OUTPUT_IMG_DIR, filename)
+
+        if filename not in downloaded:
+            print(f"📥 {filename}")
+            with METRICS.span("image_download"):
+                r = SESSION.get(url, timeout=15)
+                r.raise_for_status()
+            METRICS.count("http_bytes", len(r.content))
+            with METRICS.span("write_image"):
+                with open(save_path, "wb") as f:
+                    f.write(r.content)
+            downloaded[filename] = True
+        else:
+            METRICS.count("image_cache_hits")
+
+        # 사이트 루트 기준 "/assets/..." (JSON 과 _local.html 이 같은 표기, serve_site.py 로 미리보기)
+        return site_path(save_path, root=out_root)
+
+    # ==================================================
+    # 스킬 그룹 파서 (Exploration / Expedition)
+    # ==================================================
+    def parse_skill_group(container_id):
+        skills = []
+        container = soup.find(id=container_id)
+        if not container:
+            return skills
+
+        cards = container.select(".bg-dark.rounded.p-3")
+
+        for card in cards:
+            img = card.find("img")
+            title = card.find("h5")
+            desc = card.find("p")
+
+            if img and img.get("src"):
+                img["src"] = download_image(img["src"])
+
+            skills.append({
+                "icon": img["src"] if img else "",
+                "name": title.get_text(strip=True) if title else "",
+                "description": desc.get_text(" ", strip=True) if desc else ""
+            })
 
-# ==================================================
-# 스킬 그룹 파서 (Exploration / Expedition)
-# ==================================================
-def parse_skill_group(container_id):
-    skills = []
-    container = soup.find(id=container_id)
-    if not container:
         return skills
 
-    cards = container.select(".bg-dark.rounded.p-3")
-
-    for card in cards:
-        img = card.find("img")
-        title = card.find("h5")
-        desc = card.find("p")
-
-        if img and img.get("src"):
-            img["src"] = download_image(img["src"])
-
-        skills.append({
-            "icon": img["src"] if img else "",
-            "name": title.get_text(strip=True) if title else "",
-            "description": desc.get_text(" ", strip=True) if desc else ""
-        })
-
-    return skills
-
-# ==================================================
-# SSR 기본 스킬 파싱
-# ==================================================
-exploration_skills = parse_skill_group("exploration-skills")
-expedition_skills  = parse_skill_group("expedition-skills")
-
-# ==================================================
-# 페이지 전체 이미지 로컬화
-# ==================================================
-for img in soup.find_all("img"):
-    src = img.get("src")
-    if src and src.startswith("http"):
-        try:
-            img["src"] = download_image(src)
-        except Exception:
-            print(f"⚠ 이미지 실패: {src}")
-
-# ==================================================
-# HTML 저장
-# ==================================================
-with open(OUTPUT_HTML, "w", encoding="utf-8") as f:
-    f.write(str(soup))
-
-# ==================================================
-# 결과 로그
-# ==================================================
-print("\n✅ SSR 기본형 영웅 처리 완료")
-print(f"- 영웅: {HERO_NAME}")
-print(f"- Exploration 스킬: {len(exploration_skills)}")
-print(f"- Expedition 스킬 : {len(expedition_skills)}")
-print(f"- 이미지 폴더     : {OUTPUT_IMG_DIR}")
-print(f"- 로컬 HTML       : {OUTPUT_HTML}")
+    # ==================================================
+    # SSR 기본 스킬 파싱
+    # ==================================================
+    exploration_skills = parse_skill_group("exploration-skills")
+    expedition_skills  = parse_skill_group("expedition-skills")
+
+    # ==================================================
+    # 페이지 전체 이미지 로컬화
+    # ==================================================
+    for img in soup.find_all("img"):
+        src = img.get("src")
+        if src and src.startswith("http"):
+            try:
+                img["src"] = download_image(src)
+            except Exception:
+                print(f"⚠ 이미지 실패: {src}")
+
+    # ==================================================
+    # HTML 저장
+    # ==================================================
+    with METRICS.span("write_html"):
+        with open(OUTPUT_HTML, "w", encoding="utf-8") as f:
+            f.write(str(soup))
+
+    # ==================================================
+    # 결과 로그
+    # ==================================================
+    print("\n✅ SSR 기본형 영웅 처리 완료")
+    print(f"- 영웅: {hero_name}")
+    print(f"- Exploration 스킬: {len(exploration_skills)}")
+    print(f"- Expedition 스킬 : {len(expedition_skills)}")
+    print(f"- 이미지 폴더     : {OUTPUT_IMG_DIR}")
+    print(f"- 로컬 HTML       : {OUTPUT_HTML}")
+
+    return {
+        "html": OUTPUT_HTML,
+        "img_dir": OUTPUT_IMG_DIR,
+        "images": sorted(downloaded),
+    }
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--grade", default=GRADE, help="ssr / sr / r")
+    ap.add_argument("--season", default=SEASON, help="s1 ~ s15 (r / sr 은 빈 값)")
+    ap.add_argument("--name", default=HERO_NAME, help="영웅명")
+    add_metrics_args(ap)
+    args = ap.parse_args()
+
+    with instrumented("localize_hero", args):
+        localize(args.grade, args.season, args.name)
@@ -0,0 +1,294 @@
+# http_cassette.py
+# ------------------------------------------------------------
+# ✅ HTTP 녹화/재생 (record / replay) -> 위키 없이도 같은 조건으로 벤치마크
+#
+# make_session() 이 환경변수를 보고 자동으로 붙인다. 스크립트 수정 필요 없음.
+#   WOS_HTTP_MODE=record|replay      (없으면 그냥 네트워크)
+#   WOS_HTTP_CASSETTE=./.cassette    (저장 폴더)
+#   WOS_HTTP_LATENCY=recorded|0|120  (replay 때 응답 지연: 녹화된 값 / ms 고정)
+#   WOS_HTTP_BANDWIDTH=0|512k|2m     (replay 때 초당 바이트 제한, 0=무제한)
+#
+# 예:
+#   WOS_HTTP_MODE=record WOS_HTTP_CASSETTE=.cassette python scripts/buildings/download_building_firecrystal.py --name furnace
+#   python scripts/http_cassette.py localize-all --cassette .cassette --latency recorded --json before.json
+#     (결과물은 임시 폴더에 쓰고 지움 -> 작업 트리 안 바뀜. 결과를 보고 싶으면 --out /tmp/localized)
+#   python scripts/http_cassette.py info --cassette .cassette
+#
+# 저장 형식 (요청 1개당 파일 2개, 스레드 여러 개가 동시에 녹화해도 안전):
+#   {key}.json  : method, url, status, reason, headers, elapsed_ms(첫 바이트까지), transfer_ms, size
+#   {key}.bin   : 응답 바디
+#   key = sha1(method + " " + url [+ body])
+# ------------------------------------------------------------
+
+import os
+import io
+import sys
+import json
+import time
+import hashlib
+import tempfile
+import contextlib
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from run_metrics import METRICS, add_metrics_args, instrumented
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))  # = scripts
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+
+class CassetteMiss(requests.ConnectionError):
+    """replay 모드에서 녹화 안 된 요청 (기존 except 블록에서 네트워크 실패처럼 처리됨)"""
+
+
+def parse_rate(v: Optional[str]) -> float:
+    """'512k' / '2m' / '1000' -> bytes/s"""
+    if not v:
+        return 0.0
+    v = v.strip().lower()
+    mul = 1
+    if v.endswith("k"):
+        mul, v = 1024, v[:-1]
+    elif v.endswith("m"):
+        mul, v = 1024 * 1024, v[:-1]
+    return float(v) * mul
+
+
+def request_key(method: str, url: str, body: Any = None) -> str:
+    h = hashlib.sha1(f"{method.upper()} {url}".encode("utf-8"))
+    if body:
+        h.update(body if isinstance(body, bytes) else str(body).encode("utf-8"))
+    return h.hexdigest()
+
+
+class ShapedBody(io.RawIOBase):
+    """bytes 를 초당 rate 바이트 속도로 흘려주는 raw 스트림 (Response.raw 대용)"""
+
+    def __init__(self, data: bytes, rate: float):
+        self._buf = io.BytesIO(data)
+        self._rate = rate
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, amt: Optional[int] = -1, **_kw: Any) -> bytes:
+        chunk = self._buf.read(-1 if amt is None else amt)
+        if chunk and self._rate > 0:
+            time.sleep(len(chunk) / self._rate)
+        return chunk
+
+
+class CassetteAdapter(BaseAdapter):
+    def __init__(self, cassette_dir: str, mode: str, latency: str = "recorded", bandwidth: float = 0.0):
+        super().__init__()
+        if mode not in ("record", "replay"):
+            raise ValueError(f"mode 는 record / replay: {mode}")
+        self.dir = cassette_dir
+        self.mode = mode
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self._real = HTTPAdapter() if mode == "record" else None
+        os.makedirs(cassette_dir, exist_ok=True)
+
+    # ---------- 공통 ----------
+    def _paths(self, key: str):
+        return os.path.join(self.dir, f"{key}.json"), os.path.join(self.dir, f"{key}.bin")
+
+    def _build(self, request, meta: Dict[str, Any], body: bytes, rate: float) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = meta["status"]
+        resp.reason = meta.get("reason", "")
+        resp.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.url = meta.get("url", request.url)
+        resp.raw = ShapedBody(body, rate)
+        resp.request = request
+        resp.connection = self
+        return resp
+
+    # ---------- record ----------
+    def _record(self, request, **kwargs) -> requests.Response:
+        t0 = time.perf_counter()
+        real = self._real.send(request, **{**kwargs, "stream": True})
+        t_head = time.perf_counter()
+        body = real.content
+        t_end = time.perf_counter()
+
+        meta = {
+            "method": request.method,
+            "url": request.url,
+            "final_url": real.url,
+            "status": real.status_code,
+            "reason": real.reason,
+            # 바디는 이미 풀어서 저장하므로 인코딩 관련 헤더는 뺀다
+            "headers": {k: v for k, v in real.headers.items()
+                        if k.lower() not in ("content-encoding", "transfer-encoding", "content-length")},
+            "elapsed_ms": round((t_head - t0) * 1000, 3),
+            "transfer_ms": round((t_end - t_head) * 1000, 3),
+            "size": len(body),
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        meta_path, body_path = self._paths(request_key(request.method, request.url, request.body))
+        for path, data, mode in ((body_path, body, "wb"), (meta_path, meta, "w")):
+            tmp = path + ".tmp"
+            if mode == "wb":
+                with open(tmp, "wb") as f:
+                    f.write(data)
+            else:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, path)
+
+        real.close()
+        return self._build(request, meta, body, 0.0)
+
+    # ---------- replay ----------
+    def _replay(self, request) -> requests.Response:
+        meta_path, body_path = self._paths(request_key(request.method, request.url, request.body))
+        if not os.path.exists(meta_path):
+            METRICS.count("cassette_misses")
+            raise CassetteMiss(f"cassette 에 없음: {request.method} {request.url}", request=request)
+
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+        METRICS.count("cassette_hits")
+
+        if self.latency == "recorded":
+            delay = meta.get("elapsed_ms", 0) / 1000.0
+        else:
+            delay = float(self.latency or 0) / 1000.0
+        if delay > 0:
+            time.sleep(delay)
+
+        rate = self.bandwidth
+        if self.latency == "recorded" and not rate and meta.get("transfer_ms"):
+            # 대역폭 지정이 없으면 녹화 당시 전송 속도를 그대로 재현
+            rate = meta["size"] / (meta["transfer_ms"] / 1000.0) if meta["size"] else 0.0
+        return self._build(request, meta, body, rate)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.mode == "record":
+            return self._record(request, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        return self._replay(request)
+
+    def close(self) -> None:
+        if self._real:
+            self._real.close()
+
+
+def adapter_from_env() -> Optional[CassetteAdapter]:
+    mode = os.environ.get("WOS_HTTP_MODE", "").strip().lower()
+    if mode not in ("record", "replay"):
+        return None
+    return CassetteAdapter(
+        os.environ.get("WOS_HTTP_CASSETTE", os.path.join(ROOT_DIR, ".cassette")),
+        mode,
+        latency=os.environ.get("WOS_HTTP_LATENCY", "recorded"),
+        bandwidth=parse_rate(os.environ.get("WOS_HTTP_BANDWIDTH")),
+    )
+
+
+# =============================
+# CLI: 카세트 정보 / 오프라인 로컬라이저 벤치
+# =============================
+def cmd_info(args) -> None:
+    total = 0
+    n = 0
+    for fn in sorted(os.listdir(args.cassette)):
+        if not fn.endswith(".json"):
+            continue
+        with open(os.path.join(args.cassette, fn), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        n += 1
+        total += meta.get("size", 0)
+        if args.verbose:
+            print(f"{meta['status']} {meta.get('elapsed_ms', 0):8.1f}ms {meta.get('size', 0):>9} {meta['url']}")
+    print(f"[CASSETTE] {n} responses, {total} bytes ({args.cassette})")
+
+def localize_pages(pages: List[str], out_root: str) -> Tuple[List[Dict[str, Any]], float]:
+    """페이지마다 job_localize 시간 (결과물은 out_root 아래에만)"""
+    from watch_isolate import job_localize, localize_target
+
+    timings = []
+    t_all = time.perf_counter()
+    for p in pages:
+        tgt = localize_target(p)
+        if not tgt:
+            continue
+        kind, targs, _out = tgt
+        t0 = time.perf_counter()
+        ok = True
+        try:
+            job_localize(kind, targs, out_root=out_root)
+        except Exception as e:
+            ok = False
+            print(f"⚠ {os.path.basename(p)} -> {e}")
+        timings.append({"page": os.path.basename(p), "ok": ok, "seconds": round(time.perf_counter() - t0, 4)})
+    return timings, time.perf_counter() - t_all
+
+def cmd_localize_all(args) -> None:
+    """
+    isolate/ 의 원본 페이지 전부를 replay 로 로컬화하고 페이지별 시간을 낸다
+    결과물(_local.html / assets / JSON)은 --out (없으면 임시 폴더, 끝나면 삭제) 에만 쓴다 -> 작업 트리 그대로
+    """
+    os.environ["WOS_HTTP_MODE"] = args.mode
+    os.environ["WOS_HTTP_CASSETTE"] = os.path.abspath(args.cassette)
+    os.environ["WOS_HTTP_LATENCY"] = args.latency
+    os.environ["WOS_HTTP_BANDWIDTH"] = args.bandwidth
+
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    from watch_isolate import BUILDINGS_DIR, HEROES_DIR
+
+    pages = []
+    for d in (BUILDINGS_DIR, HEROES_DIR):
+        if os.path.isdir(d):
+            pages.extend(os.path.join(d, fn) for fn in sorted(os.listdir(d)))
+
+    with contextlib.ExitStack() as stack:
+        out_root = os.path.abspath(args.out) if args.out else stack.enter_context(
+            tempfile.TemporaryDirectory(prefix="wos_localize_"))
+        print(f"[OUT] {out_root}{'' if args.out else ' (임시, 끝나면 삭제)'}")
+        timings, total = localize_pages(pages, out_root)
+
+    print("\n[TIMING]")
+    for t in timings:
+        print(f"  {t['seconds']:8.3f}s  {'OK ' if t['ok'] else 'ERR'}  {t['page']}")
+    print(f"  {total:8.3f}s  total ({len(timings)} pages)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"mode": args.mode, "latency": args.latency, "bandwidth": args.bandwidth,
+                       "total_seconds": round(total, 4), "pages": timings}, f, ensure_ascii=False, indent=2)
+        print(f"[OK] {args.json}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("info", help="카세트 내용 요약")
+    p.add_argument("--cassette", default=os.path.join(ROOT_DIR, ".cassette"))
+    p.add_argument("-v", "--verbose", action="store_true")
+    p.set_defaults(func=cmd_info)
+
+    p = sub.add_parser("localize-all", help="isolate/ 원본 페이지 전체 로컬화 (타이밍 출력)")
+    p.add_argument("--cassette", default=os.path.join(ROOT_DIR, ".cassette"))
+    p.add_argument("--mode", default="replay", choices=["record", "replay"])
+    p.add_argument("--latency", default="recorded", help="recorded 또는 ms 고정값")
+    p.add_argument("--bandwidth", default="0", help="초당 바이트 (512k, 2m ...), 0=무제한")
+    p.add_argument("--json", default="", help="타이밍 결과 JSON 저장 경로")
+    p.add_argument("--out", default="", help="로컬화 결과물 폴더 (없으면 임시 폴더에 쓰고 지움)")
+    add_metrics_args(p)
+    p.set_defaults(func=cmd_localize_all, run="localize_all")
+
+    args = ap.parse_args()
+    with instrumented(getattr(args, "run", args.cmd), args):
+        args.func(args)
@@ -0,0 +1,81 @@
+# http_client.py
+# ------------------------------------------------------------
+# ✅ 스크립트들이 같이 쓰는 HTTP 세션 + 예의(politeness) 제한
+#
+#   from http_client import make_session, HostLimiter
+#   s = make_session()
+#   limiter = HostLimiter(delay=1.0)
+#   limiter.wait(url); r = s.get(url, timeout=30)
+#
+# WOS_HTTP_MODE=record|replay 가 있으면 녹화/재생 어댑터가 붙는다 (http_cassette.py 참고)
+# ------------------------------------------------------------
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from run_metrics import METRICS
+
+USER_AGENT = "Mozilla/5.0 (compatible; ImageDownloader/1.0; +local-script)"
+
+
+def make_session(user_agent: str = USER_AGENT, pool_size: int = 8) -> requests.Session:
+    s = requests.Session()
+    s.headers.update({"User-Agent": user_agent})
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+
+    from http_cassette import adapter_from_env
+    cassette = adapter_from_env()
+    if cassette:
+        s.mount("http://", cassette)
+        s.mount("https://", cassette)
+
+    s.hooks["response"].append(_count_response)
+    return s
+
+
+def _count_response(res: requests.Response, *args, **kwargs) -> None:
+    # 첫 바이트까지 걸린 시간 (바디 크기는 스트리밍 때문에 호출하는 쪽에서 셈)
+    METRICS.observe("http", res.elapsed.total_seconds())
+    METRICS.count("http_requests")
+    if res.status_code >= 400:
+        METRICS.count("http_errors")
+
+
+class HostLimiter:
+    """
+    호스트별 최소 요청 간격(delay 초)을 지킨다. 스레드 여러 개가 같이 써도 됨.
+    (서버가 Retry-After 를 주면 penalize() 로 그만큼 더 쉼)
+    """
+
+    def __init__(self, delay: float = 1.0):
+        self.delay = max(0.0, delay)
+        self._lock = threading.Lock()
+        self._next: Dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next.get(host, 0.0))
+            self._next[host] = at + self.delay
+        if at > now:
+            time.sleep(at - now)
+
+    def penalize(self, url: str, seconds: float) -> None:
+        host = urlparse(url).netloc
+        with self._lock:
+            self._next[host] = max(self._next.get(host, 0.0), time.monotonic() + seconds)
+
+
+def retry_after_seconds(res: requests.Response, default: float = 5.0) -> float:
+    v: Optional[str] = res.headers.get("Retry-After")
+    if v and v.strip().isdigit():
+        return float(v.strip())
+    return default
@@ -0,0 +1,204 @@
+# run_metrics.py
+# ------------------------------------------------------------
+# ✅ 스크립트 실행 계측 (어디서 시간이 새는지: 네트워크 / bs4 파싱 / smart_value / 디스크)
+#
+#   from run_metrics import METRICS, add_metrics_args, instrumented
+#
+#   with METRICS.span("parse_file", file=fn):   # 구간 시간
+#       ...
+#   METRICS.count("http_bytes", len(r.content)) # 카운터
+#
+#   ap = argparse.ArgumentParser(); add_metrics_args(ap); args = ap.parse_args()
+#   with instrumented("parse_buildings", args):
+#       run(...)
+#
+# 옵션 (add_metrics_args):
+#   --report run.json       : JSON 실행 리포트
+#   --prom run.prom         : Prometheus textfile (node_exporter textfile collector 용)
+#   --profile cprofile|sample
+#   --profile-out PATH      : cprofile -> .prof / sample -> collapsed stacks(.folded, flamegraph 용)
+# ------------------------------------------------------------
+
+import os
+import sys
+import json
+import time
+import threading
+import contextlib
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional
+
+# 파일별 기록(parse_file 등)은 너무 많아지면 앞에서부터 이것만 남긴다
+MAX_EVENTS = 5000
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = time.time()
+            self.spans: Dict[str, Dict[str, float]] = {}
+            self.counters: Dict[str, float] = {}
+            self.events: List[Dict[str, Any]] = []
+
+    @contextlib.contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - t0, **labels)
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        with self._lock:
+            s = self.spans.get(name)
+            if s is None:
+                s = self.spans[name] = {"count": 0, "total": 0.0, "max": 0.0}
+            s["count"] += 1
+            s["total"] += seconds
+            if seconds > s["max"]:
+                s["max"] = seconds
+            if labels and len(self.events) < MAX_EVENTS:
+                self.events.append({"span": name, "seconds": round(seconds, 6), **labels})
+
+    def count(self, name: str, n: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    # ---------- 출력 ----------
+    def report(self, run: str) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "run": run,
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+                "duration_seconds": round(time.time() - self.started, 6),
+                "spans": {k: {"count": v["count"], "total_seconds": round(v["total"], 6),
+                              "max_seconds": round(v["max"], 6)} for k, v in sorted(self.spans.items())},
+                "counters": dict(sorted(self.counters.items())),
+                "events": list(self.events),
+            }
+
+    def prometheus(self, run: str) -> str:
+        rep = self.report(run)
+        lab = f'run="{run}"'
+        out = [
+            "# HELP wos_run_duration_seconds Wall time of the whole run.",
+            "# TYPE wos_run_duration_seconds gauge",
+            f"wos_run_duration_seconds{{{lab}}} {rep['duration_seconds']}",
+            "# HELP wos_run_last_timestamp_seconds Unix time the run finished.",
+            "# TYPE wos_run_last_timestamp_seconds gauge",
+            f"wos_run_last_timestamp_seconds{{{lab}}} {int(time.time())}",
+            "# HELP wos_span_seconds_total Total seconds spent in each span.",
+            "# TYPE wos_span_seconds_total counter",
+        ]
+        for k, v in rep["spans"].items():
+            out.append(f'wos_span_seconds_total{{{lab},span="{k}"}} {v["total_seconds"]}')
+        out += ["# HELP wos_span_count_total Number of times each span ran.", "# TYPE wos_span_count_total counter"]
+        for k, v in rep["spans"].items():
+            out.append(f'wos_span_count_total{{{lab},span="{k}"}} {v["count"]}')
+        out += ["# HELP wos_span_max_seconds Slowest single occurrence of each span.", "# TYPE wos_span_max_seconds gauge"]
+        for k, v in rep["spans"].items():
+            out.append(f'wos_span_max_seconds{{{lab},span="{k}"}} {v["max_seconds"]}')
+        out += ["# HELP wos_counter_total Script counters (bytes fetched, cache hits, skipped files ...).",
+                "# TYPE wos_counter_total counter"]
+        for k, v in rep["counters"].items():
+            out.append(f'wos_counter_total{{{lab},name="{k}"}} {v}')
+        return "\n".join(out) + "\n"
+
+
+METRICS = Metrics()
+
+
+def _write_atomic(path: str, text: str) -> None:
+    d = os.path.dirname(os.path.abspath(path))
+    os.makedirs(d, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)  # textfile collector 가 반쯤 쓴 파일을 읽지 않도록
+
+
+# =============================
+# 프로파일러
+# =============================
+class SamplingProfiler:
+    """메인 스레드 스택을 interval 마다 떠서 collapsed stack 형식으로 모은다 (flamegraph.pl / speedscope)"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._target = threading.main_thread().ident
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            parts = []
+            while frame is not None:
+                code = frame.f_code
+                parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if parts:
+                self.stacks[";".join(reversed(parts))] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, out_path: str) -> None:
+        self._stop.set()
+        self._thread.join()
+        _write_atomic(out_path, "".join(f"{k} {v}\n" for k, v in self.stacks.most_common()))
+
+
+def add_metrics_args(ap) -> None:
+    ap.add_argument("--report", default="", help="JSON 실행 리포트 저장 경로")
+    ap.add_argument("--prom", default="", help="Prometheus textfile 저장 경로")
+    ap.add_argument("--profile", choices=["cprofile", "sample"], default=None, help="프로파일러")
+    ap.add_argument("--profile-out", default="", help="프로파일 결과 경로 (기본: {run}.prof / {run}.folded)")
+
+
+@contextlib.contextmanager
+def instrumented(run: str, args: Any = None) -> Iterator[Metrics]:
+    report_path = getattr(args, "report", "") or ""
+    prom_path = getattr(args, "prom", "") or ""
+    profile = getattr(args, "profile", None)
+    profile_out = getattr(args, "profile_out", "") or ""
+
+    METRICS.reset()
+    prof: Optional[Any] = None
+    if profile == "cprofile":
+        import cProfile
+        prof = cProfile.Profile()
+        prof.enable()
+    elif profile == "sample":
+        prof = SamplingProfiler()
+        prof.start()
+
+    try:
+        yield METRICS
+    finally:
+        if profile == "cprofile":
+            import pstats
+            prof.disable()
+            out = profile_out or f"{run}.prof"
+            prof.dump_stats(out)
+            print(f"\n[PROFILE] {out}")
+            pstats.Stats(prof).sort_stats("cumulative").print_stats(15)
+        elif profile == "sample":
+            out = profile_out or f"{run}.folded"
+            prof.stop(out)
+            print(f"\n[PROFILE] {out} ({sum(prof.stacks.values())} samples)")
+
+        if report_path:
+            _write_atomic(report_path, json.dumps(METRICS.report(run), ensure_ascii=False, indent=2))
+            print(f"[REPORT] {report_path}")
+        if prom_path:
+            _write_atomic(prom_path, METRICS.prometheus(run))
+            print(f"[REPORT] {prom_path}")
+        if report_path or prom_path or profile:
+            for k, v in METRICS.report(run)["spans"].items():
+                print(f"  {k:<20} {v['count']:>6}x  {v['total_seconds']:9.3f}s  (max {v['max_seconds']:.3f}s)")
@@ -0,0 +1,261 @@
+# serve_site.py
+# ------------------------------------------------------------
+# ✅ 로컬 정적 서버 (GitHub Pages 흉내)
+#
+#   - /heroes/gatot 처럼 파일 없는 경로 -> 404 상태 + 404.html 본문 (SPA 는 404.html 스크립트가 /?p= 로 넘김)
+#   - /dir -> 301 /dir/ , /dir/ -> index.html , /about -> about.html
+#   - gzip (Accept-Encoding: gzip + 텍스트 계열만, 압축 결과는 메모리 캐시)
+#   - Cache-Control: max-age=600 + ETag / Last-Modified + 304 (Pages 기본값과 같음)
+#   - --latency-ms / --jitter-ms 로 응답마다 지연 주입 (첫 바이트 전)
+#   - --base /wos-hub 이면 프로젝트 페이지처럼 /wos-hub/ 아래에 올림
+#
+# 사용법:
+#   python scripts/serve_site.py                            # http://127.0.0.1:8000/
+#   python scripts/serve_site.py --port 8080 --latency-ms 80 --jitter-ms 20
+#   python scripts/serve_site.py --base /wos-hub --no-gzip
+#
+# 부하 측정은 scripts/bench/load_site.py 참고
+# ------------------------------------------------------------
+
+import os
+import sys
+import gzip
+import time
+import random
+import argparse
+import threading
+import mimetypes
+import posixpath
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))  # = scripts
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+GZIP_TYPES = (
+    "text/", "application/json", "application/javascript", "application/manifest+json",
+    "image/svg+xml", "application/xml",
+)
+GZIP_MIN_BYTES = 256
+GZIP_CACHE_MAX = 512  # 파일 개수
+
+mimetypes.add_type("application/javascript", ".js")
+mimetypes.add_type("application/javascript", ".mjs")
+mimetypes.add_type("application/json", ".json")
+mimetypes.add_type("application/manifest+json", ".webmanifest")
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("image/avif", ".avif")
+
+
+# =============================
+# 설정 / gzip 캐시
+# =============================
+class SiteConfig:
+    def __init__(self, root: str, base: str = "", gzip_on: bool = True, max_age: int = 600,
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0, quiet: bool = False):
+        self.root = os.path.abspath(root)
+        self.base = normalize_base(base)
+        self.gzip_on = gzip_on
+        self.max_age = max_age
+        self.latency_ms = max(0.0, latency_ms)
+        self.jitter_ms = max(0.0, jitter_ms)
+        self.quiet = quiet
+        self._gz: "OrderedDict[Tuple[str, float], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def delay(self) -> None:
+        ms = self.latency_ms
+        if self.jitter_ms:
+            ms += random.uniform(-self.jitter_ms, self.jitter_ms)
+        if ms > 0:
+            time.sleep(ms / 1000.0)
+
+    def gzipped(self, path: str, mtime: float, raw: bytes) -> bytes:
+        key = (path, mtime)
+        with self._lock:
+            hit = self._gz.get(key)
+            if hit is not None:
+                self._gz.move_to_end(key)
+                return hit
+        out = gzip.compress(raw, compresslevel=6, mtime=0)
+        with self._lock:
+            self._gz[key] = out
+            while len(self._gz) > GZIP_CACHE_MAX:
+                self._gz.popitem(last=False)
+        return out
+
+
+def normalize_base(base: str) -> str:
+    b = (base or "").strip().strip("/")
+    return "/" + b if b else ""
+
+
+def resolve(cfg: SiteConfig, url_path: str) -> Tuple[str, Optional[str]]:
+    """
+    Pages 규칙으로 경로 해석
+      ("file", 절대경로) / ("redirect", 새 URL 경로) / ("missing", None)
+    """
+    path = unquote(url_path)
+    if cfg.base:
+        if path == cfg.base:
+            return "redirect", cfg.base + "/"
+        if not path.startswith(cfg.base + "/"):
+            return "missing", None
+        path = path[len(cfg.base):]
+
+    norm = posixpath.normpath(path)
+    parts = [p for p in norm.split("/") if p]
+    # .git, .github 같은 숨김 경로는 Pages 도 안 내보냄
+    if any(p.startswith(".") for p in parts):
+        return "missing", None
+
+    fs = os.path.join(cfg.root, *parts)
+    if os.path.isdir(fs):
+        if not path.endswith("/"):
+            return "redirect", cfg.base + "/" + "/".join(parts) + "/"
+        index = os.path.join(fs, "index.html")
+        return ("file", index) if os.path.isfile(index) else ("missing", None)
+    if os.path.isfile(fs):
+        return "file", fs
+    if parts and os.path.isfile(fs + ".html"):
+        return "file", fs + ".html"
+    return "missing", None
+
+
+# =============================
+# 핸들러
+# =============================
+class PagesHandler(BaseHTTPRequestHandler):
+    server_version = "wos-pages/1.0"
+    protocol_version = "HTTP/1.1"  # keep-alive (부하 테스트 클라이언트가 연결 재사용)
+    disable_nagle_algorithm = True  # 헤더/본문 따로 쓸 때 delayed ACK 로 40ms 씩 밀리는 것 방지
+    cfg: SiteConfig
+
+    def log_message(self, fmt: str, *args) -> None:
+        if not self.cfg.quiet:
+            sys.stderr.write("[%s] %s\n" % (self.log_date_time_string(), fmt % args))
+
+    def do_GET(self) -> None:
+        self._serve(head=False)
+
+    def do_HEAD(self) -> None:
+        self._serve(head=True)
+
+    def _serve(self, head: bool) -> None:
+        self.cfg.delay()
+        kind, target = resolve(self.cfg, urlsplit(self.path).path)
+
+        if kind == "redirect":
+            query = urlsplit(self.path).query
+            self._send(301, b"", extra={"Location": target + ("?" + query if query else "")}, head=head)
+            return
+
+        status = 200
+        if kind == "missing":
+            status = 404
+            target = os.path.join(self.cfg.root, "404.html")
+            if not os.path.isfile(target):
+                self._send(404, b"Not Found", ctype="text/plain; charset=utf-8", head=head)
+                return
+
+        st = os.stat(target)
+        etag = '"%x-%x"' % (int(st.st_mtime), st.st_size)
+        last_mod = formatdate(st.st_mtime, usegmt=True)
+        ctype = mimetypes.guess_type(target)[0] or "application/octet-stream"
+        if ctype.startswith("text/") or ctype in ("application/javascript", "application/json"):
+            ctype += "; charset=utf-8"
+
+        cache = {
+            "Cache-Control": f"max-age={self.cfg.max_age}",
+            "ETag": etag,
+            "Last-Modified": last_mod,
+        }
+
+        if status == 200 and self._not_modified(etag, st.st_mtime):
+            self._send(304, b"", extra=cache, head=True)
+            return
+
+        with open(target, "rb") as f:
+            body = f.read()
+
+        extra = dict(cache) if status == 200 else {}
+        if self.cfg.gzip_on and self._wants_gzip() and ctype.startswith(GZIP_TYPES) and len(body) >= GZIP_MIN_BYTES:
+            body = self.cfg.gzipped(target, st.st_mtime, body)
+            extra["Content-Encoding"] = "gzip"
+            extra["Vary"] = "Accept-Encoding"
+
+        self._send(status, body, ctype=ctype, extra=extra, head=head)
+
+    def _wants_gzip(self) -> bool:
+        ae = self.headers.get("Accept-Encoding", "") or ""
+        return any(tok.split(";")[0].strip().lower() == "gzip" for tok in ae.split(","))
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        inm = self.headers.get("If-None-Match")
+        if inm:
+            return etag in [t.strip() for t in inm.split(",")] or inm.strip() == "*"
+        ims = self.headers.get("If-Modified-Since")
+        if ims:
+            try:
+                return int(mtime) <= int(parsedate_to_datetime(ims).timestamp())
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _send(self, status: int, body: bytes, ctype: str = "", extra: Optional[dict] = None,
+              head: bool = False) -> None:
+        self.send_response(status)
+        if ctype:
+            self.send_header("Content-Type", ctype)
+        for k, v in (extra or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head and body:
+            self.wfile.write(body)
+
+
+class PagesServer(ThreadingHTTPServer):
+    request_queue_size = 256  # 기본 5 면 동시 접속이 몰릴 때 SYN 재전송(1초)이 측정에 섞임
+
+
+def make_server(cfg: SiteConfig, host: str, port: int) -> ThreadingHTTPServer:
+    handler = type("BoundPagesHandler", (PagesHandler,), {"cfg": cfg})
+    httpd = PagesServer((host, port), handler)
+    httpd.daemon_threads = True
+    return httpd
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--root", default=ROOT_DIR, help="사이트 루트 (기본: 저장소 루트)")
+    ap.add_argument("--base", default="", help='프로젝트 페이지 prefix (예: "/wos-hub")')
+    ap.add_argument("--no-gzip", action="store_true", help="gzip 끄기")
+    ap.add_argument("--max-age", type=int, default=600, help="Cache-Control max-age 초 (Pages 기본 600)")
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="응답마다 넣을 지연 (ms)")
+    ap.add_argument("--jitter-ms", type=float, default=0.0, help="지연 흔들림 ± (ms)")
+    ap.add_argument("--quiet", action="store_true", help="요청 로그 끄기")
+    args = ap.parse_args()
+
+    cfg = SiteConfig(args.root, base=args.base, gzip_on=not args.no_gzip, max_age=args.max_age,
+                     latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, quiet=args.quiet)
+    httpd = make_server(cfg, args.host, args.port)
+
+    print(f"[SERVE] http://{args.host}:{args.port}{cfg.base}/  root={cfg.root}")
+    print(f"        gzip={'on' if cfg.gzip_on else 'off'}  max-age={cfg.max_age}s  "
+          f"latency={cfg.latency_ms:g}±{cfg.jitter_ms:g}ms")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[OK] stopped")
+    finally:
+        httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,631 @@
+# upgrade_plan.py
+# ------------------------------------------------------------
+# ✅ 연맹 단위 건물 업그레이드 계산기 (js/building-calculator.js 와 같은 계산을 NumPy 로 한 번에)
+#
+#   pip install numpy
+#
+#   from upgrade_plan import PlanEngine
+#   eng = PlanEngine.from_dir("data/buildings")
+#   res = eng.evaluate(["furnace", "embassy"], ["30", "FC 1"], ["FC 5", "FC 3"],
+#                      build_speed=[85.3, 60], vp=[10, 0], server=[1, 0], chief=[0, 1],
+#                      pet=[5, 3], agenes=[0, 2], valeria=[10, 0])
+#   res["score"], res["adj_hours"], res["fire_crystal"] ...
+#
+# CLI:
+#   python scripts/upgrade_plan.py plans.csv                    # 멤버별 합계 출력
+#   python scripts/upgrade_plan.py plans.json --out result.csv  # 계획별 결과 저장 (.csv / .json)
+#   python scripts/upgrade_plan.py --parity                     # node 로 JS 와 결과가 완전히 같은지 확인
+#
+# 계획 파일 컬럼 (CSV 헤더 / JSON 객체 키, building/from/to 외엔 생략 가능):
+#   member, building, from, to, build_speed(%), vp(0/10/15), server(0/1), chief(0/1),
+#   pet(하이에나 Lv 0~5), agenes(Lv 0~5), valeria(Lv 0~10)
+#   from / to 는 레벨 라벨 ("30", "30-1", "FC 5", "FC5-2" ...) - 공백/대소문자/"." "-" 차이는 무시
+#
+# 행 정규화(normalizeBuildingRows / parseToHours / num) 까지 JS 를 그대로 옮겼다.
+# JS 쪽을 고치면 여기도 같이 고치고 --parity 로 확인할 것.
+# ------------------------------------------------------------
+
+import os
+import re
+import csv
+import sys
+import json
+import math
+import random
+import argparse
+import subprocess
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))  # = scripts
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+DATA_DIR = os.path.join(ROOT_DIR, "data", "buildings")
+CALC_JS = os.path.join(ROOT_DIR, "js", "building-calculator.js")
+PARITY_JS = os.path.join(SCRIPTS_DIR, "upgrade_plan_parity.mjs")
+
+RES_ID = {
+    "food": "res_100011",
+    "wood": "res_103",
+    "coal": "res_104",
+    "iron": "res_105",
+    "fireCrystal": "res_100081",
+    "refineStone": "res_100082",
+}
+
+KEY_MAP = {
+    "level": ["레벨", "level", "lv", "lvl", "target", "단계"],
+    "fire_crystal": ["불수정", "fc", "fire_crystal", "fireCrystal", "firecrystal", "fire crystal", "fire_crystals"],
+    "refined": ["정제", "refined", "refined_fc", "refinedFireCrystal", "refind", "refind_fc", "refine", "refining"],
+    "food": ["고기", "food", "meat"],
+    "wood": ["나무", "wood", "lumber"],
+    "coal": ["석탄", "coal"],
+    "iron": ["철광", "iron"],
+    "hours": ["변환시간", "time", "buildTime", "duration", "conversionTime", "convertTime", "convertedTime", "hours"],
+}
+CSV_COLS = {"level": "레벨", "fire_crystal": "불수정", "refined": "정제", "food": "고기",
+            "wood": "나무", "coal": "석탄", "iron": "철광", "hours": "변환시간"}
+
+# 계산 행렬 열 순서 (calcSegment 의 합산 순서와 무관하게 열마다 따로 더함)
+FIELDS = ["fire_crystal", "refined", "food", "wood", "coal", "iron", "hours"]
+
+# getExpertFlatHours: Agenes Lv -> 시간
+EXPERT_FLAT_HOURS = np.array([0, 2, 3, 4, 6, 8], dtype=np.float64)
+
+
+# =============================
+# JS 값 변환 흉내
+# =============================
+_UNDEF = object()   # JS undefined (없는 키). None 은 null
+
+def js_string(v: Any) -> str:
+    if v is None or v is _UNDEF:
+        return ""
+    if v is True:
+        return "true"
+    if v is False:
+        return "false"
+    if isinstance(v, float):
+        if v != v:
+            return "NaN"
+        if v.is_integer() and abs(v) < 1e21:
+            return str(int(v))
+        return repr(v)
+    if isinstance(v, list):
+        return ",".join(js_string(x) for x in v)
+    if isinstance(v, dict):
+        return "[object Object]"
+    return str(v)
+
+def js_number(v: Any) -> float:
+    """Number(v)"""
+    if v is None:
+        return 0.0
+    if v is _UNDEF:
+        return math.nan
+    if isinstance(v, bool):
+        return 1.0 if v else 0.0
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, (dict, list)):
+        v = js_string(v) if isinstance(v, list) else "x"
+    s = str(v).strip()
+    if s == "":
+        return 0.0
+    if "_" in s or s.lower() in ("inf", "+inf", "-inf", "nan", "infinity", "+infinity", "-infinity"):
+        return {"Infinity": math.inf, "+Infinity": math.inf, "-Infinity": -math.inf}.get(s, math.nan)
+    try:
+        return float(s)
+    except ValueError:
+        pass
+    if re.fullmatch(r"0[xX][0-9a-fA-F]+|0[oO][0-7]+|0[bB][01]+", s):
+        return float(int(s, 0))
+    return math.nan
+
+def num(v: Any) -> float:
+    """building-calculator.js num()"""
+    if v is None or v is _UNDEF:
+        return 0.0
+    s = js_string(v).strip()
+    if not s:
+        return 0.0
+    n = js_number(s.replace(",", ""))
+    return n if math.isfinite(n) else 0.0
+
+VP_CHOICES = (0, 10, 15)  # getActiveVP: 버튼 두 개(10% / 15%) 중 하나 또는 없음
+
+def vp_pct(v: Any) -> float:
+    """vp 는 0/10/15 만 (JS 에서 다른 값은 나올 수 없어서 parity 보장 밖)"""
+    x = num(v)
+    if x not in VP_CHOICES:
+        raise ValueError(f"vp 는 {'/'.join(map(str, VP_CHOICES))} 중 하나여야 함: {v!r}")
+    return x
+
+def clamp_int(v: Any, lo: int, hi: int) -> int:
+    """clampInt(): parseInt 후 [lo, hi]"""
+    m = re.match(r"\s*([+-]?[0-9]+)", js_string(v))
+    if not m:
+        return lo
+    return max(lo, min(hi, int(m.group(1))))
+
+def _is_js_integer(v: float) -> bool:
+    return math.isfinite(v) and float(v).is_integer()
+
+def _nullish(*vals: Any) -> Any:
+    """a ?? b ?? c"""
+    for v in vals:
+        if v is not None and v is not _UNDEF:
+            return v
+    return _UNDEF
+
+
+def parse_to_hours(v: Any) -> float:
+    """building-calculator.js parseToHours()"""
+    if v is None or v is _UNDEF:
+        return 0.0
+
+    if isinstance(v, dict):
+        raw = _nullish(v.get("raw", _UNDEF), v.get("text", _UNDEF), v.get("display", _UNDEF), v.get("value", _UNDEF), None)
+        sec = _nullish(v.get("seconds", _UNDEF), v.get("sec", _UNDEF), v.get("s", _UNDEF), None)
+        if raw is not None and raw is not _UNDEF and js_string(raw).strip() != "":
+            return parse_to_hours(raw)
+        if sec is not None and sec is not _UNDEF and math.isfinite(js_number(sec)):
+            return max(0.0, js_number(sec) / 3600)
+
+    if isinstance(v, (int, float)) and not isinstance(v, bool):
+        n = float(v)
+        if not math.isfinite(n):
+            return 0.0
+        if _is_js_integer(n) and n >= 60:
+            return max(0.0, n / 3600)
+        return max(0.0, n)
+
+    s0 = js_string(v).strip()
+    if not s0:
+        return 0.0
+    s = s0.lower()
+
+    if re.fullmatch(r"[0-9]+:[0-9]+:[0-9]+", s):
+        hh, mm, ss = (int(x) for x in s.split(":"))
+        return max(0.0, hh + mm / 60 + ss / 3600)
+
+    if re.fullmatch(r"[0-9]+:[0-9]+", s):
+        mm, ss = (int(x) for x in s.split(":"))
+        return max(0.0, mm / 60 + ss / 3600)
+
+    d = h = m = sec_ = 0
+    for pat, unit in ((r"([0-9]+)\s*d", "d"), (r"([0-9]+)\s*h", "h"), (r"([0-9]+)\s*m", "m"), (r"([0-9]+)\s*s", "s"),
+                      (r"([0-9]+)\s*일", "d"), (r"([0-9]+)\s*시(?:간)?", "h"), (r"([0-9]+)\s*분", "m"), (r"([0-9]+)\s*초", "s")):
+        for mt in re.finditer(pat, s):
+            x = int(mt.group(1))
+            if unit == "d":
+                d = x
+            elif unit == "h":
+                h = x
+            elif unit == "m":
+                m = x
+            else:
+                sec_ = x
+
+    if d + h + m + sec_ > 0:
+        return max(0.0, d * 24 + h + m / 60 + sec_ / 3600)
+
+    n = js_number(s0.replace(",", ""))
+    if math.isfinite(n):
+        if _is_js_integer(n) and n >= 60:
+            return max(0.0, n / 3600)
+        return max(0.0, n)
+    return 0.0
+
+
+# =============================
+# 건물 JSON -> 레벨 행 (normalizeBuildingRows)
+# =============================
+def _get(obj: Dict[str, Any], k: str) -> Any:
+    return obj.get(k, _UNDEF)
+
+def get_any(obj: Any, keys: Sequence[str]) -> Any:
+    for k in keys:
+        if not isinstance(obj, dict):
+            continue
+        if k in obj:
+            return obj[k]
+        kk = k.lower()
+        for ok in obj:
+            if str(ok).lower() == kk:
+                return obj[ok]
+    return _UNDEF
+
+def normalize_one_row(raw: Any) -> Optional[Dict[str, Any]]:
+    if raw is None or not isinstance(raw, dict):
+        return None
+
+    costs = raw.get("costs")
+    costs = costs if isinstance(costs, (dict, list)) else None   # JS 는 {} 도 truthy
+
+    lv = _nullish(_get(raw, CSV_COLS["level"]), _get(raw, "level"), _get(raw, "lv"), _get(raw, "lvl"),
+                  _get(raw, "레벨"), get_any(raw, KEY_MAP["level"]))
+    out: Dict[str, Any] = {"level": js_string(lv).strip()}
+
+    if costs is not None:
+        c = costs if isinstance(costs, dict) else {}
+        out["food"] = num(c.get(RES_ID["food"]))
+        out["wood"] = num(c.get(RES_ID["wood"]))
+        out["coal"] = num(c.get(RES_ID["coal"]))
+        out["iron"] = num(c.get(RES_ID["iron"]))
+        out["fire_crystal"] = num(c.get(RES_ID["fireCrystal"]))
+        out["refined"] = num(c.get(RES_ID["refineStone"]))
+    else:
+        for f in ("food", "wood", "coal", "iron", "fire_crystal", "refined"):
+            out[f] = num(_nullish(get_any(raw, KEY_MAP[f]), _get(raw, CSV_COLS[f])))
+
+    t = _nullish(_get(raw, CSV_COLS["hours"]), _get(raw, "time"), _get(raw, "buildTime"), _get(raw, "duration"),
+                 _get(raw, "conversionTime"), get_any(raw, KEY_MAP["hours"]))
+    out["hours"] = parse_to_hours(t)
+
+    info = raw.get("levelInfo")
+    if not out["level"] and isinstance(info, dict):
+        k = _nullish(_get(info, "key"), _get(info, "label"), _get(info, "n"), "")
+        out["level"] = js_string(k).strip()
+
+    return out if out["level"] else None
+
+def _rows_from_table(table: List[Any]) -> List[Dict[str, Any]]:
+    if len(table) < 2 or not isinstance(table[0], list):
+        return []
+    header = [js_string(x).strip() for x in table[0]]
+    if not header:
+        return []
+    out = []
+    for row in table[1:]:
+        if not isinstance(row, list):
+            continue
+        obj = {h: (row[c] if c < len(row) else _UNDEF) for c, h in enumerate(header)}
+        n = normalize_one_row({k: v for k, v in obj.items() if v is not _UNDEF})
+        if n:
+            out.append(n)
+    return out
+
+def _rows_from_array(arr: List[Any]) -> List[Dict[str, Any]]:
+    out = []
+    for r in arr:
+        if r is None or isinstance(r, list):
+            continue
+        n = normalize_one_row(r)
+        if n:
+            out.append(n)
+    return out
+
+def normalize_building_rows(building: Any) -> List[Dict[str, Any]]:
+    if not building or not isinstance(building, dict):
+        return []
+
+    phase_keys = ["base", "firecrystal", "firecrystalPlus", "fc", "fcPlus"]
+    nodes: List[Any] = []
+    ph = building.get("phases")
+    if isinstance(ph, dict):
+        nodes += [ph[k] for k in phase_keys if ph.get(k)]
+    nodes += [building[k] for k in phase_keys if building.get(k)]
+    nodes.append(building)
+
+    out: List[Dict[str, Any]] = []
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        if isinstance(node.get("table"), list):
+            out += _rows_from_table(node["table"])
+            continue
+        if isinstance(node.get("rows"), list):
+            out += _rows_from_array(node["rows"])
+            continue
+
+    seen = set()
+    final = []
+    for r in out:
+        k = r["level"].strip()
+        if not k or k in seen:
+            continue
+        seen.add(k)
+        final.append(r)
+    return final
+
+
+def level_key(label: Any) -> str:
+    """'FC 9.4' / 'fc9-4' / 'FC9-4' -> 'fc9-4'"""
+    return re.sub(r"\s+", "", str(label)).lower().replace(".", "-")
+
+
+# =============================
+# 엔진
+# =============================
+class PlanEngine:
+    """
+    모든 건물의 레벨 행을 행렬 하나(M: 전체 행 x FIELDS)로 이어 붙여 두고
+    계획 N 개를 배열 연산으로 한 번에 계산한다.
+    합산은 JS 처럼 앞 레벨부터 차례로 더해서(누적합 차이 X) 시간 소수점까지 JS 와 똑같이 나온다.
+    """
+
+    def __init__(self, buildings: Dict[str, List[Dict[str, Any]]]):
+        self.slugs = sorted(buildings)
+        self.slug_index = {s: i for i, s in enumerate(self.slugs)}
+        self.rows = {s: buildings[s] for s in self.slugs}
+        self.offsets = np.zeros(len(self.slugs), dtype=np.int64)
+        self.counts = np.array([len(buildings[s]) for s in self.slugs], dtype=np.int64)
+        if len(self.slugs):
+            self.offsets[1:] = np.cumsum(self.counts)[:-1]
+        flat = [r for s in self.slugs for r in buildings[s]]
+        self.M = np.array([[r[f] for f in FIELDS] for r in flat], dtype=np.float64).reshape(len(flat), len(FIELDS))
+        self._labels = {
+            s: ({r["level"]: i for i, r in enumerate(rows)},
+                {level_key(r["level"]): i for i, r in reversed(list(enumerate(rows)))})
+            for s, rows in self.rows.items()
+        }
+
+    @classmethod
+    def from_dir(cls, data_dir: str = DATA_DIR) -> "PlanEngine":
+        buildings = {}
+        for fn in sorted(os.listdir(data_dir)):
+            if not fn.endswith(".json") or fn == "index.json":
+                continue
+            with open(os.path.join(data_dir, fn), "r", encoding="utf-8") as f:
+                buildings[fn[:-5]] = normalize_building_rows(json.load(f))
+        return cls(buildings)
+
+    def level_index(self, slug: str, label: Any) -> int:
+        if slug not in self._labels:
+            raise KeyError(f"건물 없음: {slug} (있는 것: {', '.join(self.slugs)})")
+        exact, loose = self._labels[slug]
+        s = js_string(label).strip()
+        if s in exact:
+            return exact[s]
+        if level_key(s) in loose:
+            return loose[level_key(s)]
+        raise KeyError(f"{slug}: 레벨 '{label}' 없음")
+
+    def evaluate(self, buildings: Sequence[str], start: Sequence[Any], end: Sequence[Any], *,
+                 build_speed: Any = 0, vp: Any = 0, server: Any = 0, chief: Any = 0,
+                 pet: Any = 0, agenes: Any = 0, valeria: Any = 0, by_index: bool = False) -> Dict[str, np.ndarray]:
+        """
+        buildings[i] 의 start[i] -> end[i] 업그레이드 (라벨, by_index=True 면 rows 인덱스).
+        버프 인자는 스칼라 또는 길이 N 배열. 결과는 calcSegment 반환값을 열별 배열로.
+        """
+        n = len(buildings)
+        b = np.array([self.slug_index[s] if s in self.slug_index else -1 for s in buildings], dtype=np.int64)
+        if (b < 0).any():
+            missing = sorted({s for s in buildings if s not in self.slug_index})
+            raise KeyError(f"건물 없음: {', '.join(missing)}")
+
+        if by_index:
+            s_idx = np.array([clamp_int(x, -2**62, 2**62) for x in start], dtype=np.int64)
+            e_idx = np.array([clamp_int(x, -2**62, 2**62) for x in end], dtype=np.int64)
+        else:
+            s_idx = np.array([self.level_index(sl, x) for sl, x in zip(buildings, start)], dtype=np.int64)
+            e_idx = np.array([self.level_index(sl, x) for sl, x in zip(buildings, end)], dtype=np.int64)
+
+        hi = np.maximum(0, self.counts[b] - 1)
+        s_idx = np.clip(s_idx, 0, hi)
+        e_idx = np.clip(e_idx, 0, hi)
+        valid = s_idx < e_idx
+        length = np.where(valid, e_idx - s_idx, 0)
+
+        # ---- 레벨 합산: k 번째 레벨을 전부 같이 더하고 다음 k 로 (JS for 루프와 같은 덧셈 순서) ----
+        sums = np.zeros((n, len(FIELDS)), dtype=np.float64)
+        first = self.offsets[b] + s_idx + 1
+        last_row = max(len(self.M) - 1, 0)
+        for k in range(int(length.max()) if n else 0):
+            live = k < length
+            idx = np.minimum(first + k, last_row)
+            sums += np.where(live[:, None], self.M[idx], 0.0)
+
+        # ---- 버프 ----
+        factor = factor_for_time(_vec(build_speed, n, num), _vec(vp, n, vp_pct), _vec(server, n, _truthy) > 0,
+                                 _vec(pet, n, lambda v: clamp_int(v, 0, 5)))
+        hours = sums[:, FIELDS.index("hours")]
+        adj = hours / factor
+        adj = np.where(_vec(chief, n, _truthy) > 0, adj * 0.8, adj)
+        flat = expert_flat_hours(_vec(agenes, n, lambda v: clamp_int(v, 0, 5)))
+        adj = np.where(flat != 0, np.maximum(0.0, adj - flat), adj)
+        v = valeria_bonus(_vec(valeria, n, lambda x: clamp_int(x, 0, 10)))
+
+        fc = sums[:, FIELDS.index("fire_crystal")]
+        rf = sums[:, FIELDS.index("refined")]
+        score = (np.floor(fc * 2000 * (1 + v)) + np.floor(rf * 30000 * (1 + v))) + np.floor(adj * 60 * 30 * (1 + v))
+
+        out = {f: np.where(valid, sums[:, i], 0.0) for i, f in enumerate(FIELDS)}
+        out.update({
+            "valid": valid,
+            "start_index": s_idx,
+            "end_index": e_idx,
+            "adj_hours": np.where(valid, adj, 0.0),
+            "score": np.where(valid, score, 0.0),
+            "factor": np.where(valid, factor, 1.0),
+        })
+        return out
+
+
+def _truthy(v: Any) -> int:
+    if isinstance(v, str):
+        return int(v.strip().lower() not in ("", "0", "false", "no", "n", "off"))
+    return int(bool(v))
+
+def _vec(v: Any, n: int, conv) -> np.ndarray:
+    if isinstance(v, (list, tuple, np.ndarray)):
+        if len(v) != n:
+            raise ValueError(f"버프 배열 길이 {len(v)} != 계획 수 {n}")
+        return np.array([conv(x) for x in v], dtype=np.float64)
+    return np.full(n, conv(v), dtype=np.float64)
+
+def factor_for_time(build_speed_pct: np.ndarray, vp_pct: np.ndarray, server_active: np.ndarray,
+                    pet_pct: np.ndarray) -> np.ndarray:
+    """getFactorForTime (덧셈 순서 그대로)"""
+    factor = 1 + build_speed_pct / 100
+    factor = factor + vp_pct / 100
+    factor = np.where(server_active, factor + 0.10, factor)
+    factor = factor + pet_pct / 100
+    return np.where(np.isfinite(factor) & (factor > 0), factor, 1.0)
+
+def valeria_bonus(lv: np.ndarray) -> np.ndarray:
+    """getValeriaBonus: Lv * 0.02"""
+    return lv * 0.02
+
+def expert_flat_hours(lv: np.ndarray) -> np.ndarray:
+    """getExpertFlatHours: Agenes Lv -> 2/3/4/6/8 시간"""
+    return EXPERT_FLAT_HOURS[lv.astype(np.int64)]
+
+
+# =============================
+# 계획 파일
+# =============================
+PLAN_BUFFS = ["build_speed", "vp", "server", "chief", "pet", "agenes", "valeria"]
+
+def load_plans(path: str) -> List[Dict[str, Any]]:
+    if path.lower().endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        plans = data.get("plans", []) if isinstance(data, dict) else data
+    else:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            plans = [{k.strip(): (v or "").strip() for k, v in r.items() if k} for r in csv.DictReader(f)]
+    for i, p in enumerate(plans):
+        for k in ("building", "from", "to"):
+            if js_string(p.get(k)).strip() == "":
+                raise ValueError(f"{path}: {i + 1}번째 계획에 '{k}' 없음")
+    return plans
+
+def evaluate_plans(eng: PlanEngine, plans: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    return eng.evaluate(
+        [js_string(p["building"]).strip().lower() for p in plans],
+        [p["from"] for p in plans],
+        [p["to"] for p in plans],
+        **{k: [p.get(k, 0) for p in plans] for k in PLAN_BUFFS},
+    )
+
+def result_records(plans: List[Dict[str, Any]], res: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    out = []
+    for i, p in enumerate(plans):
+        rec = {"member": p.get("member", ""), "building": p["building"], "from": p["from"], "to": p["to"],
+               "valid": bool(res["valid"][i])}
+        for f in FIELDS:
+            rec[f] = float(res[f][i])
+        rec["adj_hours"] = float(res["adj_hours"][i])
+        rec["score"] = int(res["score"][i])
+        out.append(rec)
+    return out
+
+def write_results(path: str, records: List[Dict[str, Any]]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if path.lower().endswith(".json"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+        return
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(records[0].keys()) if records else ["member"])
+        w.writeheader()
+        w.writerows(records)
+
+def print_totals(records: List[Dict[str, Any]]) -> None:
+    by_member: Dict[str, Dict[str, float]] = {}
+    for r in records:
+        t = by_member.setdefault(str(r["member"]) or "-", {k: 0.0 for k in ("fire_crystal", "refined", "adj_hours", "score")})
+        for k in t:
+            t[k] += r[k]
+    print(f"{'member':<20} {'FC':>10} {'refined':>10} {'hours':>12} {'SVS':>16}")
+    for m, t in sorted(by_member.items(), key=lambda kv: -kv[1]["score"]):
+        print(f"{m:<20} {t['fire_crystal']:>10,.0f} {t['refined']:>10,.0f} {t['adj_hours']:>12,.1f} {t['score']:>16,.0f}")
+    all_score = sum(t["score"] for t in by_member.values())
+    print(f"\n[TOTAL] {len(records)} plans / {len(by_member)} members / SVS {all_score:,.0f}")
+    bad = [r for r in records if not r["valid"]]
+    if bad:
+        print(f"⚠ from >= to 인 계획 {len(bad)}개는 0 으로 계산됨")
+
+
+# =============================
+# JS 결과와 비교 (node 필요)
+# =============================
+def random_plans(eng: PlanEngine, n: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    slugs = [s for s in eng.slugs if eng.rows[s]]
+    plans = []
+    for _ in range(n):
+        s = rng.choice(slugs)
+        cnt = len(eng.rows[s])
+        plans.append({
+            "building": s,
+            "from": rng.randrange(cnt),
+            "to": rng.randrange(cnt),
+            "build_speed": rng.choice([0, 12.5, 37.4, 85.3, 120, 250.75, rng.uniform(0, 200)]),
+            "vp": rng.choice(VP_CHOICES),
+            "server": rng.random() < 0.5,
+            "chief": rng.random() < 0.5,
+            "pet": rng.randrange(6),
+            "agenes": rng.randrange(6),
+            "valeria": rng.randrange(11),
+        })
+    return plans
+
+def run_parity(data_dir: str, n: int, seed: int) -> int:
+    eng = PlanEngine.from_dir(data_dir)
+    plans = random_plans(eng, n, seed)
+    files = {s: os.path.join(data_dir, f"{s}.json") for s in eng.slugs}
+    payload = json.dumps({"calc_js": CALC_JS, "files": files, "plans": plans})
+    proc = subprocess.run(["node", PARITY_JS], input=payload, capture_output=True, text=True, encoding="utf-8")
+    if proc.returncode != 0:
+        print(proc.stderr)
+        raise RuntimeError(f"node 실패 (exit {proc.returncode})")
+    js = json.loads(proc.stdout)
+
+    bad = 0
+    # 1) 행 정규화
+    for s in eng.slugs:
+        js_rows = js["rows"][s]
+        py_rows = [[r["level"]] + [r[f] for f in FIELDS] for r in eng.rows[s]]
+        if js_rows != py_rows:
+            bad += 1
+            print(f"❌ rows 다름: {s} (js {len(js_rows)} / py {len(py_rows)})")
+
+    # 2) 계획 계산
+    res = eng.evaluate([p["building"] for p in plans], [p["from"] for p in plans], [p["to"] for p in plans],
+                       by_index=True, **{k: [p[k] for p in plans] for k in PLAN_BUFFS})
+    for i, (p, j) in enumerate(zip(plans, js["results"])):
+        py = {"valid": bool(res["valid"][i]), "hours": float(res["hours"][i]), "adjHours": float(res["adj_hours"][i]),
+              "score": float(res["score"][i]), "factor": float(res["factor"][i]),
+              "sums": [float(res[f][i]) for f in FIELDS[:-1]]}
+        if py != j:
+            bad += 1
+            if bad <= 10:
+                print(f"❌ plan {i} {p}\n   js {j}\n   py {py}")
+
+    print(f"[PARITY] buildings {len(eng.slugs)} / plans {len(plans)} / mismatches {bad}")
+    return 1 if bad else 0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("plans", nargs="?", help="계획 파일 (.csv / .json)")
+    ap.add_argument("--data", default=DATA_DIR, help="건물 JSON 폴더 (data/buildings)")
+    ap.add_argument("--out", default="", help="계획별 결과 저장 (.csv / .json)")
+    ap.add_argument("--parity", action="store_true", help="무작위 계획으로 js/building-calculator.js 와 비교 (node 필요)")
+    ap.add_argument("--samples", type=int, default=5000, help="--parity 계획 수")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    if args.parity:
+        sys.exit(run_parity(args.data, args.samples, args.seed))
+    if not args.plans:
+        ap.error("계획 파일 또는 --parity 필요")
+
+    eng = PlanEngine.from_dir(args.data)
+    try:
+        plans = load_plans(args.plans)
+        records = result_records(plans, evaluate_plans(eng, plans))
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    print_totals(records)
+    if args.out:
+        write_results(args.out, records)
+        print(f"[OK] {args.out}")
+
+
+if __name__ == "__main__":
+    main()
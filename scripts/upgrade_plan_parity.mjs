@@ -0,0 +1,66 @@
+// upgrade_plan_parity.mjs
+// ------------------------------------------------------------
+// upgrade_plan.py --parity 가 부르는 쪽.
+// js/building-calculator.js 를 브라우저 없이(vm) 올려서 normalizeBuildingRows / calcSegment 결과를 그대로 돌려준다.
+//
+// stdin : { calc_js, files: { slug: path }, plans: [{ building, from, to, build_speed, vp, server, chief, pet, agenes, valeria }] }
+// stdout: { rows: { slug: [[level, fc, refined, food, wood, coal, iron, hours], ...] }, results: [...] }
+// ------------------------------------------------------------
+import fs from "fs";
+import vm from "vm";
+
+const input = JSON.parse(fs.readFileSync(0, "utf-8"));
+
+const window = {};
+const ctx = vm.createContext({ window, console: { info() {}, log() {}, warn() {} } });
+vm.runInContext(fs.readFileSync(input.calc_js, "utf-8"), ctx, { filename: input.calc_js });
+const C = window.WOS_BUILDING_CALC;
+const COLS = C.CSV_COLS;
+
+// readGlobalState() 가 DOM 에서 읽는 것과 같은 모양의 가짜 요소
+const sel = (v) => ({ value: String(v ?? 0) });
+const btn = (on) => ({ getAttribute: () => (on ? "true" : "false") });
+const num = (v) => {
+  const s = String(v ?? "").trim();
+  if (!s) return 0;
+  const n = Number(s.replace(/,/g, ""));
+  return Number.isFinite(n) ? n : 0;
+};
+const clampInt = (v, min, max) => {
+  const n = parseInt(String(v ?? ""), 10);
+  if (!Number.isFinite(n)) return min;
+  return Math.max(min, Math.min(max, n));
+};
+
+const rows = {};
+const out = { rows: {}, results: [] };
+for (const [slug, file] of Object.entries(input.files)) {
+  rows[slug] = C.normalizeBuildingRows(JSON.parse(fs.readFileSync(file, "utf-8")));
+  out.rows[slug] = rows[slug].map((r) => [
+    r[COLS.level], r[COLS.fireCrystal], r[COLS.refined], r[COLS.food],
+    r[COLS.wood], r[COLS.coal], r[COLS.iron], r[COLS.convertHours],
+  ]);
+}
+
+for (const p of input.plans) {
+  const g = {
+    buildSpeedPct: num(p.build_speed),
+    hyenaPct: clampInt(p.pet || 0, 0, 5),
+    vpPct: C.getActiveVP(btn(Number(p.vp) === 10), btn(Number(p.vp) === 15)),
+    serverBuffActive: C.isPressed(btn(p.server)),
+    chiefOrderActive: C.isPressed(btn(p.chief)),
+    agenesFlatHours: C.getExpertFlatHours(sel(p.agenes)),
+    valeriaBonus: C.getValeriaBonus(sel(p.valeria)),
+  };
+  const r = C.calcSegment(rows[p.building], p.from, p.to, g);
+  out.results.push({
+    valid: r.valid,
+    hours: r.hours,
+    adjHours: r.adjHours,
+    score: r.score,
+    factor: r.factor,
+    sums: [r.sums.fireCrystal, r.sums.refined, r.sums.food, r.sums.wood, r.sums.coal, r.sums.iron],
+  });
+}
+
+process.stdout.write(JSON.stringify(out));
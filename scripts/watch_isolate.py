@@ -0,0 +1,427 @@
+# watch_isolate.py
+# ------------------------------------------------------------
+# ✅ isolate/buildings, isolate/heroes 를 감시하다가
+#    바뀐 HTML 에 딸린 결과물만 다시 만든다.
+#
+#   building_{slug}.html      -> download_building.localize(slug)        -> building_{slug}_local.html + assets/buildings/{slug}/img
+#   firecrystal_{slug}.html   -> download_building_firecrystal.localize  -> firecrystal_{slug}_local.html + .../firecrystal_img
+#   hero_isolate_{key}.html   -> heroes/download_images.localize         -> {key}_local.html + assets/heroes/...
+#   isolate/buildings/*.html  -> parse_buildings_html_to_json.build_one  -> {variant}/{slug}.json + index.json
+#   로컬화로 쓴 JSON          -> canonicalize_asset_paths.fix_json_files   -> 에셋 경로 "/assets/..." 확인/정규화
+#
+# 사용법:
+#   python scripts/watch_isolate.py
+#   python scripts/watch_isolate.py --no-localize      # 네트워크 없이 JSON 만
+#   python scripts/watch_isolate.py --poll             # inotify 대신 폴링
+#
+# - 리눅스에서는 inotify(ctypes), 안 되면 폴링으로 자동 전환
+# - 저장이 연달아 들어오면 debounce 후 한 번만 처리
+# - 워커 프로세스는 시작할 때 bs4/requests 를 미리 import 해 둠 (변경마다 인터프리터 기동 X)
+# ------------------------------------------------------------
+
+import os
+import re
+import sys
+import time
+import errno
+import ctypes
+import ctypes.util
+import select
+import struct
+import argparse
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))  # = scripts
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+from canonicalize_asset_paths import fix_json_files, reroot, report as report_assets  # noqa: E402
+
+BUILDINGS_DIR = os.path.join(ROOT_DIR, "isolate", "buildings")
+HEROES_DIR = os.path.join(ROOT_DIR, "isolate", "heroes")
+
+RE_BUILDING_RAW = re.compile(r"^(building|firecrystal)_(.+?)\.html$", re.I)
+RE_HERO_RAW = re.compile(r"^hero_isolate_(ssr|sr|r)_(?:(s\d+)_)?(.+?)\.html$", re.I)
+
+
+# =============================
+# 워커 (미리 띄워두는 프로세스)
+# =============================
+def _warm_worker() -> None:
+    # 무거운 import 는 여기서 한 번만
+    import bs4  # noqa: F401
+    import buildings.parse_buildings_html_to_json  # noqa: F401
+
+def _ping(barrier: Any) -> int:
+    # 모든 워커가 하나씩 잡을 때까지 대기 -> 한 워커가 no-op 을 몰아서 처리하지 못함
+    barrier.wait()
+    return os.getpid()
+
+def warm_pool(pool: ProcessPoolExecutor, workers: int, timeout: float = 60.0) -> int:
+    """
+    ProcessPoolExecutor 는 (3.9+) 작업이 들어올 때 워커를 띄운다
+    -> 시작할 때 워커마다 no-op 하나씩 보내고 기다려서 첫 변경 전에 initializer(import)까지 끝내 둔다
+    """
+    with multiprocessing.Manager() as manager:
+        barrier = manager.Barrier(workers, timeout=timeout)
+        futures = [pool.submit(_ping, barrier) for _ in range(workers)]
+        return len({f.result() for f in futures})
+
+def job_localize(kind: str, args: Tuple[str, ...], output_dir: Optional[str] = None,
+                 out_root: str = "") -> Dict[str, Any]:
+    """
+    로컬화 + JSON 추출을 한 번에 (건물은 output_dir 에 JSON, index 항목을 같이 돌려줌)
+    마지막에 방금 쓴 JSON 의 에셋 경로를 canonicalize_asset_paths 규칙으로 정규화 ("assets" 에 Scan 목록)
+    out_root 를 주면 _local.html / 이미지 / 기본 JSON 출력을 전부 그 아래에 쓴다 (작업 트리는 그대로)
+    """
+    from buildings import parse_buildings_html_to_json as pb
+
+    if kind == "building":
+        from buildings import download_building as mod
+    elif kind == "firecrystal":
+        from buildings import download_building_firecrystal as mod
+    else:
+        from heroes import download_images as mod
+
+    if kind == "hero":
+        # 영웅은 _local.html 만 (data/heroes 는 손으로 관리)
+        res = mod.localize(*args, out_root=out_root)
+        return {"html": res["html"], "entry": None, "assets": []}
+
+    json_out = output_dir or reroot(pb.default_output_dir(), out_root)
+    res = mod.localize(*args, json_out=json_out, out_root=out_root)
+
+    entry = res.get("entry")
+    json_path = pb.pjoin(json_out, entry["json"]) if entry else ""
+    return {"html": res["html"], "entry": entry, "assets": fix_json_files([json_path], root=out_root)}
+
+def job_parse(html_path: str, output_dir: str, write: bool) -> Dict[str, Any]:
+    from buildings.parse_buildings_html_to_json import build_one
+    return build_one(html_path, output_dir, write=write)
+
+
+# =============================
+# 의존성 맵 (소스 HTML -> 결과물)
+# =============================
+def local_sibling(path: str) -> str:
+    root, ext = os.path.splitext(path)
+    return f"{root}_local{ext}"
+
+def localize_target(path: str) -> Optional[Tuple[str, Tuple[str, ...], str]]:
+    """
+    원본 HTML 이면 (kind, localize 인자, 만들어질 _local.html) 를 돌려준다.
+    _local.html 이나 규칙에 안 맞는 파일은 None.
+    """
+    d = os.path.dirname(path)
+    fn = os.path.basename(path)
+    if fn.lower().endswith("_local.html"):
+        return None
+
+    if os.path.normcase(d) == os.path.normcase(BUILDINGS_DIR):
+        m = RE_BUILDING_RAW.match(fn)
+        if m:
+            return (m.group(1).lower(), (m.group(2),), local_sibling(path))
+
+    if os.path.normcase(d) == os.path.normcase(HEROES_DIR):
+        m = RE_HERO_RAW.match(fn)
+        if m:
+            grade, season, name = m.group(1).lower(), (m.group(2) or "").lower(), m.group(3)
+            key = "_".join(p for p in (grade, season, name) if p)
+            return ("hero", (grade, season, name), os.path.join(d, f"{key}_local.html"))
+
+    return None
+
+def parse_winner(path: str) -> bool:
+    """
+    run() 은 정렬 순서대로 같은 {variant}/{slug}.json 을 덮어쓰므로
+    _local.html 이 있으면 그쪽이 최종 JSON 이 된다. 같은 규칙을 그대로 따른다.
+    """
+    if path.lower().endswith("_local.html"):
+        return True
+    return not os.path.exists(local_sibling(path))
+
+
+# =============================
+# 변경 감지: inotify / 폴링
+# =============================
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+class InotifyWatcher:
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE | IN_MODIFY
+
+    def __init__(self, dirs: List[str]):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc 없음")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify 미지원")
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+
+        self.wd_to_dir: Dict[int, str] = {}
+        for d in dirs:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(d), self.MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch 실패: {d}")
+            self.wd_to_dir[wd] = d
+
+    def wait(self, timeout: float) -> Set[str]:
+        changed: Set[str] = set()
+        r, _, _ = select.select([self.fd], [], [], timeout)
+        if not r:
+            return changed
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except OSError as e:
+            if e.errno == errno.EAGAIN:
+                return changed
+            raise
+
+        i = 0
+        while i + _EVENT_HEADER.size <= len(buf):
+            wd, _mask, _cookie, name_len = _EVENT_HEADER.unpack_from(buf, i)
+            i += _EVENT_HEADER.size
+            name = buf[i:i + name_len].rstrip(b"\0")
+            i += name_len
+            d = self.wd_to_dir.get(wd)
+            if d and name:
+                changed.add(os.path.join(d, os.fsdecode(name)))
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+class PollingWatcher:
+    def __init__(self, dirs: List[str], interval: float = 0.25):
+        self.dirs = dirs
+        self.interval = interval
+        self.state = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        state: Dict[str, Tuple[int, int]] = {}
+        for d in self.dirs:
+            try:
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.is_file():
+                            st = e.stat()
+                            state[e.path] = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                continue
+        return state
+
+    def wait(self, timeout: float) -> Set[str]:
+        time.sleep(min(timeout, self.interval))
+        new = self._scan()
+        changed = {p for p, v in new.items() if self.state.get(p) != v}
+        changed |= set(self.state) - set(new)
+        self.state = new
+        return changed
+
+    def close(self) -> None:
+        pass
+
+def make_watcher(dirs: List[str], force_poll: bool):
+    if not force_poll:
+        try:
+            w = InotifyWatcher(dirs)
+            print("[WATCH] inotify")
+            return w
+        except (OSError, AttributeError) as e:
+            print(f"⚠ inotify 사용 불가 -> 폴링으로 전환 ({e})")
+    print("[WATCH] polling")
+    return PollingWatcher(dirs)
+
+
+# =============================
+# 재빌드 스케줄러
+# =============================
+class Rebuilder:
+    def __init__(self, pool: ProcessPoolExecutor, output_dir: str, localize: bool):
+        from buildings.parse_buildings_html_to_json import list_html_files
+
+        self.pool = pool
+        self.output_dir = output_dir
+        self.localize = localize
+        # 우리가 직접 쓴 파일 -> mtime (자기 자신이 만든 이벤트는 무시)
+        self.own_writes: Dict[str, int] = {}
+
+        # index.json 은 source_html 기준으로 정렬된 항목 (run() 과 같은 순서)
+        self.index: Dict[str, Dict[str, Any]] = {}
+        self._load_index(list_html_files(BUILDINGS_DIR))
+
+    def _load_index(self, files: List[str]) -> None:
+        import json
+        index_path = os.path.join(self.output_dir, "index.json")
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    for it in json.load(f).get("items", []):
+                        self.index[it["source_html"]] = it
+            except Exception as e:
+                print(f"⚠ index.json 읽기 실패 -> 전체 재빌드 ({e})")
+                self.index = {}
+
+        # index 에 없는 파일은 처음 한 번 빌드
+        missing = [p for p in files if os.path.basename(p) not in self.index]
+        if missing:
+            print(f"[INIT] index 에 없는 HTML {len(missing)}개 빌드")
+            self.rebuild(set(missing), localize=False)
+
+    def _is_own_write(self, path: str) -> bool:
+        mt = self.own_writes.get(path)
+        if mt is None:
+            return False
+        try:
+            return os.stat(path).st_mtime_ns == mt
+        except FileNotFoundError:
+            return False
+
+    def rebuild(self, changed: Set[str], localize: Optional[bool] = None) -> None:
+        if localize is None:
+            localize = self.localize
+        t0 = time.perf_counter()
+        changed = {p for p in changed if p.lower().endswith(".html") and not self._is_own_write(p)}
+        if not changed:
+            return
+
+        # 1) 원본 HTML -> 로컬화 (네트워크) + JSON 추출을 한 번의 파싱으로
+        #    _local.html 을 다시 읽어 파싱하지 않고, 원본의 index 항목도 같은 결과를 쓴다
+        to_parse: Set[str] = set()
+        localized: Set[str] = set()
+        index_dirty = False
+        if localize:
+            futs = []
+            for p in sorted(changed):
+                tgt = localize_target(p)
+                if tgt and os.path.exists(p):
+                    kind, args, out_html = tgt
+                    futs.append((p, out_html, self.pool.submit(job_localize, kind, args, self.output_dir)))
+            for p, out_html, fut in futs:
+                try:
+                    res = fut.result()
+                    self.own_writes[out_html] = os.stat(out_html).st_mtime_ns
+                    entry = res.get("entry")
+                    if entry:
+                        self.index[os.path.basename(out_html)] = entry
+                        self.index[os.path.basename(p)] = {**entry, "source_html": os.path.basename(p)}
+                        index_dirty = True
+                        print(f"[OK] {os.path.basename(out_html)} -> {entry['json']}")
+                    localized.add(p)
+                    print(f"[LOCAL] {os.path.basename(p)} -> {os.path.basename(out_html)}")
+                    report_assets(res.get("assets") or [])
+                except Exception:
+                    print(f"⚠ 로컬화 실패: {p}")
+                    traceback.print_exc()
+
+        # 2) 나머지 buildings 폴더 HTML -> JSON
+        for p in changed - localized:
+            if os.path.normcase(os.path.dirname(p)) == os.path.normcase(BUILDINGS_DIR):
+                to_parse.add(p)
+
+        removed = {p for p in to_parse if not os.path.exists(p)}
+        for p in removed:
+            self.index.pop(os.path.basename(p), None)
+            # _local.html 이 지워지면 원본이 다시 JSON 주인이 된다
+            if p.lower().endswith("_local.html"):
+                raw = p[: -len("_local.html")] + ".html"
+                if os.path.exists(raw):
+                    to_parse.add(raw)
+        to_parse -= removed
+
+        futs = []
+        for p in sorted(to_parse):
+            write = parse_winner(p)
+            futs.append((p, write, self.pool.submit(job_parse, p, self.output_dir, write)))
+        for p, write, fut in futs:
+            try:
+                entry = fut.result()
+                self.index[os.path.basename(p)] = entry
+                if write:
+                    print(f"[OK] {os.path.basename(p)} -> {entry['json']}")
+                else:
+                    print(f"[SKIP] {os.path.basename(p)} (같은 slug 의 _local.html 이 {entry['json']} 주인)")
+            except Exception:
+                print(f"⚠ 파싱 실패: {p}")
+                traceback.print_exc()
+
+        # 3) index.json
+        if to_parse or removed or index_dirty:
+            from buildings.parse_buildings_html_to_json import write_index
+            items = [self.index[k] for k in sorted(self.index)]
+            write_index(self.output_dir, items)
+
+        print(f"[DONE] {len(changed)}개 변경 처리 ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+
+
+# =============================
+# 메인 루프
+# =============================
+def main() -> None:
+    from buildings.parse_buildings_html_to_json import resolve_from_script_dir, pjoin
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--output",
+        default=pjoin("page", "data", "buildings"),
+        help="(scripts/buildings 기준) JSON 출력 폴더 (parse_buildings_html_to_json 과 동일)",
+    )
+    ap.add_argument("--debounce", type=float, default=0.15, help="마지막 변경 후 대기(초)")
+    ap.add_argument("--workers", type=int, default=max(2, min(4, os.cpu_count() or 2)), help="워커 프로세스 수")
+    ap.add_argument("--poll", action="store_true", help="inotify 대신 폴링")
+    ap.add_argument("--no-localize", action="store_true", help="이미지 로컬화(네트워크) 건너뛰고 JSON 만")
+    args = ap.parse_args()
+
+    output_dir = resolve_from_script_dir(args.output)
+    os.makedirs(output_dir, exist_ok=True)
+
+    dirs = [d for d in (BUILDINGS_DIR, HEROES_DIR) if os.path.isdir(d)]
+    watcher = make_watcher(dirs, args.poll)
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_warm_worker) as pool:
+        t0 = time.perf_counter()
+        warmed = warm_pool(pool, args.workers)
+        print(f"[WARM] 워커 {warmed}/{args.workers} 준비 ({(time.perf_counter() - t0) * 1000:.0f}ms)")
+
+        rebuilder = Rebuilder(pool, output_dir, localize=not args.no_localize)
+        print(f"[WATCH] {', '.join(dirs)} (Ctrl+C 종료)")
+
+        pending: Set[str] = set()
+        last_event = 0.0
+        try:
+            while True:
+                timeout = args.debounce if pending else 1.0
+                got = watcher.wait(timeout)
+                if got:
+                    pending |= got
+                    last_event = time.monotonic()
+                    continue
+                if pending and time.monotonic() - last_event >= args.debounce:
+                    batch, pending = pending, set()
+                    rebuilder.rebuild(batch)
+        except KeyboardInterrupt:
+            print("\n[STOP]")
+        finally:
+            watcher.close()
+
+
+if __name__ == "__main__":
+    main()
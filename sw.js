@@ -8,6 +8,8 @@
    - /data, /i18n : network-first (fresh)
    - /assets      : cache-first
    - /js, /css    : stale-while-revalidate
+   - data/changes.json (scripts/change_feed.py) 의 build 가 바뀌면
+     그 사이 바뀐 경로만 캐시에서 지움 (VERSION 안 올려도 됨)
    ========================================================= */
 
 "use strict";
@@ -19,6 +21,7 @@ const CACHE_HTML   = `${VERSION}:html`;
 const CACHE_ASSETS = `${VERSION}:assets`;
 const CACHE_DATA   = `${VERSION}:data`;
 const CACHE_CODE   = `${VERSION}:code`;
+const CACHE_META   = `${VERSION}:meta`;
 
 const SCOPE_URL = new URL(self.registration.scope); // e.g. https://host/repo/
 const SCOPE_ORIGIN = SCOPE_URL.origin;
@@ -166,6 +169,60 @@ async function getShellResponse() {
   }
 }
 
+// ---------------------------------------------------------
+// ✅ Change manifest (data/changes.json)
+//   - { build, history: [{ build, date, paths: ["/data/...", "/assets/..."] }, ...] } (최신이 앞)
+//   - 마지막으로 본 build 이후의 paths 만 캐시에서 삭제
+//   - 마지막 build 가 history 에 없으면(너무 오래됨) data/assets 캐시 통째로 비움
+// ---------------------------------------------------------
+const CHANGES_CHECK_MS = 5 * 60 * 1000;
+const CHANGES_SEEN_KEY = SCOPE_ORIGIN + SCOPE_PATH + "__changes_seen__";
+let changesCheckedAt = 0;
+
+function scopeUrlOf(sitePath) {
+  // "/data/x.json" -> "https://host/repo/data/x.json"
+  return SCOPE_ORIGIN + SCOPE_PATH + String(sitePath || "").replace(/^\/+/, "");
+}
+
+async function syncChangeManifest(force = false) {
+  const now = Date.now();
+  if (!force && now - changesCheckedAt < CHANGES_CHECK_MS) return;
+  changesCheckedAt = now;
+
+  try {
+    const res = await fetch(new Request(scopeUrlOf("/data/changes.json"), { cache: "no-store" }));
+    if (!res || !res.ok) return;
+    const manifest = await res.json();
+    const build = String(manifest?.build || "");
+    if (!build) return;
+
+    const meta = await caches.open(CACHE_META);
+    const seenRes = await meta.match(CHANGES_SEEN_KEY);
+    const seen = seenRes ? await seenRes.text() : "";
+
+    if (seen && seen !== build) {
+      const history = Array.isArray(manifest.history) ? manifest.history : [];
+      const idx = history.findIndex((h) => String(h?.build || "") === seen);
+
+      if (idx < 0) {
+        await caches.delete(CACHE_DATA);
+        await caches.delete(CACHE_ASSETS);
+      } else {
+        const urls = new Set();
+        for (const h of history.slice(0, idx)) {
+          for (const p of h?.paths || []) urls.add(scopeUrlOf(p));
+        }
+        for (const name of [CACHE_DATA, CACHE_ASSETS]) {
+          const cache = await caches.open(name);
+          for (const u of urls) await cache.delete(u, { ignoreSearch: true });
+        }
+      }
+    }
+
+    if (seen !== build) await meta.put(CHANGES_SEEN_KEY, new Response(build));
+  } catch (_) {}
+}
+
 // ---------------------------------------------------------
 // Install / Activate
 // ---------------------------------------------------------
@@ -193,6 +250,7 @@ self.addEventListener("activate", (event) => {
         .map((k) => caches.delete(k))
     );
 
+    await syncChangeManifest(true);
     await self.clients.claim();
   })());
 });
@@ -221,6 +279,7 @@ self.addEventListener("fetch", (event) => {
 
   // ---- 1) Navigation: network-first, fallback to shell
   if (isNavigation(req)) {
+    event.waitUntil(syncChangeManifest());
     event.respondWith((async () => {
       try {
         const res = await fetch(req);
@@ -0,0 +1,17 @@
+# tests/conftest.py
+# ------------------------------------------------------------
+# ✅ scripts/ 모듈을 그대로 import 하도록 경로만 잡아준다
+#
+# 사용법:
+#   python -m pytest -q
+# ------------------------------------------------------------
+
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SCRIPTS_DIR = os.path.join(ROOT_DIR, "scripts")
+
+for p in (SCRIPTS_DIR, os.path.join(SCRIPTS_DIR, "buildings"), ROOT_DIR):
+    if p not in sys.path:
+        sys.path.insert(0, p)
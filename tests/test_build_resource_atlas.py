@@ -0,0 +1,60 @@
+# tests/test_build_resource_atlas.py
+# ------------------------------------------------------------
+# ✅ build_resource_atlas: --strip-building-icons 는 assets.resourceIcons 블록만 잘라내고 서식은 그대로
+# ------------------------------------------------------------
+
+import json
+
+import build_resource_atlas as bra
+
+BUILDING = """{
+  "slug": "furnace",
+  "meta": {"title": "Furnace {x} - \\"wiki\\""},
+
+  "assets": {
+  "mainImage": "/assets/buildings/furnace/furnace.png",
+  "resourceIcons": {
+    "food": "/assets/buildings/furnace/item_icon_10001_1.png",
+
+"res_103": "/assets/buildings/furnace/item_icon_103.png"
+  }
+},
+
+  "base": {"rows": [ {"level": "1"} ]}
+}
+"""
+
+
+def test_remove_last_member_keeps_formatting():
+    out = bra.remove_json_member(BUILDING, ("assets", "resourceIcons"))
+    assert out == BUILDING.replace(
+        """.png",
+  "resourceIcons": {
+    "food": "/assets/buildings/furnace/item_icon_10001_1.png",
+
+"res_103": "/assets/buildings/furnace/item_icon_103.png"
+  }
+},""",
+        """.png"
+},""")
+    assert "resourceIcons" not in json.loads(out)["assets"]
+
+
+def test_remove_middle_member_drops_its_lines():
+    out = bra.remove_json_member(BUILDING, ("meta",))
+    assert out == BUILDING.replace('  "meta": {"title": "Furnace {x} - \\"wiki\\""},\n', "")
+    assert bra.remove_json_member(BUILDING, ("assets", "missing")) is None
+
+
+def test_strip_building_icons(tmp_path, monkeypatch):
+    d = tmp_path / "data" / "buildings"
+    d.mkdir(parents=True)
+    (d / "furnace.json").write_text(BUILDING, encoding="utf-8")
+    (d / "index.json").write_text('{"assets": {"resourceIcons": {}}}', encoding="utf-8")
+    monkeypatch.setattr(bra, "ROOT_DIR", str(tmp_path))
+
+    assert bra.strip_building_icons() == 1
+    text = (d / "furnace.json").read_text(encoding="utf-8")
+    assert text == bra.remove_json_member(BUILDING, ("assets", "resourceIcons"))
+    # 두 번째 실행은 할 일 없음
+    assert bra.strip_building_icons() == 0
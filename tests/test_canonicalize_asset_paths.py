@@ -0,0 +1,48 @@
+# tests/test_canonicalize_asset_paths.py
+# ------------------------------------------------------------
+# ✅ canonicalize_asset_paths: emitter 가 쓰는 site_path() 와 파이프라인용 fix_json_files()
+# ------------------------------------------------------------
+
+import os
+
+import canonicalize_asset_paths as cap
+
+ICON = "assets/resources/item_icon_103.png"  # 저장소에 실제로 있는 파일
+
+HERO_JSON = """{
+  "slug": "gatot",
+  "skills": {
+    "exploration": [
+      {"icon": "../../%s", "name": "Shield"},
+      {"icon": "/assets/nope/missing.png", "name": "Taunt"}
+    ]
+  }
+}
+""" % ICON
+
+
+def test_site_path_is_canonical():
+    p = os.path.join(cap.ROOT_DIR, *ICON.split("/"))
+    assert cap.site_path(p) == "/" + ICON
+    assert cap.site_path(p, "wos-hub") == "/wos-hub/" + ICON
+    assert cap.canonical(cap.site_path(p), "") == ("/" + ICON, ICON)
+
+
+def test_fix_json_files_rewrites_in_place(tmp_path, capsys):
+    p = tmp_path / "ssr_s8_gatot.json"
+    p.write_text(HERO_JSON, encoding="utf-8")
+
+    scans = cap.fix_json_files([str(p), str(tmp_path / "absent.json"), ""])
+    assert len(scans) == 1
+    assert scans[0].changed == 1
+    assert scans[0].dangling == ["/assets/nope/missing.png"]
+    # 그 문자열만 바뀌고 나머지 서식은 그대로
+    assert p.read_text(encoding="utf-8") == HERO_JSON.replace("../../" + ICON, "/" + ICON)
+
+    cap.report(scans)
+    out = capsys.readouterr().out
+    assert "경로 1개 정규화" in out
+    assert "missing.png" in out
+
+    # 두 번째는 바꿀 게 없음
+    assert cap.fix_json_files([str(p)])[0].changed == 0
@@ -0,0 +1,213 @@
+# tests/test_change_feed.py
+# ------------------------------------------------------------
+# ✅ change_feed: 에셋 경로 표기(../assets -> /assets)만 바뀐 영웅은 피드/캐시 무효화에 안 잡힘
+# ------------------------------------------------------------
+
+import copy
+import json
+import os
+
+import pytest
+
+import change_feed
+
+HERO = {
+    "slug": "gatot",
+    "name": "Gatot",
+    "rarity": "SSR",
+    "season": 8,
+    "image": "../assets/heroes/ssr/s8/gatot/img/gatot.png",
+    "stats": {"attack": 100, "defense": 120},
+    "skills": [
+        {"id": "g1", "name": "Shield", "description": "Blocks 10% damage", "mode": "exploration",
+         "icon": "../assets/heroes/ssr/s8/gatot/skills/g1.png"},
+        {"id": "g2", "name": "Taunt", "description": "Draws fire", "mode": "expedition",
+         "icon": "../assets/heroes/ssr/s8/gatot/skills/g2.png"},
+    ],
+}
+
+
+def canonical_paths(hero):
+    h = copy.deepcopy(hero)
+    h["image"] = h["image"].replace("../assets/", "/assets/")
+    for s in h["skills"]:
+        s["icon"] = s["icon"].replace("../assets/", "/assets/")
+    return h
+
+
+def write(root, rel, obj):
+    p = os.path.join(root, rel)
+    os.makedirs(os.path.dirname(p), exist_ok=True)
+    with open(p, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+
+
+def test_diff_hero_ignores_icon_paths():
+    assert change_feed.diff_hero(HERO, canonical_paths(HERO))["reasons"] == []
+
+    changed = canonical_paths(HERO)
+    changed["skills"][0]["description"] = "Blocks 15% damage"
+    d = change_feed.diff_hero(HERO, changed)
+    assert d["reasons"] == ["skills_changed"]
+    assert d["skills_changed"] == ["g1"]
+
+
+@pytest.fixture
+def builds(tmp_path, monkeypatch):
+    """이전 빌드 폴더 + 작업 트리(ROOT_DIR) 를 tmp 에 만든다"""
+    prev, cur = str(tmp_path / "prev"), str(tmp_path / "cur")
+    os.makedirs(os.path.join(prev, "data"))
+    os.makedirs(os.path.join(cur, "data"))
+    monkeypatch.setattr(change_feed, "ROOT_DIR", cur)
+    return prev, cur
+
+
+def test_icon_path_only_change_has_no_feed_entry(builds):
+    prev, cur = builds
+    rel = "data/heroes/ssr/gatot.json"
+    write(prev, rel, HERO)
+    write(cur, rel, canonical_paths(HERO))
+
+    changes, invalidate, entries, log = change_feed.collect(
+        change_feed.PrevBuild(prev), change_feed.Names(), "2026-01-01")
+
+    assert changes == {rel: "M"}   # 배포는 됨
+    assert invalidate == []
+    assert entries == []
+    assert any("에셋 경로 표기만" in line for line in log)
+
+
+def test_real_skill_change_still_in_feed(builds):
+    prev, cur = builds
+    rel = "data/heroes/ssr/gatot.json"
+    new = canonical_paths(HERO)
+    new["skills"][1]["description"] = "Draws fire for 2 turns"
+    write(prev, rel, HERO)
+    write(cur, rel, new)
+
+    _changes, invalidate, entries, _log = change_feed.collect(
+        change_feed.PrevBuild(prev), change_feed.Names(), "2026-01-01")
+
+    assert invalidate == ["/" + rel]
+    assert [e["href"] for e in entries] == ["/heroes/gatot"]
+
+
+# =============================
+# 건물 / 영웅 구조 비교
+# =============================
+def level_row(key, wood=100, seconds=60):
+    return {"level": key, "levelInfo": {"key": key}, "costs": {"res_103": wood}, "time": {"seconds": seconds}}
+
+
+BUILDING = {
+    "slug": "furnace",
+    "meta": {"title": "Furnace - Whiteout Survival Wiki"},
+    "base": {"rows": [level_row("1"), level_row("2"), level_row("3")]},
+    "firecrystal": {"rows": [level_row("FC1", 500, 3600)]},
+}
+
+
+def test_diff_building_levels_and_costs():
+    new = copy.deepcopy(BUILDING)
+    new["base"]["rows"] = [level_row("1"), level_row("2", wood=150), level_row("4")]
+    new["firecrystal"]["rows"].append(level_row("FC2", 800, 7200))
+    new["firecrystal"]["rows"][0]["time"]["seconds"] = 3000
+
+    d = change_feed.diff_building(BUILDING, new)
+    assert d["reasons"] == ["levels_added", "levels_removed", "costs_changed"]
+    assert d["levels_added"] == ["4", "FC2"]
+    assert d["levels_removed"] == ["3"]
+    assert d["costs_changed"] == ["2", "FC1"]
+
+    # 같은 키라도 단계(base / firecrystal)가 다르면 다른 레벨
+    moved = copy.deepcopy(BUILDING)
+    moved["firecrystal"]["rows"].append(level_row("1"))
+    assert change_feed.diff_building(BUILDING, moved)["levels_added"] == ["1"]
+    assert change_feed.diff_building(BUILDING, copy.deepcopy(BUILDING))["reasons"] == []
+
+
+def test_diff_hero_skills_and_stats():
+    new = copy.deepcopy(HERO)
+    new["skills"].append({"id": "g3", "name": "Bulwark", "description": "New", "mode": "expedition"})
+    new["skills"][1]["mode"] = "exploration"
+    new["stats"]["attack"] = 110
+
+    d = change_feed.diff_hero(HERO, new)
+    assert d["reasons"] == ["skills_added", "skills_changed", "stats_changed"]
+    assert d["skills_added"] == ["g3"]
+    assert d["skills_changed"] == ["g2"]
+
+    # 스킬 삭제만으로는 항목 안 만듦 (추가/변경/스탯만)
+    fewer = copy.deepcopy(HERO)
+    fewer["skills"].pop()
+    assert change_feed.diff_hero(HERO, fewer)["reasons"] == []
+
+
+def test_entity_of():
+    assert change_feed.entity_of("data/buildings/furnace.json") == ("buildings", "furnace")
+    assert change_feed.entity_of("data/heroes/ssr/gatot.json") == ("heroes", "gatot")
+    assert change_feed.entity_of("data/heroes/index.json") is None
+    assert change_feed.entity_of("data/buildings/firecrystal/furnace.json") is None
+    assert change_feed.entity_of("assets/heroes/ssr/s8/gatot/img/gatot.png") is None
+
+
+# =============================
+# latest.json / changes.json
+# =============================
+def entry(href, date, en="x"):
+    return {"category": {}, "title": {"en": en}, "href": href, "date": date}
+
+
+def test_merge_latest_prepends_and_dedups():
+    latest = {"version": 2, "items": [entry("/heroes/gatot", "2026-01-01", "old"), entry("/buildings/furnace", "2025-12-01")]}
+    new = [entry("/heroes/gatot", "2026-01-01", "new"), entry("/heroes/cara", "2026-01-01")]
+
+    out = change_feed.merge_latest(latest, new, keep=0)
+    assert out["version"] == 2   # 다른 키는 그대로
+    assert [(e["href"], e["title"]["en"]) for e in out["items"]] == [
+        ("/heroes/gatot", "new"), ("/heroes/cara", "x"), ("/buildings/furnace", "x")]
+    # 다시 돌려도 안 쌓임
+    assert change_feed.merge_latest(out, new, keep=0) == out
+    assert len(change_feed.merge_latest(latest, new, keep=2)["items"]) == 2
+    assert change_feed.merge_latest(None, new, keep=5)["items"] == new
+
+
+def test_merge_manifest_history():
+    m = change_feed.merge_manifest(None, "b1", "2026-01-01", ["/data/a.json"])
+    assert m == {"build": "b1", "history": [{"build": "b1", "date": "2026-01-01", "paths": ["/data/a.json"]}]}
+
+    m = change_feed.merge_manifest(m, "b2", "2026-01-02", ["/data/b.json"])
+    assert m["build"] == "b2"
+    assert [h["build"] for h in m["history"]] == ["b2", "b1"]
+
+    # 같은 build 로 다시 돌리면 교체 (중복 X)
+    again = change_feed.merge_manifest(m, "b2", "2026-01-02", ["/data/b.json"])
+    assert again == m
+
+    for i in range(change_feed.HISTORY_KEEP + 5):
+        m = change_feed.merge_manifest(m, f"x{i}", "2026-01-03", [])
+    assert len(m["history"]) == change_feed.HISTORY_KEEP
+
+
+def test_collect_building_feed_and_invalidate(builds):
+    prev, cur = builds
+    rel = "data/buildings/furnace.json"
+    new = copy.deepcopy(BUILDING)
+    new["base"]["rows"].append(level_row("4"))
+    write(prev, rel, BUILDING)
+    write(cur, rel, new)
+    write(cur, "data/heroes/ssr/cara.json", {"slug": "cara", "name": "Cara"})
+    # 포맷만 바뀐 파일은 아예 빠짐
+    write(prev, "data/heroes/index.json", {"items": []})
+    with open(os.path.join(cur, "data/heroes/index.json"), "w", encoding="utf-8") as f:
+        f.write('{"items":[]}')
+
+    changes, invalidate, entries, _log = change_feed.collect(
+        change_feed.PrevBuild(prev), change_feed.Names(), "2026-01-01")
+
+    assert changes == {rel: "M", "data/heroes/ssr/cara.json": "A"}
+    assert invalidate == ["/" + rel, "/data/heroes/ssr/cara.json"]
+    assert [(e["href"], e["title"]["en"]) for e in entries] == [
+        ("/buildings/furnace", "Furnace Updated (Levels Added)"),
+        ("/heroes/cara", "New Hero Added: Cara"),
+    ]
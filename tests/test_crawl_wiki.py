@@ -0,0 +1,105 @@
+# tests/test_crawl_wiki.py
+# ------------------------------------------------------------
+# ✅ crawl_wiki: 영웅 season 추론 + 로컬 미러 서버(serve_site)에 대고 실제로 크롤링
+# ------------------------------------------------------------
+
+import json
+import os
+import threading
+
+import pytest
+
+import crawl_wiki
+from serve_site import SiteConfig, make_server
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def hero_data(tmp_path):
+    d = tmp_path / "data" / "heroes"
+    # season 이 null 인 SSR -> 이미지 경로에서 s14
+    write(str(d / "ssr" / "cara.json"), json.dumps({
+        "slug": "cara", "rarity": "SSR", "season": None,
+        "image": "/assets/heroes/ssr/s14/cara/img/cara.png",
+    }))
+    write(str(d / "ssr" / "gatot.json"), json.dumps({"slug": "gatot", "rarity": "SSR", "season": 8}))
+    # 이미지도 없는 SSR -> 기존 isolate 파일명에서
+    write(str(d / "ssr" / "hank.json"), json.dumps({"slug": "hank", "rarity": "SSR", "season": None}))
+    write(str(d / "sr" / "gina.json"), json.dumps({"slug": "gina", "rarity": "SR"}))
+    write(str(tmp_path / "isolate" / "heroes" / "ssr_s13_hank_local.html"), "<html></html>")
+    return str(d), str(tmp_path / "isolate")
+
+
+def test_load_hero_meta_fills_null_season(hero_data):
+    data_dir, isolate_dir = hero_data
+    meta = crawl_wiki.load_hero_meta(data_dir, isolate_dir)
+    assert meta["cara"] == ("ssr", "s14")
+    assert meta["gatot"] == ("ssr", "s8")
+    assert meta["hank"] == ("ssr", "s13")
+    assert meta["gina"] == ("sr", "")
+    assert crawl_wiki.url_to_target("https://x/heroes/cara/", meta) == "heroes/hero_isolate_ssr_s14_cara.html"
+
+
+def test_repo_heroes_all_have_season():
+    meta = crawl_wiki.load_hero_meta()
+    assert [slug for slug, (grade, season) in meta.items() if grade == "ssr" and not season] == []
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    """위키처럼 /heroes/{slug}/, /buildings/{slug}/ 를 내주는 로컬 미러"""
+    root = tmp_path / "mirror"
+    write(str(root / "robots.txt"), "User-agent: *\nDisallow: /private/\n")
+    write(str(root / "heroes" / "cara" / "index.html"), "<html><body><h1>Cara</h1></body></html>")
+    write(str(root / "buildings" / "furnace" / "index.html"), "<html><body><h1>Furnace</h1></body></html>")
+    write(str(root / "buildings" / "fire-crystal-furnace" / "index.html"), "<html><body>FC</body></html>")
+    write(str(root / "private" / "index.html"), "<html></html>")
+
+    httpd = make_server(SiteConfig(str(root), quiet=True), "127.0.0.1", 0)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_crawl_against_local_mirror(mirror, hero_data, tmp_path):
+    data_dir, _ = hero_data
+    isolate_dir = str(tmp_path / "out")
+    meta = crawl_wiki.load_hero_meta(data_dir, isolate_dir)
+
+    frontier = crawl_wiki.Frontier(os.path.join(isolate_dir, ".crawl_frontier.json"))
+    urls = [
+        f"{mirror}/heroes/cara/",
+        f"{mirror}/buildings/furnace/",
+        f"{mirror}/buildings/fire-crystal-furnace/",
+        f"{mirror}/buildings/missing/",  # 404 -> 재시도 후 failed
+    ]
+    for u in urls:
+        frontier.add(u, crawl_wiki.url_to_target(u, meta))
+
+    crawler = crawl_wiki.Crawler(frontier, isolate_dir, delay=0.0, concurrency=2,
+                                 localize=False, queue_size=2, respect_robots=True)
+    crawler.run()
+
+    for rel, text in (
+        ("heroes/hero_isolate_ssr_s14_cara.html", "Cara"),
+        ("buildings/building_furnace.html", "Furnace"),
+        ("buildings/firecrystal_furnace.html", "FC"),
+    ):
+        with open(os.path.join(isolate_dir, rel), encoding="utf-8") as f:
+            assert text in f.read()
+
+    items = frontier.items
+    assert items[f"{mirror}/heroes/cara/"]["status"] == "done"
+    missing = items[f"{mirror}/buildings/missing/"]
+    assert missing["status"] == "failed" and missing["attempts"] == crawl_wiki.MAX_ATTEMPTS
+    # frontier 는 디스크에 남아서 --resume 가능
+    assert crawl_wiki.Frontier(frontier.path).items.keys() == items.keys()
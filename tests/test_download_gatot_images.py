@@ -0,0 +1,131 @@
+# tests/test_download_gatot_images.py
+# ------------------------------------------------------------
+# ✅ download_gatot_images: 페이지 소켓은 다운로드와 따로 읽히고, 중간에 끊겨도 부분 결과로 끝남
+# ------------------------------------------------------------
+
+import argparse
+import io
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import download_gatot_images as dgi
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"0" * 64
+N_IMAGES = 40
+FILLER = "<p>" + "x" * 3000 + "</p>"  # 페이지 ~120KB -> 64KB 조각 여러 개
+
+
+def page_html(n):
+    return "<html><body>" + "".join(
+        f'<img src="/img/gatot_{i}.png">{FILLER}' for i in range(n)
+    ) + "</body></html>"
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    truncate = False
+    page_done = None  # threading.Event
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/img/"):
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(PNG)))
+            self.end_headers()
+            self.wfile.write(PNG)
+            return
+
+        body = page_html(N_IMAGES).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        # 끊기는 경우: 길이는 전체라고 해놓고 70% 만 보내고 닫음
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.truncate:
+            self.wfile.write(body[: len(body) * 7 // 10])
+            self.wfile.flush()
+            self.close_connection = True
+        else:
+            self.wfile.write(body)
+        self.page_done.set()
+
+
+@pytest.fixture
+def server(request):
+    truncate = getattr(request, "param", False)
+    done = threading.Event()
+    handler = type("H", (Handler,), {"truncate": truncate, "page_done": done})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", done
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def make_args(url, out, sleep=0.0):
+    return argparse.Namespace(url=url + "/heroes/gatot/", out=str(out), filter="gatot", no_filter=False,
+                              include_icons=False, min_width=0, sleep=sleep)
+
+
+def test_page_is_drained_while_downloading(server, tmp_path, monkeypatch):
+    url, page_done = server
+    seen_done_at_first_download = []
+    real = dgi.download_file
+
+    def slow_download(session, u, out_dir, idx):
+        if idx == 1:
+            # 첫 다운로드가 느려도 페이지는 백그라운드에서 끝까지 읽힘
+            seen_done_at_first_download.append(page_done.wait(5))
+        return real(session, u, out_dir, idx)
+
+    monkeypatch.setattr(dgi, "download_file", slow_download)
+    dgi.run(make_args(url, tmp_path))
+
+    assert seen_done_at_first_download == [True]
+    assert len(os.listdir(tmp_path)) == N_IMAGES
+
+
+@pytest.mark.parametrize("server", [True], indirect=True)
+def test_truncated_page_reports_partial(server, tmp_path, capsys):
+    url, _ = server
+    with pytest.raises(SystemExit) as ex:
+        dgi.run(make_args(url, tmp_path))
+    assert ex.value.code == 2
+
+    out = capsys.readouterr().out
+    assert "[PARTIAL]" in out
+    saved = len(os.listdir(tmp_path))
+    assert 0 < saved < N_IMAGES
+
+
+def raw_response(body, content_type=None):
+    res = requests.Response()
+    res.status_code = 200
+    res.raw = io.BytesIO(body)
+    if content_type:
+        res.headers["Content-Type"] = content_type
+    return res
+
+
+def test_text_without_charset_uses_apparent_encoding():
+    body = ("<html><body><p>" + "Größe café naïve déjà vu " * 40 + "</p></body></html>").encode("cp1252")
+    assert raw_response(body).encoding is None
+
+    text = "".join(dgi.iter_response_text(raw_response(body), chunk_size=256))
+    expected = raw_response(body)
+    assert text == body.decode(expected.apparent_encoding)
+    assert "Größe café" in text
+
+    # 헤더 charset 이 있으면 그대로
+    utf8 = "영웅 가토".encode("utf-8")
+    assert "".join(dgi.iter_response_text(raw_response(utf8, "text/html; charset=utf-8"))) == "영웅 가토"
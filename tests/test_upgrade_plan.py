@@ -0,0 +1,27 @@
+# tests/test_upgrade_plan.py
+# ------------------------------------------------------------
+# ✅ upgrade_plan: NumPy 계산이 js/building-calculator.js 와 완전히 같은지 (node 로 JS 실행)
+# ------------------------------------------------------------
+
+import shutil
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import upgrade_plan as up  # noqa: E402
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node 없음")
+def test_parity_with_js():
+    assert up.run_parity(up.DATA_DIR, n=500, seed=0) == 0
+
+
+def test_vp_only_js_values():
+    eng = up.PlanEngine.from_dir(up.DATA_DIR)
+    slug = next(s for s in eng.slugs if len(eng.rows[s]) > 1)
+    for vp in up.VP_CHOICES:
+        res = eng.evaluate([slug], [0], [1], vp=vp, by_index=True)
+        assert res["factor"][0] == pytest.approx(1 + vp / 100)
+    with pytest.raises(ValueError):
+        eng.evaluate([slug], [0], [1], vp=12, by_index=True)